@@ -9,6 +9,11 @@ Copyright (C) 2010, Luke Kenneth Casson Leighton <lkcl@lkcl.net>"""
 __url__ = 'http://github.com/lkcl/hl7'
 
 from hl7 import *
+from projection import *
+from peek import *
+from hl7pack import dumps, loads
+from obxarray import obx_arrays
+from hl7json import to_dict, write_jsonl
 import segments21
 import segments22
 import segments23
@@ -23,3 +28,12 @@ segment_revs = {'2.1': segments21,
                     '2.5': segments25,
                    }
 
+from encapsulated import iter_encapsulated
+from mllp import MLLPServer, MLLPClient, FrameScanner, frame
+from ack import make_ack
+from journal import Journal
+from router import Router
+from filters import Filter
+from rewrite import Rewriter
+from pipeline import Pipeline, Stage
+from partition import Dispatcher, partition_key
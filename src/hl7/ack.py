@@ -0,0 +1,122 @@
+"""Acknowledgements straight from the raw message.
+
+:func:`make_ack` reads MSH-3 to MSH-12 out of the first segment of the
+raw message (nothing past it is looked at, let alone parsed) and fills
+them into a preformatted ACK, with sender and receiver swapped, so the
+acknowledgement can go out before the message is processed.
+
+>>> raw = ('MSH|^~\\\\&|GHH LAB|ELAB-3|GHH OE|BLDG4|200202150930||'
+...        'ORU^R01|CNTRL-3456|P|2.4\\rPID|||555-44-4444')
+>>> print make_ack(raw, control_id='A1', timestamp='20020215093100').replace('\\r', '\\n')
+MSH|^~\\&|GHH OE|BLDG4|GHH LAB|ELAB-3|20020215093100||ACK^R01^ACK|A1|P|2.4
+MSA|AA|CNTRL-3456
+>>> print make_ack(raw, 'AE', 'bad PID|3', control_id='A2',
+...                timestamp='20020215093100').replace('\\r', '\\n')
+MSH|^~\\&|GHH OE|BLDG4|GHH LAB|ELAB-3|20020215093100||ACK^R01^ACK|A2|P|2.4
+MSA|AE|CNTRL-3456|bad PID\\F\\3
+ERR|^^^207&bad PID\\F\\3
+"""
+
+import itertools
+import time
+
+from peek import line_end
+from segments import resolve_version
+
+__all__ = ['make_ack', 'escape']
+
+## the acknowledgement codes that report an error, and so get an ERR
+_ERRORS = frozenset(['AE', 'AR', 'CE', 'CR'])
+
+## HL7 error code for "application internal error"
+_APPLICATION_ERROR = '207'
+
+## the revisions before MSH-9.3 (message structure) and ERR-3
+_OLD = frozenset(['2.1', '2.2', '2.3'])
+_ERR_ELD = frozenset(['2.1', '2.2', '2.3', '2.31', '2.4'])
+
+## templates, by (field separator, encoding characters, revision)
+_templates = {}
+
+def _template(fs, enc, version):
+    key = (fs, enc, version)
+    t = _templates.get(key)
+    if t is not None:
+        return t
+    cs = enc[:1] or '^'
+    scs = enc[3:4] or '&'
+    msh = fs.join(['MSH', enc.replace('%', '%%'), '%s', '%s', '%s', '%s',
+                   '%s', '', 'ACK' + cs + '%s' +
+                   (version not in _OLD and cs + 'ACK' or ''),
+                   '%s', '%s', '%s'])
+    msa = fs.join(['MSA', '%s', '%s'])
+    if version in _ERR_ELD:
+        ## ERR-1: segment^sequence^field^code&text
+        err = fs.join(['ERR', cs * 3 + '%s' + scs + '%s'])
+    else:
+        ## ERR-3: error code^text, ERR-4: severity
+        err = fs.join(['ERR', '', '', '%s' + cs + '%s' + cs + 'HL70357',
+                       'E'])
+    t = (msh + '\r' + msa, msh + '\r' + msa + fs + '%s',
+         msh + '\r' + msa + fs + '%s\r' + err)
+    _templates[key] = t
+    return t
+
+def escape(text, fs='|', enc='^~\\&'):
+    """*text* with the separators escaped, for use as a field value."""
+    esc = enc[2:3] or '\\'
+    text = text.replace(esc, esc + 'E' + esc)
+    for (c, code) in zip(fs + enc[:2] + enc[3:4], 'FSRT'):
+        text = text.replace(c, esc + code + esc)
+    return text
+
+_ids = itertools.count(1)
+
+def make_ack(text, code='AA', error=None, error_code=None, control_id=None,
+             timestamp=None):
+    """Returns the acknowledgement of the raw message *text*, segments
+    terminated by carriage returns.  *code* goes into MSA-1 and the
+    text *error* into MSA-3; for the error codes (AE, AR, CE, CR) an
+    ERR segment with *error_code* (207, application internal error,
+    by default) follows.  The ACK's own MSH-10 is *control_id*, by
+    default made from the time and a counter, and MSH-7 *timestamp*,
+    by default the current time.
+    """
+    start = 0
+    if not text.startswith('MSH'):
+        start = text.find('MSH')
+        if start < 0:
+            raise ValueError, "no MSH segment found"
+    end = line_end(text, start)
+    fs = text[start+3:start+4]
+    if not fs:
+        raise ValueError, "truncated MSH segment"
+    ## MSH, MSH-2 ... MSH-12, the rest
+    fields = text[start:end].split(fs, 12)
+    fields.extend([''] * (12 - len(fields)))
+    enc = fields[1]
+    cs = enc[:1]
+    message_type = fields[8]
+    trigger = ''
+    version = fields[11]
+    if cs:
+        if cs in message_type:
+            trigger = message_type.split(cs)[1]
+        if cs in version:
+            version = version.split(cs)[0]
+    if timestamp is None:
+        timestamp = time.strftime('%Y%m%d%H%M%S')
+    if control_id is None:
+        control_id = '%s%d' % (timestamp, _ids.next())
+    (plain, with_text, with_err) = _template(fs, enc,
+                                             resolve_version(version))
+    ## sending and receiving application and facility swapped
+    args = (fields[4], fields[5], fields[2], fields[3], timestamp, trigger,
+            control_id, fields[10], fields[11], code, fields[9])
+    if error is None and code not in _ERRORS:
+        return plain % args
+    error = escape(error or '', fs, enc)
+    if code not in _ERRORS:
+        return with_text % (args + (error,))
+    return with_err % (args + (error, error_code or _APPLICATION_ERROR,
+                               error))
@@ -0,0 +1,98 @@
+"""Encapsulated data (ED) straight from raw messages.
+
+OBX-5 values of type ED can carry whole documents, base64 encoded.
+:func:`iter_encapsulated` finds them in a buffer of raw messages (a
+str, a bytearray or an mmap of a file) without parsing or copying the
+messages: each comes back as an :cls:`hl7.Encapsulated` holding offsets
+into the buffer, whose data is decoded a chunk at a time into a sink.
+
+>>> import StringIO
+>>> raw = ('MSH|^~\\\\&|LAB||||||ORU^R01|CTRL1|P|2.4\\r'
+...        'OBX|1|ED|PDF^Report||LAB^AP^PDF^Base64^SGVsbG8sIHdvcmxkIQ==\\r')
+>>> [(ctrl, code, ed)] = list(iter_encapsulated(raw))
+>>> ctrl, code, ed.data_subtype, ed.encoding, len(ed)
+('CTRL1', 'PDF', 'PDF', 'Base64', 20)
+>>> out = StringIO.StringIO()
+>>> ed.decode_to(out), out.getvalue()
+(13, 'Hello, world!')
+"""
+
+from hl7trans import Encapsulated
+from projection import segment_terminator
+
+__all__ = ['Encapsulated', 'iter_encapsulated']
+
+## MSH-10 is the ninth field after the segment id, MSH-1 being the
+## separator itself
+_CONTROL_ID = 9
+
+def _fields(buf, start, end, fs, count):
+    """(start, stop) offsets of the first *count* fields after the
+    segment id of the segment at *start*, fewer if it is shorter."""
+    bounds = []
+    pos = start + 3
+    while len(bounds) < count and pos < end:
+        stop = buf.find(fs, pos + 1, end)
+        if stop < 0:
+            stop = end
+        bounds.append((pos + 1, stop))
+        pos = stop
+    return bounds
+
+def _first_component(buf, start, stop, cs):
+    cstop = buf.find(cs, start, stop)
+    if cstop < 0:
+        cstop = stop
+    return str(buf[start:cstop])
+
+def _encapsulated(buf, start, stop, cs):
+    """The ED value in characters *start* to *stop* of *buf*."""
+    comps = []
+    for i in xrange(4):
+        cstop = buf.find(cs, start, stop)
+        if cstop < 0:
+            break
+        comps.append(str(buf[start:cstop]) or None)
+        start = cstop + 1
+    if len(comps) < 4:
+        ## not the full composite: take the value as the data
+        comps = [None] * 4
+    return Encapsulated(buf, start, stop, *comps)
+
+def iter_encapsulated(buf):
+    """Yields ``(message_control_id, observation_identifier, value)``
+    for each OBX of value type ED in the raw messages in *buf*, where
+    *value* is an :cls:`hl7.Encapsulated` into *buf* itself.  Only the
+    short fields read are copied.
+    """
+    n = len(buf)
+    if n < 5:
+        return
+    term = segment_terminator(buf)
+    fs = buf[3:4]
+    cs = buf[4:5]
+    control_id = None
+    pos = 0
+    while pos < n:
+        end = buf.find(term, pos)
+        if end < 0:
+            end = n
+        sid = buf[pos:pos + 3]
+        if sid == 'MSH':
+            fs = buf[pos + 3:pos + 4]
+            cs = buf[pos + 4:pos + 5]
+            bounds = _fields(buf, pos, end, fs, _CONTROL_ID)
+            control_id = None
+            if len(bounds) == _CONTROL_ID:
+                control_id = _first_component(buf, bounds[-1][0],
+                                              bounds[-1][1], cs) or None
+        elif sid == 'OBX':
+            bounds = _fields(buf, pos, end, fs, 5)
+            if len(bounds) == 5 and buf[bounds[1][0]:bounds[1][1]] == 'ED':
+                code = _first_component(buf, bounds[2][0], bounds[2][1], cs)
+                yield (control_id, code or None,
+                       _encapsulated(buf, bounds[4][0], bounds[4][1], cs))
+        pos = end + 1
+        ## \r\n line ends and blank lines between messages
+        while buf[pos:pos + 1] in ('\r', '\n'):
+            pos += 1
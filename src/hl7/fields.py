@@ -0,0 +1,29 @@
+"""Positional field tables, generated by hl7_ref_parse.py alongside the
+segment and composite transforms.
+
+``field_revs[version].segments[SEG]`` is a tuple indexed by field
+position (the same index as in ``segment_revs``), and
+``field_revs[version].composites[DT]`` one indexed by component
+position, each entry being None for a gap or::
+
+    (name, transform, datatype, optionality, repeatability)
+
+with optionality 'R' (required) or 'O' (optional) and repeatability the
+reference's maxOccurs: -1 for unbounded, 0 when it does not say.
+"""
+
+import fields21
+import fields22
+import fields23
+import fields231
+import fields24
+import fields25
+
+field_revs = {'2.1': fields21,
+              '2.2': fields22,
+              '2.3': fields23,
+              '2.31': fields231,
+              '2.4': fields24,
+              '2.5': fields25,
+             }
+__all__ = ['field_revs']
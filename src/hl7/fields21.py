@@ -0,0 +1,588 @@
+from hl7trans import *
+import compositetrans
+segments = {\
+    'ACC': (\
+        None,
+        ('accident_datetime', datetransform, 'TS', 'O', 0),
+        ('accident_code', None, 'ID', 'O', 0),
+        ('accident_location', None, 'ST', 'O', 0),
+),
+    'ADD': (\
+        None,
+        ('1', None, 'ST', 'O', 0),
+),
+    'BHS': (\
+        None,
+        ('batch_field_separator', None, 'ST', 'R', 0),
+        ('batch_encoding_characters', None, 'ST', 'R', 0),
+        ('batch_sending_application', None, 'ST', 'O', 0),
+        ('batch_sending_facility', None, 'ST', 'O', 0),
+        ('batch_rcving_application', None, 'ST', 'O', 0),
+        ('batch_receiving_facility', None, 'ST', 'O', 0),
+        ('batch_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('batch_security', None, 'ST', 'O', 0),
+        ('batch_nameidtype', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_control_id', None, 'ST', 'O', 0),
+        ('reference_batch_cntrl_id', None, 'ST', 'O', 0),
+),
+    'BLG': (\
+        None,
+        ('when_to_charge', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('value_type', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('observation_identifier', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'BTS': (\
+        None,
+        ('batch_message_count', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_totals', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'DG1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('diagnosis_coding_method', None, 'ID', 'R', 0),
+        ('diagnosis_code', None, 'ID', 'O', 0),
+        ('diagnosis_description', None, 'ST', 'O', 0),
+        ('diagnosis_datetime', datetransform, 'TS', 'O', 0),
+        ('diagnosisdrg_type', None, 'ID', 'R', 0),
+        ('major_diagnostic_category', None, 'ST', 'O', 0),
+        ('diagnostic_related_group', None, 'ID', 'O', 0),
+        ('drg_approval_indicator', None, 'ID', 'O', 0),
+        ('drg_grouper_review_code', None, 'ID', 'O', 0),
+        ('outlier_type', None, 'ID', 'O', 0),
+        ('outlier_days', numtransform, 'NM', 'O', 0),
+        ('outlier_cost', numtransform, 'NM', 'O', 0),
+        ('grouper_version_and_type', None, 'ST', 'O', 0),
+),
+    'DSC': (\
+        None,
+        ('continuation_pointer', None, 'ST', 'O', 0),
+),
+    'DSP': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('display_level', None, 'SI', 'O', 0),
+        ('data_line', None, 'TX', 'R', 0),
+        ('logical_break_point', None, 'ST', 'O', 0),
+        ('result_id', None, 'TX', 'O', 0),
+),
+    'ERR': (\
+        None,
+        ('error_code_and_location', None, 'ID', 'R', 0),
+),
+    'EVN': (\
+        None,
+        ('event_type_code', None, 'ID', 'R', 0),
+        ('datetime_of_event', datetransform, 'TS', 'R', 0),
+        ('datetime_planned_event', datetransform, 'TS', 'O', 0),
+        ('event_reason_code', None, 'ID', 'O', 0),
+),
+    'FHS': (\
+        None,
+        ('file_field_separators', None, 'ST', 'R', 0),
+        ('file_encoding_characters', None, 'ST', 'R', 0),
+        ('file_sending_application', None, 'ST', 'O', 0),
+        ('file_sending_facility', None, 'ST', 'O', 0),
+        ('file_rcving_application', None, 'ST', 'O', 0),
+        ('file_receiving_facility', None, 'ST', 'O', 0),
+        ('file_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('file_security', None, 'ST', 'O', 0),
+        ('file_nameidtype', None, 'ST', 'O', 0),
+        ('file_comment', None, 'ST', 'O', 0),
+        ('file_control_id', None, 'ST', 'O', 0),
+        ('reference_file_cntrl_id', None, 'ST', 'O', 0),
+),
+    'FT1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('transaction_id', None, 'ST', 'O', 0),
+        ('transaction_batch_id', None, 'ST', 'O', 0),
+        ('transaction_date', datetransform, 'DT', 'R', 0),
+        ('transaction_posting_date', datetransform, 'DT', 'O', 0),
+        ('transaction_type', None, 'ID', 'R', 0),
+        ('transaction_code', None, 'ID', 'R', 0),
+        ('transaction_description', None, 'ST', 'O', 0),
+        ('transaction_description_alternative', None, 'ST', 'O', 0),
+        ('transaction_quantity', numtransform, 'NM', 'O', 0),
+        ('transaction_amount_ext', numtransform, 'NM', 'O', 0),
+        ('transaction_amount_unit', numtransform, 'NM', 'O', 0),
+        ('department_code', None, 'ST', 'O', 0),
+        ('insurance_plan_id', None, 'ID', 'O', 0),
+        ('insurance_amount', numtransform, 'NM', 'O', 0),
+        ('patient_location', None, 'ST', 'O', 0),
+        ('fee_schedule', None, 'ID', 'O', 0),
+        ('patient_type', None, 'ID', 'O', 0),
+        ('diagnosis_code', None, 'ID', 'O', 0),
+        ('performed_by_code', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('ordered_by_code', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('unit_cost', numtransform, 'NM', 'O', 0),
+),
+    'FTS': (\
+        None,
+        ('file_batch_count', None, 'ST', 'O', 0),
+        ('file_trailer_comment', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'GT1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('guarantor_number', None, 'ID', 'O', 0),
+        ('guarantor_name', compositetrans.fieldtransformPN, 'PN', 'R', 0),
+        ('guarantor_spouse_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('guarantor_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('guarantor_phone_home', None, 'TN', 'O', 0),
+        ('guarantor_phone_business', None, 'TN', 'O', 0),
+        ('guarantor_date_of_birth', datetransform, 'DT', 'O', 0),
+        ('guarantor_sex', None, 'ID', 'O', 0),
+        ('guarantor_type', None, 'ID', 'O', 0),
+        ('guarantor_relationship', None, 'ID', 'O', 0),
+        ('guarantor_ssn', None, 'ST', 'O', 0),
+        ('guarantor_date_begin', datetransform, 'DT', 'O', 0),
+        ('guarantor_date_end', datetransform, 'DT', 'O', 0),
+        ('guarantor_priority', numtransform, 'NM', 'O', 0),
+        ('guarantor_employer_name', None, 'ST', 'O', 0),
+        ('guarantor_employer_addr', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('guarantor_employer_phone', None, 'TN', 'O', 0),
+        ('guarantor_employee_id_num', None, 'ST', 'O', 0),
+        ('guarantor_employmt_status', None, 'ID', 'O', 0),
+),
+    'IN1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('insurance_plan_id', None, 'ID', 'R', 0),
+        ('insurance_company_id', None, 'ST', 'R', 0),
+        ('insurance_company_name', None, 'ST', 'O', 0),
+        ('insurance_company_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('insurance_co_contact_pers', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('insurance_co_phone_number', None, 'TN', 'O', 0),
+        ('group_number', None, 'ST', 'O', 0),
+        ('group_name', None, 'ST', 'O', 0),
+        ('insureds_group_emp_id', None, 'ST', 'O', 0),
+        ('insureds_group_emp_name', None, 'ST', 'O', 0),
+        ('plan_effective_date', datetransform, 'DT', 'O', 0),
+        ('plan_expiration_date', datetransform, 'DT', 'O', 0),
+        ('authorization_information', None, 'ST', 'O', 0),
+        ('plan_type', None, 'ID', 'O', 0),
+        ('name_of_insured', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('insureds_relation_to_pat', None, 'ID', 'O', 0),
+        ('insureds_date_of_birth', datetransform, 'DT', 'O', 0),
+        ('insureds_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('assignment_of_benefits', None, 'ID', 'O', 0),
+        ('coordination_of_benefits', None, 'ID', 'O', 0),
+        ('coord_of_ben_priority', None, 'ST', 'O', 0),
+        ('notice_of_admission_code', None, 'ID', 'O', 0),
+        ('notice_of_admission_date', datetransform, 'DT', 'O', 0),
+        ('rpt_of_eligibility_code', None, 'ID', 'O', 0),
+        ('rpt_of_eligibility_date', datetransform, 'DT', 'O', 0),
+        ('release_information_code', None, 'ID', 'O', 0),
+        ('pre_admit_cert_pac', None, 'ST', 'O', 0),
+        ('verification_date', datetransform, 'DT', 'O', 0),
+        ('verification_by', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('type_of_agreement_code', None, 'ID', 'O', 0),
+        ('billing_status', None, 'ID', 'O', 0),
+        ('lifetime_reserve_days', numtransform, 'NM', 'O', 0),
+        ('delay_before_l_r_day', numtransform, 'NM', 'O', 0),
+        ('company_plan_code', None, 'ST', 'O', 0),
+        ('policy_number', None, 'ST', 'O', 0),
+        ('policy_deductible', numtransform, 'NM', 'O', 0),
+        ('policy_limit_amount', numtransform, 'NM', 'O', 0),
+        ('policy_limit_days', numtransform, 'NM', 'O', 0),
+        ('room_rate_semi_private', numtransform, 'NM', 'O', 0),
+        ('room_rate_private', numtransform, 'NM', 'O', 0),
+        ('insureds_employ_status', None, 'ID', 'O', 0),
+        ('insureds_sex', None, 'ID', 'O', 0),
+        ('insureds_employer_addresss', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+),
+    'MRG': (\
+        None,
+        ('prior_patient_id_internal', compositetrans.fieldtransformCK, 'CK', 'R', 0),
+        ('prior_alt_patient_id', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('prior_patient_account_num', None, 'ST', 'O', 0),
+),
+    'MSA': (\
+        None,
+        ('acknowledgement_code', None, 'ID', 'R', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('text_message', None, 'ST', 'O', 0),
+        ('expected_sequence_number', numtransform, 'NM', 'O', 0),
+        ('delayed_ack_type', None, 'ID', 'O', 0),
+),
+    'MSH': (\
+        ('field_separator', None, 'ST', 'R', 0),
+        ('encoding_characters', None, 'ST', 'R', 0),
+        ('sending_application', None, 'ST', 'O', 0),
+        ('sending_facility', None, 'ST', 'O', 0),
+        ('receiving_application', None, 'ST', 'O', 0),
+        ('receiving_facility', None, 'ST', 'O', 0),
+        ('datetime_of_message', datetransform, 'TS', 'O', 0),
+        ('security', None, 'ST', 'O', 0),
+        ('message_type', compositetrans.fieldtransformCM, 'CM', 'R', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('processing_id', None, 'ID', 'R', 0),
+        ('version_id', numtransform, 'NM', 'R', 0),
+        ('sequence_number', numtransform, 'NM', 'O', 0),
+        ('continuation_pointer', None, 'ST', 'O', 0),
+),
+    'NK1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('next_of_kin_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('next_of_kin_relationship', None, 'ST', 'O', 0),
+        ('next_of_kin_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('next_of_kin_phone_number', None, 'TN', 'O', -1),
+),
+    'NPU': (\
+        None,
+        ('bed_location', None, 'ID', 'R', 0),
+        ('bed_status', None, 'ID', 'O', 0),
+),
+    'NTE': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('source_of_comment', None, 'ID', 'O', 0),
+        ('comment', None, 'TX', 'R', -1),
+),
+    'OBR': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('placer_orders_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('fillers_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('universal_service_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('priority', None, 'ST', 'O', 0),
+        ('requested_datetime', datetransform, 'TS', 'O', 0),
+        ('observation_datetime', datetransform, 'TS', 'R', 0),
+        ('observation_end_datetime', datetransform, 'TS', 'R', 0),
+        ('collection_volume', compositetrans.fieldtransformCQ, 'CQ', 'R', 0),
+        ('collector_identifier', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('specimen_action_code', None, 'ST', 'O', 0),
+        ('danger_code', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('relevant_clinical_info', None, 'ST', 'O', 0),
+        ('specimen_rcvd_datetime', datetransform, 'TS', 'R', 0),
+        ('specimen_source', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('ordering_provider', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('order_call_back_phone_num', None, 'TN', 'O', 2),
+        ('placers_field_num1', None, 'ST', 'O', 0),
+        ('placers_field_num2', None, 'ST', 'O', 0),
+        ('fillers_field_num1', None, 'ST', 'O', 0),
+        ('fillers_field_num2', None, 'ST', 'O', 0),
+        ('results_rptstatus_chg_dt', datetransform, 'TS', 'R', 0),
+        ('charge_to_practice', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('diagnostic_serv_sect_id', None, 'ID', 'O', 0),
+        ('result_status', None, 'ID', 'O', 0),
+        ('linked_results', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('quantitytiming', compositetrans.fieldtransformCM, 'CM', 'O', -1),
+        ('result_copies_to', compositetrans.fieldtransformCN, 'CN', 'O', 5),
+        ('parent_accession_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('transportation_mode', None, 'ID', 'O', 0),
+        ('reason_for_study', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('prin_result_interpreter', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('asst_result_interpreter', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('technician', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('transcriptionist', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('scheduled_datetime', datetransform, 'TS', 'O', 0),
+),
+    'OBX': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('value_type', None, 'ID', 'O', 0),
+        ('observation_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('observation_sub_id', None, 'ST', 'O', 0),
+        ('observation_results', None, 'ST', 'R', 0),
+        ('units', None, 'ST', 'O', 0),
+        ('reference_range', None, 'ST', 'O', 0),
+        ('abnormal_flags', None, 'ST', 'O', 5),
+        ('probability', numtransform, 'NM', 'O', 0),
+        ('nature_of_abnormal_test', None, 'ID', 'O', 0),
+        ('observ_result_status', None, 'ID', 'O', 0),
+        ('date_last_normal_value', datetransform, 'TS', 'O', 0),
+),
+    'ORC': (\
+        None,
+        ('order_control', None, 'ST', 'R', 0),
+        ('placer_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('filler_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('placer_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('order_status', None, 'ST', 'O', 0),
+        ('response_flag', None, 'ST', 'O', 0),
+        ('timingquantity', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('parent', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('datetime_of_transaction', datetransform, 'TS', 'O', 0),
+        ('entered_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('verified_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('ordering_provider', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('enterers_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('call_back_phone_number', None, 'TN', 'O', 2),
+),
+    'ORO': (\
+        None,
+        ('order_item_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substitute_allowed', None, 'ID', 'O', 0),
+        ('results_copied_to', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('stock_location', None, 'ID', 'O', 0),
+),
+    'PID': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_id_external_id', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('patient_id_internal_id', compositetrans.fieldtransformCK, 'CK', 'R', 0),
+        ('alternate_patient_id', None, 'ST', 'O', 0),
+        ('patients_name', compositetrans.fieldtransformPN, 'PN', 'R', 0),
+        ('mothers_maiden_name', None, 'ST', 'O', 0),
+        ('date_of_birth', datetransform, 'DT', 'O', 0),
+        ('sex', None, 'ID', 'O', 0),
+        ('patient_alias', compositetrans.fieldtransformPN, 'PN', 'O', -1),
+        ('ethnic_group', None, 'ID', 'O', 0),
+        ('patient_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('county_code', None, 'ID', 'O', 0),
+        ('phone_number_home', None, 'TN', 'O', 0),
+        ('phone_number_business', None, 'TN', 'O', 0),
+        ('language_patient', None, 'ST', 'O', 0),
+        ('marital_status', None, 'ID', 'O', 0),
+        ('religion', None, 'ID', 'O', 0),
+        ('patient_account_number', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('ssn_number_patient', None, 'ST', 'O', 0),
+        ('drivers_license_patient', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'PR1': (\
+        None,
+        ('set_id', None, 'SI', 'R', -1),
+        ('procedure_coding_method', None, 'ID', 'R', -1),
+        ('procedure_code', None, 'ID', 'R', -1),
+        ('procedure_description', None, 'ST', 'O', -1),
+        ('procedure_datetime', datetransform, 'TS', 'R', 0),
+        ('procedure_type', None, 'ID', 'R', 0),
+        ('procedure_minutes', numtransform, 'NM', 'O', 0),
+        ('anesthesiologist', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('anesthesia_code', None, 'ID', 'O', 0),
+        ('anesthesia_minutes', numtransform, 'NM', 'O', 0),
+        ('surgeon', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('resident_code', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('consent_code', None, 'ID', 'O', 0),
+),
+    'PV1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_class', None, 'ID', 'R', 0),
+        ('assigned_patient_location', None, 'ID', 'R', 0),
+        ('admission_type', None, 'ID', 'O', 0),
+        ('pre_admit_number', None, 'ST', 'O', 0),
+        ('prior_patient_location', None, 'ID', 'O', 0),
+        ('attending_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('refering_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('consulting_doctor', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('hospital_service', None, 'ID', 'O', 0),
+        ('temporary_location', None, 'ID', 'O', 0),
+        ('pre_admit_test_indicator', None, 'ID', 'O', 0),
+        ('re_admission_indicator', None, 'ID', 'O', 0),
+        ('admit_source', None, 'ID', 'O', 0),
+        ('ambulatory_status', None, 'ID', 'O', 0),
+        ('vip_indicators', None, 'ID', 'O', 0),
+        ('admitting_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('patient_type', None, 'ID', 'O', 0),
+        ('visit_number', numtransform, 'NM', 'O', 0),
+        ('financial_class', None, 'ID', 'O', 0),
+        ('charge_price_indicator', None, 'ID', 'O', 0),
+        ('courtesy_code', None, 'ID', 'O', 0),
+        ('credit_rating', None, 'ID', 'O', 0),
+        ('contract_code', None, 'ID', 'O', -1),
+        ('contract_effective_date', datetransform, 'DT', 'O', -1),
+        ('contract_amount', numtransform, 'NM', 'O', -1),
+        ('contract_period', numtransform, 'NM', 'O', -1),
+        ('interest_code', None, 'ID', 'O', 0),
+        ('transfer_to_bad_debt_code', None, 'ID', 'O', 0),
+        ('transfer_to_bad_debt_date', datetransform, 'DT', 'O', 0),
+        ('bad_debt_agency_code', None, 'ST', 'O', 0),
+        ('bad_debt_transfer_amount', numtransform, 'NM', 'O', 0),
+        ('bad_debt_recovery_amount', numtransform, 'NM', 'O', 0),
+        ('delete_account_indicator', None, 'ID', 'O', 0),
+        ('delete_account_date', datetransform, 'DT', 'O', 0),
+        ('discharge_disposition', None, 'ID', 'O', 0),
+        ('discharged_to_location', None, 'ID', 'O', 0),
+        ('diet_type', None, 'ID', 'O', 0),
+        ('servicing_facility', None, 'ID', 'O', 0),
+        ('bed_status', None, 'ID', 'O', 0),
+        ('account_status', None, 'ID', 'O', 0),
+        ('pending_location', None, 'ID', 'O', 0),
+        ('prior_temporary_location', None, 'ID', 'O', 0),
+        ('admit_datetime', datetransform, 'TS', 'O', 0),
+        ('discharge_datetime', datetransform, 'TS', 'O', 0),
+        ('current_patient_balance', numtransform, 'NM', 'O', 0),
+        ('total_charges', numtransform, 'NM', 'O', 0),
+        ('total_adjustments', numtransform, 'NM', 'O', 0),
+        ('total_payments', numtransform, 'NM', 'O', 0),
+),
+    'QRD': (\
+        None,
+        ('query_datetime', datetransform, 'TS', 'R', 0),
+        ('query_format_code', None, 'ID', 'R', 0),
+        ('query_priority', None, 'ID', 'R', 0),
+        ('query_id', None, 'ST', 'R', 0),
+        ('deferred_response_type', None, 'ID', 'O', 0),
+        ('def_resp_datetime', datetransform, 'TS', 'O', 0),
+        ('quantity_limited_request', compositetrans.fieldtransformCQ, 'CQ', 'R', 0),
+        ('who_subject_filter', None, 'ST', 'R', -1),
+        ('what_subject_filter', None, 'ID', 'R', -1),
+        ('what_dept_data_code', None, 'ST', 'R', -1),
+        ('what_data_cd_value_qua', None, 'ST', 'O', -1),
+        ('query_results_level', None, 'ID', 'O', 0),
+),
+    'QRF': (\
+        None,
+        ('where_subject_filter', None, 'ST', 'R', -1),
+        ('when_data_start_datetime', datetransform, 'TS', 'O', 0),
+        ('when_data_end_datetime', datetransform, 'TS', 'O', 0),
+        ('what_user_qualifier', None, 'ST', 'O', -1),
+        ('other_qry_subject_filter', None, 'ST', 'O', -1),
+),
+    'RX1': (\
+        None,
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('route', None, 'ST', 'O', 0),
+        ('site_administered', None, 'ST', 'O', 0),
+        ('iv_solution_rate', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('drug_strength', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('final_concentration', numtransform, 'NM', 'O', 0),
+        ('final_volume_in_ml', numtransform, 'NM', 'O', 0),
+        ('drug_dose', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('drug_role', None, 'ID', 'O', 0),
+        ('prescription_sequence_num', numtransform, 'NM', 'O', 0),
+        ('quantity_dispensed', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('drug_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('component_drug_ids', None, 'ID', 'O', 5),
+        ('prescription_type', None, 'ID', 'O', 0),
+        ('substitution_status', None, 'ID', 'O', 0),
+        ('rx_order_status', None, 'ID', 'O', 0),
+        ('number_of_refills', numtransform, 'NM', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('refills_remaining', numtransform, 'NM', 'O', 0),
+        ('dea_class', None, 'ID', 'O', 0),
+        ('ordering_mds_dea_number', numtransform, 'NM', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('last_refill_datetime', datetransform, 'TS', 'O', 0),
+        ('rx_number', None, 'ST', 'O', 0),
+        ('prn_status', None, 'ID', 'O', 0),
+        ('pharmacy_instructions', None, 'TX', 'O', 5),
+        ('patient_instruction', None, 'TX', 'O', 5),
+        ('instructions_sig', None, 'TX', 'O', -1),
+),
+    'UB1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('blood_deductible', None, 'ST', 'O', 0),
+        ('blood_furn_pints_of_40', None, 'ST', 'O', 0),
+        ('blook_replaced_pints_41', None, 'ST', 'O', 0),
+        ('blood_not_rplcd_pints42', None, 'ST', 'O', 0),
+        ('co_insurance_days_25', None, 'ST', 'O', 0),
+        ('condition_code', None, 'ID', 'O', 5),
+        ('covered_days_23', None, 'ST', 'O', 0),
+        ('non_covered_days_24', None, 'ST', 'O', 0),
+        ('value_amount_code', compositetrans.fieldtransformCM, 'CM', 'O', 8),
+        ('number_of_grace_days_90', None, 'ST', 'O', 0),
+        ('spec_prog_indicator44', None, 'ID', 'O', 0),
+        ('psrour_approvl_ind_87', None, 'ID', 'O', 0),
+        ('psrour_aprvd_stay_fm88', datetransform, 'DT', 'O', 0),
+        ('psrour_aprvd_stay_to89', datetransform, 'DT', 'O', 0),
+        ('occurrence_28_32', None, 'ID', 'O', 5),
+        ('occurrence_span_33', None, 'ID', 'O', 0),
+        ('occur_span_start_date33', datetransform, 'DT', 'O', 0),
+        ('occur_span_end_date_33', datetransform, 'DT', 'O', 0),
+        ('ub_82_locator_2', None, 'ST', 'O', 0),
+        ('ub_82_locator_9', None, 'ST', 'O', 0),
+        ('ub_82_locator_27', None, 'ST', 'O', 0),
+        ('ub_82_locator_45', None, 'ST', 'O', 0),
+),
+    'URD': (\
+        None,
+        ('ru_datetime', None, 'SI', 'O', 0),
+        ('report_priority', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('ru_who_subject_defnition', compositetrans.fieldtransformCK, 'CK', 'R', -1),
+        ('ru_what_subject_defntion', None, 'ST', 'O', -1),
+        ('ru_what_department_code', compositetrans.fieldtransformPN, 'PN', 'O', -1),
+        ('ru_displayprint_locs', None, 'ST', 'O', -1),
+        ('ru_results_level', datetransform, 'DT', 'O', 0),
+),
+    'URS': (\
+        None,
+        ('ru_where_subject_def', None, 'ST', 'R', -1),
+        ('ru_when_start_dtetme', datetransform, 'TS', 'O', 0),
+        ('ru_when_end_dtetme', datetransform, 'TS', 'O', 0),
+        ('ru_what_user_qualifier', None, 'ST', 'O', -1),
+        ('ru_oth_results_def', None, 'ST', 'O', -1),
+),
+}
+composites = {\
+    'AD': (\
+        ('street_address', None, 'ST', 'O', 0),
+        ('other_designation', None, 'ST', 'O', 0),
+        ('city', None, 'ST', 'O', 0),
+        ('state_or_province', None, 'ST', 'O', 0),
+        ('zip_or_postal_code', None, 'ST', 'O', 0),
+        ('country', None, 'ID', 'O', 0),
+),
+    'CE': (\
+        ('identifier', None, 'ST', 'O', 0),
+        ('text', None, 'ST', 'O', 0),
+        ('name_of_coding_system', None, 'ST', 'O', 0),
+),
+    'CK': (\
+        ('id_number', numtransform, 'NM', 'O', 0),
+        ('check_digit', numtransform, 'NM', 'O', 0),
+),
+    'CM': (\
+        ('field1', None, 'ST', 'O', 0),
+        ('field2', None, 'ST', 'O', 0),
+        ('field3', None, 'ST', 'O', 0),
+        ('field4', None, 'ST', 'O', 0),
+        ('field5', None, 'ST', 'O', 0),
+        ('field6', None, 'ST', 'O', 0),
+),
+    'CN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('family_name', None, 'ST', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('middle_initial', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+),
+    'CQ': (\
+        ('quantity', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'DT': (\
+        ('value', None, 'Date', 'O', 0),
+),
+    'ID': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'NM': (\
+        ('value', numtransform, 'Double', 'O', 0),
+),
+    'PN': (\
+        ('family_name', None, 'String', 'O', 0),
+        ('given_name', None, 'String', 'O', 0),
+        ('middle_initial', None, 'String', 'O', 0),
+        ('suffix', None, 'String', 'O', 0),
+        ('prefix', None, 'String', 'O', 0),
+        ('degree', None, 'String', 'O', 0),
+),
+    'SI': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'ST': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'TN': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'TS': (\
+        ('value', None, 'Time', 'O', 0),
+),
+    'TX': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'UN': (\
+        ('value', None, 'String', 'O', 0),
+),
+}
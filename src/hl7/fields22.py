@@ -0,0 +1,731 @@
+from hl7trans import *
+import compositetrans
+segments = {\
+    'ACC': (\
+        None,
+        ('accident_datetime', datetransform, 'TS', 'O', 0),
+        ('accident_code', None, 'ID', 'O', 0),
+        ('accident_location', None, 'ST', 'O', 0),
+),
+    'ADD': (\
+        None,
+        ('addendum_continuation_pointer', None, 'ST', 'O', 0),
+),
+    'AL1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('allergy_type', None, 'ID', 'O', 0),
+        ('allergy_codemnemonicdescription', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('allergy_severity', None, 'ID', 'O', 0),
+        ('allergy_reaction', None, 'ST', 'O', 0),
+        ('identification_date', datetransform, 'DT', 'O', 0),
+),
+    'BHS': (\
+        None,
+        ('batch_field_separator', None, 'ST', 'R', 0),
+        ('batch_encoding_characters', None, 'ST', 'R', 0),
+        ('batch_sending_application', None, 'ST', 'O', 0),
+        ('batch_sending_facility', None, 'ST', 'O', 0),
+        ('batch_receiving_application', None, 'ST', 'O', 0),
+        ('batch_receiving_facility', None, 'ST', 'O', 0),
+        ('batch_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('batch_security', None, 'ST', 'O', 0),
+        ('batch_nameidtype', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_control_id', None, 'ST', 'O', 0),
+        ('reference_batch_control_id', None, 'ST', 'O', 0),
+),
+    'BLG': (\
+        None,
+        ('when_to_charge', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('value_type', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('observation_identifier', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'BTS': (\
+        None,
+        ('batch_message_count', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_totals', numtransform, 'NM', 'O', -1),
+),
+    'DG1': (\
+        None,
+        ('set_id_diagnosis', None, 'SI', 'R', 0),
+        ('diagnosis_coding_method', None, 'ID', 'R', 0),
+        ('diagnosis_code', None, 'ID', 'O', 0),
+        ('diagnosis_description', None, 'ST', 'O', 0),
+        ('diagnosis_datetime', datetransform, 'TS', 'O', 0),
+        ('diagnosisdrg_type', None, 'ID', 'R', 0),
+        ('major_diagnostic_category', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('diagnostic_related_group', None, 'ID', 'O', 0),
+        ('drg_approval_indicator', None, 'ID', 'O', 0),
+        ('drg_grouper_review_code', None, 'ID', 'O', 0),
+        ('outlier_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('outlier_days', numtransform, 'NM', 'O', 0),
+        ('outlier_cost', numtransform, 'NM', 'O', 0),
+        ('grouper_version_and_type', None, 'ST', 'O', 0),
+        ('diagnosisdrg_priority', numtransform, 'NM', 'O', 0),
+        ('diagnosing_clinician', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+),
+    'DSC': (\
+        None,
+        ('continuation_pointer', None, 'ST', 'O', 0),
+),
+    'DSP': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('display_level', None, 'SI', 'O', 0),
+        ('data_line', None, 'TX', 'R', 0),
+        ('logical_break_point', None, 'ST', 'O', 0),
+        ('result_id', None, 'TX', 'O', 0),
+),
+    'ERR': (\
+        None,
+        ('error_code_and_location', compositetrans.fieldtransformCM, 'CM', 'R', 0),
+),
+    'EVN': (\
+        None,
+        ('event_type_code', None, 'ID', 'R', 0),
+        ('datetime_of_event', datetransform, 'TS', 'R', 0),
+        ('datetime_planned_event', datetransform, 'TS', 'O', 0),
+        ('event_reason_code', None, 'ID', 'O', 0),
+        ('operator_id', None, 'ID', 'O', 0),
+),
+    'FHS': (\
+        None,
+        ('file_field_separator', None, 'ST', 'R', 0),
+        ('file_encoding_characters', None, 'ST', 'R', 0),
+        ('file_sending_application', None, 'ST', 'O', 0),
+        ('file_sending_facility', None, 'ST', 'O', 0),
+        ('file_receiving_application', None, 'ST', 'O', 0),
+        ('file_receiving_facility', None, 'ST', 'O', 0),
+        ('file_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('file_security', None, 'ST', 'O', 0),
+        ('file_nameid', None, 'ST', 'O', 0),
+        ('file_header_comment', None, 'ST', 'O', 0),
+        ('file_control_id', None, 'ST', 'O', 0),
+        ('reference_file_control_id', None, 'ST', 'O', 0),
+),
+    'FT1': (\
+        None,
+        ('set_id_financial_transaction', None, 'SI', 'O', 0),
+        ('transaction_id', None, 'ST', 'O', 0),
+        ('transaction_batch_id', None, 'ST', 'O', 0),
+        ('transaction_date', datetransform, 'DT', 'R', 0),
+        ('transaction_posting_date', datetransform, 'DT', 'O', 0),
+        ('transaction_type', None, 'ID', 'R', 0),
+        ('transaction_code', None, 'ID', 'R', 0),
+        ('transaction_description', None, 'ST', 'O', 0),
+        ('transaction_description_alt', None, 'ST', 'O', 0),
+        ('transaction_quantity', numtransform, 'NM', 'O', 0),
+        ('transaction_amount_extended', numtransform, 'NM', 'O', 0),
+        ('transaction_amount_unit', numtransform, 'NM', 'O', 0),
+        ('department_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insurance_plan_id', None, 'ID', 'O', 0),
+        ('insurance_amount', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('patient_location', None, 'ST', 'O', 0),
+        ('fee_schedule', None, 'ID', 'O', 0),
+        ('patient_type', None, 'ID', 'O', 0),
+        ('diagnosis_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('performed_by_code', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('ordered_by_code', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('unit_cost', numtransform, 'NM', 'O', 0),
+        ('filler_order_number', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'FTS': (\
+        None,
+        ('file_batch_count', numtransform, 'NM', 'O', 0),
+        ('file_trailer_comment', None, 'ST', 'O', 0),
+),
+    'GT1': (\
+        None,
+        ('set_id_guarantor', None, 'SI', 'R', 0),
+        ('guarantor_number', None, 'ID', 'O', 0),
+        ('guarantor_name', compositetrans.fieldtransformPN, 'PN', 'R', 0),
+        ('guarantor_spouse_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('guarantor_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('guarantor_ph_num_home', None, 'TN', 'O', 3),
+        ('guarantor_ph_num_business', None, 'TN', 'O', 3),
+        ('guarantor_date_of_birth', datetransform, 'DT', 'O', 0),
+        ('guarantor_sex', None, 'ID', 'O', 0),
+        ('guarantor_type', None, 'ID', 'O', 0),
+        ('guarantor_relationship', None, 'ID', 'O', 0),
+        ('guarantor_ssn', None, 'ST', 'O', 0),
+        ('guarantor_date_begin', datetransform, 'DT', 'O', 0),
+        ('guarantor_date_end', datetransform, 'DT', 'O', 0),
+        ('guarantor_priority', numtransform, 'NM', 'O', 0),
+        ('guarantor_employer_name', None, 'ST', 'O', 0),
+        ('guarantor_employer_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('guarantor_employ_phone_number', None, 'TN', 'O', 3),
+        ('guarantor_employee_id_num', None, 'ST', 'O', 0),
+        ('guarantor_employment_status', None, 'ID', 'O', 0),
+        ('guarantor_organization', None, 'ST', 'O', 0),
+),
+    'IN1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('insurance_plan_id', None, 'ID', 'R', 0),
+        ('insurance_company_id', None, 'ST', 'R', 0),
+        ('insurance_company_name', None, 'ST', 'O', 0),
+        ('insurance_company_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('insurance_co_contact_pers', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('insurance_co_phone_number', None, 'TN', 'O', 3),
+        ('group_number', None, 'ST', 'O', 0),
+        ('group_name', None, 'ST', 'O', 0),
+        ('insureds_group_emp_id', None, 'ST', 'O', 0),
+        ('insureds_group_emp_name', None, 'ST', 'O', 0),
+        ('plan_effective_date', datetransform, 'DT', 'O', 0),
+        ('plan_expiration_date', datetransform, 'DT', 'O', 0),
+        ('authorization_information', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('plan_type', None, 'ID', 'O', 0),
+        ('name_of_insured', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('insureds_relationship_to_patient', None, 'ID', 'O', 0),
+        ('insureds_date_of_birth', datetransform, 'DT', 'O', 0),
+        ('insureds_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('assignment_of_benefits', None, 'ID', 'O', 0),
+        ('coordination_of_benefits', None, 'ID', 'O', 0),
+        ('coord_of_ben_priority', None, 'ST', 'O', 0),
+        ('notice_of_admission_code', None, 'ST', 'O', 0),
+        ('notice_of_admission_date', datetransform, 'DT', 'O', 0),
+        ('rpt_of_eligibility_code', None, 'ID', 'O', 0),
+        ('rpt_of_eligibility_date', datetransform, 'DT', 'O', 0),
+        ('release_information_code', None, 'ID', 'O', 0),
+        ('pre_admit_cert_pac', None, 'ST', 'O', 0),
+        ('verification_datetime', datetransform, 'TS', 'O', 0),
+        ('verification_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('type_of_agreement_code', None, 'ID', 'O', 0),
+        ('billing_status', None, 'ID', 'O', 0),
+        ('lifetime_reserve_days', numtransform, 'NM', 'O', 0),
+        ('delay_before_l_r_day', numtransform, 'NM', 'O', 0),
+        ('company_plan_code', None, 'ID', 'O', 0),
+        ('policy_number', None, 'ST', 'O', 0),
+        ('policy_deductible', numtransform, 'NM', 'O', 0),
+        ('policy_limit_amount', numtransform, 'NM', 'O', 0),
+        ('policy_limit_days', numtransform, 'NM', 'O', 0),
+        ('room_rate_semi_private', numtransform, 'NM', 'O', 0),
+        ('room_rate_private', numtransform, 'NM', 'O', 0),
+        ('insureds_employment_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insureds_sex', None, 'ID', 'O', 0),
+        ('insureds_employer_address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('verification_status', None, 'ST', 'O', 0),
+        ('prior_insurance_plan_id', None, 'ID', 'O', 0),
+),
+    'IN2': (\
+        None,
+        ('insureds_employee_id', None, 'ST', 'O', 0),
+        ('insureds_social_security_number', numtransform, 'NM', 'O', 0),
+        ('insureds_employer_name', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('employer_information_data', None, 'ID', 'O', 0),
+        ('mail_claim_party', None, 'ID', 'O', 0),
+        ('medicare_health_ins_card_number', numtransform, 'NM', 'O', 0),
+        ('medicaid_case_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('medicaid_case_number', numtransform, 'NM', 'O', 0),
+        ('champus_sponsor_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('champus_id_number', numtransform, 'NM', 'O', 0),
+        ('dependent_of_champus_recipient', None, 'ID', 'O', 0),
+        ('champus_organization', None, 'ST', 'O', 0),
+        ('champus_station', None, 'ST', 'O', 0),
+        ('champus_service', None, 'ID', 'O', 0),
+        ('champus_rankgrade', None, 'ID', 'O', 0),
+        ('champus_status', None, 'ID', 'O', 0),
+        ('champus_retire_date', datetransform, 'DT', 'O', 0),
+        ('champus_non_avail_cert_on_file', None, 'ID', 'O', 0),
+        ('baby_coverage', None, 'ID', 'O', 0),
+        ('combine_baby_bill', None, 'ID', 'O', 0),
+        ('blood_deductible', None, 'ST', 'O', 0),
+        ('special_coverage_approval_name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('special_coverage_approval_title', None, 'ST', 'O', 0),
+        ('non_covered_insurance_code', None, 'ST', 'O', -1),
+        ('payor_id', None, 'ST', 'O', 0),
+        ('payor_subscriber_id', None, 'ST', 'O', 0),
+        ('eligibility_source', None, 'ID', 'O', 0),
+        ('room_coverage_typeamount', compositetrans.fieldtransformCM, 'CM', 'O', -1),
+        ('policy_typeamount', compositetrans.fieldtransformCM, 'CM', 'O', -1),
+        ('daily_deductible', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+),
+    'IN3': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('certification_number', None, 'ST', 'O', 0),
+        ('certified_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('certification_required', None, 'ID', 'O', 0),
+        ('penalty', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('certification_datetime', datetransform, 'TS', 'O', 0),
+        ('certification_modify_datetime', datetransform, 'TS', 'O', 0),
+        ('operator', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('certification_begin_date', datetransform, 'DT', 'O', 0),
+        ('certification_end_date', datetransform, 'DT', 'O', 0),
+        ('days', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('non_concur_codedescription', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('non_concur_eff_datetime', datetransform, 'TS', 'O', 0),
+        ('physician_reviewer', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('certification_contact', None, 'ST', 'O', 3),
+        ('certification_contact_phone_number', None, 'TN', 'O', 0),
+        ('appeal_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('certification_agency', compositetrans.fieldtransformCE, 'CE', 'O', 3),
+        ('certification_agency_phone_number', None, 'TN', 'O', -1),
+        ('pre_certification_reqwindow', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('case_manager', None, 'ST', 'O', 0),
+        ('second_opinion_date', datetransform, 'DT', 'O', 0),
+        ('second_opinion_approved', None, 'ST', 'O', 0),
+        ('second_opinion_documentation_received', None, 'ST', 'O', 0),
+        ('second_opinion_physician', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+),
+    'MRG': (\
+        None,
+        ('prior_patient_id_internal', compositetrans.fieldtransformCK, 'CK', 'R', 0),
+        ('prior_alternate_patient_id', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('prior_patient_account_number', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('prior_patient_id_external', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+),
+    'MSA': (\
+        None,
+        ('acknowledgement_code', None, 'ID', 'R', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('text_message', None, 'ST', 'O', 0),
+        ('expected_sequence_number', numtransform, 'NM', 'O', 0),
+        ('delayed_acknowledgement_type', None, 'ID', 'O', 0),
+        ('error_condition', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'MSH': (\
+        ('field_separator', None, 'ST', 'R', 0),
+        ('encoding_characters', None, 'ST', 'R', 0),
+        ('sending_application', None, 'ST', 'O', 0),
+        ('sending_facility', None, 'ST', 'O', 0),
+        ('receiving_application', None, 'ST', 'O', 0),
+        ('receiving_facility', None, 'ST', 'O', 0),
+        ('datetime_of_message', datetransform, 'TS', 'O', 0),
+        ('security', None, 'ST', 'O', 0),
+        ('message_type', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('processing_id', None, 'ID', 'R', 0),
+        ('version_id', None, 'ID', 'R', 0),
+        ('sequence_number', numtransform, 'NM', 'O', 0),
+        ('continuation_pointer', None, 'ST', 'O', 0),
+        ('accept_acknowledgement_type', None, 'ID', 'O', 0),
+        ('application_acknowledgement_type', None, 'ID', 'O', 0),
+        ('country_code', None, 'ID', 'O', 0),
+),
+    'NK1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('name', compositetrans.fieldtransformPN, 'PN', 'O', 0),
+        ('relationship', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+        ('phone_number', None, 'TN', 'O', 3),
+        ('business_phone_number', None, 'TN', 'O', 0),
+        ('contact_role', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('start_date', datetransform, 'DT', 'O', 0),
+        ('end_date', datetransform, 'DT', 'O', 0),
+        ('next_of_kin_job_title', None, 'ST', 'O', 0),
+        ('next_of_kin_job_codeclass', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('next_of_kin_employee_number', None, 'ST', 'O', 0),
+        ('organization_name', None, 'ST', 'O', 0),
+),
+    'NPU': (\
+        None,
+        ('bed_location', compositetrans.fieldtransformCM, 'CM', 'R', 0),
+        ('bed_status', None, 'ID', 'O', 0),
+),
+    'NTE': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('source_of_comment', None, 'ID', 'O', 0),
+        ('comment', None, 'FT', 'O', 0),
+),
+    'OBR': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('placer_orders_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('fillers_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('universal_service_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('priority', None, 'ST', 'O', 0),
+        ('requested_datetime', datetransform, 'TS', 'O', 0),
+        ('observation_datetime', datetransform, 'TS', 'R', 0),
+        ('observation_end_datetime', datetransform, 'TS', 'R', 0),
+        ('collection_volume', compositetrans.fieldtransformCQ, 'CQ', 'R', 0),
+        ('collector_identifier', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('specimen_action_code', None, 'ST', 'O', 0),
+        ('danger_code', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('relevant_clinical_info', None, 'ST', 'O', 0),
+        ('specimen_rcvd_datetime', datetransform, 'TS', 'R', 0),
+        ('specimen_source', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('ordering_provider', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('order_call_back_phone_num', None, 'TN', 'O', 2),
+        ('placers_field_num1', None, 'ST', 'O', 0),
+        ('placers_field_num2', None, 'ST', 'O', 0),
+        ('fillers_field_num1', None, 'ST', 'O', 0),
+        ('fillers_field_num2', None, 'ST', 'O', 0),
+        ('results_rptstatus_chg_dt', datetransform, 'TS', 'R', 0),
+        ('charge_to_practice', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('diagnostic_serv_sect_id', None, 'ID', 'O', 0),
+        ('result_status', None, 'ID', 'O', 0),
+        ('linked_results', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('quantitytiming', compositetrans.fieldtransformCM, 'CM', 'O', -1),
+        ('result_copies_to', compositetrans.fieldtransformCN, 'CN', 'O', 5),
+        ('parent_accession_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('transportation_mode', None, 'ID', 'O', 0),
+        ('reason_for_study', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('prin_result_interpreter', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('asst_result_interpreter', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('technician', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('transcriptionist', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('scheduled_datetime', datetransform, 'TS', 'O', 0),
+),
+    'OBX': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('value_type', None, 'ID', 'R', 0),
+        ('observation_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('observation_sub_id', None, 'ST', 'O', 0),
+        ('observation_value', None, 'ST', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('reference_range', None, 'ST', 'O', 0),
+        ('abnormal_flag', None, 'ID', 'O', 5),
+        ('probability', numtransform, 'NM', 'O', 0),
+        ('0', None, 'ID', 'O', 0),
+        ('1', None, 'ID', 'R', 0),
+        ('2', datetransform, 'TS', 'O', 0),
+        ('3', None, 'ST', 'O', 0),
+        ('4', datetransform, 'TS', 'O', 0),
+        ('5', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('6', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+),
+    'ORC': (\
+        None,
+        ('order_control', None, 'ST', 'R', 0),
+        ('placer_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('filler_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('placer_order_num', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('order_status', None, 'ST', 'O', 0),
+        ('response_flag', None, 'ST', 'O', 0),
+        ('timingquantity', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('parent', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('datetime_of_transaction', datetransform, 'TS', 'O', 0),
+        ('entered_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('verified_by', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('ordering_provider', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('enterers_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('call_back_phone_number', None, 'TN', 'O', 2),
+),
+    'ORO': (\
+        None,
+        ('order_item_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substitute_allowed', None, 'ID', 'O', 0),
+        ('results_copied_to', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('stock_location', None, 'ID', 'O', 0),
+),
+    'PID': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_id_external_id', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('patient_id_internal_id', compositetrans.fieldtransformCK, 'CK', 'R', -1),
+        ('alternate_patient_id', None, 'ST', 'O', 0),
+        ('patient_name', compositetrans.fieldtransformPN, 'PN', 'R', 0),
+        ('mothers_maiden_name', None, 'ST', 'O', 0),
+        ('date_of_birth', datetransform, 'TS', 'O', 0),
+        ('sex', None, 'ID', 'O', 0),
+        ('patient_alias', compositetrans.fieldtransformPN, 'PN', 'O', -1),
+        ('race', None, 'ID', 'O', 0),
+        ('patient_address', compositetrans.fieldtransformAD, 'AD', 'O', 3),
+        ('county_code', None, 'ID', 'O', 0),
+        ('phone_number_home', None, 'TN', 'O', 3),
+        ('phone_number_business', None, 'TN', 'O', 3),
+        ('language_patient', None, 'ST', 'O', 0),
+        ('marital_status', None, 'ID', 'O', 0),
+        ('religion', None, 'ID', 'O', 0),
+        ('patient_account_number', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('ssn_number_patient', None, 'ST', 'O', 0),
+        ('drivers_lic_num_patient', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('mothers_identifier', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+        ('ethnic_group', None, 'ID', 'O', 0),
+),
+    'PR1': (\
+        None,
+        ('set_id_procedure', None, 'SI', 'R', 0),
+        ('procedure_coding_method', None, 'ID', 'R', -1),
+        ('procedure_code', None, 'ID', 'R', -1),
+        ('procedure_description', None, 'ST', 'O', -1),
+        ('procedure_datetime', datetransform, 'TS', 'R', 0),
+        ('procedure_type', None, 'ID', 'R', 0),
+        ('procedure_minutes', numtransform, 'NM', 'O', 0),
+        ('anesthesiologist', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('anesthesia_code', None, 'ID', 'O', 0),
+        ('anesthesia_minutes', numtransform, 'NM', 'O', 0),
+        ('surgeon', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('procedure_md', compositetrans.fieldtransformCM, 'CM', 'O', -1),
+        ('consent_code', None, 'ID', 'O', 0),
+        ('procedure_priority', numtransform, 'NM', 'O', 0),
+),
+    'PV1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_class', None, 'ID', 'R', 0),
+        ('assigned_patient_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('admission_type', None, 'ID', 'O', 0),
+        ('preadmit_number', None, 'ST', 'O', 0),
+        ('prior_patient_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('attending_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('referring_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('consulting_doctor', compositetrans.fieldtransformCN, 'CN', 'O', -1),
+        ('hospital_service', None, 'ID', 'O', 0),
+        ('temporary_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('preadmit_test_indicator', None, 'ID', 'O', 0),
+        ('readmission_indicator', None, 'ID', 'O', 0),
+        ('admit_source', None, 'ID', 'O', 0),
+        ('ambulatory_status', None, 'ID', 'O', -1),
+        ('vip_indicator', None, 'ID', 'O', 0),
+        ('admitting_doctor', compositetrans.fieldtransformCN, 'CN', 'O', 0),
+        ('patient_type', None, 'ID', 'O', 0),
+        ('visit_number', numtransform, 'NM', 'O', 0),
+        ('financial_class', compositetrans.fieldtransformCM, 'CM', 'O', 4),
+        ('charge_price_indicator', None, 'ID', 'O', 0),
+        ('courtesy_code', None, 'ID', 'O', 0),
+        ('credit_rating', None, 'ID', 'O', 0),
+        ('contract_code', None, 'ID', 'O', -1),
+        ('contract_effective_date', datetransform, 'DT', 'O', -1),
+        ('contract_amount', numtransform, 'NM', 'O', -1),
+        ('contract_period', numtransform, 'NM', 'O', -1),
+        ('interest_code', None, 'ID', 'O', 0),
+        ('transfer_to_bad_debt_code', None, 'ID', 'O', 0),
+        ('transfer_to_bad_debt_date', datetransform, 'DT', 'O', 0),
+        ('bad_debt_agency_code', None, 'ST', 'O', 0),
+        ('bad_debt_transfer_amount', numtransform, 'NM', 'O', 0),
+        ('bad_debt_recovery_amount', numtransform, 'NM', 'O', 0),
+        ('delete_account_indicator', None, 'ID', 'O', 0),
+        ('delete_account_date', datetransform, 'DT', 'O', 0),
+        ('discharge_disposition', None, 'ID', 'O', 0),
+        ('discharged_to_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('diet_type', None, 'ID', 'O', 0),
+        ('servicing_facility', None, 'ID', 'O', 0),
+        ('bed_status', None, 'ID', 'O', 0),
+        ('account_status', None, 'ID', 'O', 0),
+        ('pending_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('prior_temporary_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('admit_datetime', datetransform, 'TS', 'O', 0),
+        ('discharge_datetime', datetransform, 'TS', 'O', 0),
+        ('current_patient_balance', numtransform, 'NM', 'O', 0),
+        ('total_charges', numtransform, 'NM', 'O', 0),
+        ('total_adjustments', numtransform, 'NM', 'O', 0),
+        ('total_payments', numtransform, 'NM', 'O', 0),
+        ('alternate_visit_id', compositetrans.fieldtransformCK, 'CK', 'O', 0),
+),
+    'PV2': (\
+        None,
+        ('prior_pending_location', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('accommodation_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('admit_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('transfer_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('patient_valuables', None, 'ST', 'O', -1),
+        ('patient_valuables_location', None, 'ST', 'O', 0),
+        ('visit_user_code', None, 'ID', 'O', 0),
+        ('expected_admit_date', datetransform, 'DT', 'O', 0),
+        ('expected_discharge_date', datetransform, 'DT', 'O', 0),
+        ('birth_place', None, 'ST', 'O', 0),
+        ('multiple_birth_indicator', None, 'ID', 'O', 0),
+        ('birth_order', None, 'ID', 'O', 0),
+        ('citizenship', None, 'ID', 'O', -1),
+        ('veterans_military_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'QRD': (\
+        None,
+        ('query_datetime', datetransform, 'TS', 'R', 0),
+        ('query_format_code', None, 'ID', 'R', 0),
+        ('query_priority', None, 'ID', 'R', 0),
+        ('query_id', None, 'ST', 'R', 0),
+        ('deferred_response_type', None, 'ID', 'O', 0),
+        ('deferred_response_datetime', datetransform, 'TS', 'O', 0),
+        ('quantity_limited_request', compositetrans.fieldtransformCQ, 'CQ', 'R', 0),
+        ('who_subject_filter', None, 'ST', 'R', -1),
+        ('what_subject_filter', None, 'ID', 'R', -1),
+        ('what_department_data_code', None, 'ST', 'R', -1),
+        ('what_data_code_value_qual', None, 'ST', 'O', -1),
+        ('query_results_level', None, 'ID', 'O', 0),
+),
+    'QRF': (\
+        None,
+        ('where_subject_filter', None, 'ST', 'R', -1),
+        ('when_data_start_datetime', datetransform, 'TS', 'O', 0),
+        ('when_data_end_datetime', datetransform, 'TS', 'O', 0),
+        ('what_user_qualifier', None, 'ST', 'O', -1),
+        ('other_qry_subject_filter', None, 'ST', 'O', -1),
+        ('which_datetime_qualifier', None, 'ID', 'O', -1),
+        ('which_datetime_status_qualifier', None, 'ID', 'O', -1),
+        ('datetime_selection_qualifier', None, 'ID', 'O', -1),
+),
+    'RX1': (\
+        None,
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('route', None, 'ST', 'O', 0),
+        ('site_administered', None, 'ST', 'O', 0),
+        ('iv_solution_rate', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('drug_strength', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('final_concentration', numtransform, 'NM', 'O', 0),
+        ('final_volume_in_ml', numtransform, 'NM', 'O', 0),
+        ('drug_dose', compositetrans.fieldtransformCM, 'CM', 'O', 0),
+        ('drug_role', None, 'ID', 'O', 0),
+        ('prescription_sequence_num', numtransform, 'NM', 'O', 0),
+        ('quantity_dispensed', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('drug_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('component_drug_ids', None, 'ID', 'O', 5),
+        ('prescription_type', None, 'ID', 'O', 0),
+        ('substitution_status', None, 'ID', 'O', 0),
+        ('rx_order_status', None, 'ID', 'O', 0),
+        ('number_of_refills', numtransform, 'NM', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('refills_remaining', numtransform, 'NM', 'O', 0),
+        ('dea_class', None, 'ID', 'O', 0),
+        ('ordering_mds_dea_number', numtransform, 'NM', 'O', 0),
+        ('unused', compositetrans.fieldtransformUN, 'UN', 'O', 0),
+        ('last_refill_datetime', datetransform, 'TS', 'O', 0),
+        ('rx_number', None, 'ST', 'O', 0),
+        ('prn_status', None, 'ID', 'O', 0),
+        ('pharmacy_instructions', None, 'TX', 'O', 5),
+        ('patient_instruction', None, 'TX', 'O', 5),
+        ('instructions_sig', None, 'TX', 'O', -1),
+),
+    'UB1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('blood_deductible', None, 'ST', 'O', 0),
+        ('blood_furnished_pints_of_40', None, 'ST', 'O', 0),
+        ('blood_replaced_pints_41', None, 'ST', 'O', 0),
+        ('blood_not_replaced_pints42', None, 'ST', 'O', 0),
+        ('co_insurance_days_25', None, 'ST', 'O', 0),
+        ('condition_code', None, 'ID', 'O', 5),
+        ('covered_days_23', None, 'ST', 'O', 0),
+        ('non_covered_days_24', None, 'ST', 'O', 0),
+        ('value_amount_code', compositetrans.fieldtransformCM, 'CM', 'O', 8),
+        ('number_of_grace_days_90', numtransform, 'NM', 'O', 0),
+        ('spec_prog_indicator_44', None, 'ID', 'O', 0),
+        ('psrour_approval_ind_87', None, 'ID', 'O', 0),
+        ('psrour_approved_stay_from_88', datetransform, 'DT', 'O', 0),
+        ('psrour_approved_stay_to_89', datetransform, 'DT', 'O', 0),
+        ('occurrence_28_32', compositetrans.fieldtransformCM, 'CM', 'O', 5),
+        ('occurrence_span_33', None, 'ID', 'O', 0),
+        ('occurrence_span_start_date33', datetransform, 'DT', 'O', 0),
+        ('occurrence_span_end_date_33', datetransform, 'DT', 'O', 0),
+        ('ub_82_locator_2', None, 'ST', 'O', 0),
+        ('ub_82_locator_9', None, 'ST', 'O', 0),
+        ('ub_82_locator_27', None, 'ST', 'O', 0),
+        ('ub_82_locator_45', None, 'ST', 'O', 0),
+),
+    'UB2': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('co_insurance_days_9', None, 'ST', 'O', 0),
+        ('condition_code_24_30', None, 'ID', 'O', 7),
+        ('covered_days_7', None, 'ST', 'O', 0),
+        ('non_covered_days_8', None, 'ST', 'O', 0),
+        ('value_amount_code', compositetrans.fieldtransformCM, 'CM', 'O', 12),
+        ('occurrence_code_date_32_35', compositetrans.fieldtransformCM, 'CM', 'O', 8),
+        ('occurrence_span_codedates_36', compositetrans.fieldtransformCM, 'CM', 'O', 2),
+        ('ub92_locator_2_state', None, 'ST', 'O', 2),
+        ('ub92_locator_11_state', None, 'ST', 'O', 2),
+        ('ub92_locator_31_national', None, 'ST', 'O', 0),
+        ('document_control_number', None, 'ST', 'O', 3),
+        ('ub92_locator_49_national', None, 'ST', 'O', 23),
+        ('ub92_locator_56_state', None, 'ST', 'O', 5),
+        ('ub92_locator_57_national', None, 'ST', 'O', 0),
+        ('ub92_locator_78_state', None, 'ST', 'O', 2),
+),
+    'URD': (\
+        None,
+        ('ru_datetime', datetransform, 'TS', 'O', 0),
+        ('report_priority', None, 'ID', 'O', 0),
+        ('ru_who_subject_definition', None, 'ST', 'R', -1),
+        ('ru_what_subject_definition', None, 'ID', 'O', -1),
+        ('ru_what_department_code', None, 'ST', 'O', -1),
+        ('ru_displayprint_locations', None, 'ST', 'O', -1),
+        ('ru_results_level', None, 'ID', 'O', 0),
+),
+    'URS': (\
+        None,
+        ('ru_where_subject_definition', None, 'ST', 'R', -1),
+        ('ru_when_data_start_datetime', datetransform, 'TS', 'O', 0),
+        ('ru_when_data_end_datetime', datetransform, 'TS', 'O', 0),
+        ('ru_what_user_qualifier', None, 'ST', 'O', -1),
+        ('ru_other_results_subject_definition', None, 'ST', 'O', -1),
+        ('which_datetime_qualifier', None, 'ID', 'O', -1),
+        ('which_datetime_status_qualifier', None, 'ID', 'O', -1),
+        ('datetime_selection_qualifier', None, 'ID', 'O', -1),
+),
+}
+composites = {\
+    'AD': (\
+        ('street_address', None, 'ST', 'O', 0),
+        ('other_designation', None, 'ST', 'O', 0),
+        ('city', None, 'ST', 'O', 0),
+        ('state_or_province', None, 'ST', 'O', 0),
+        ('zip_or_postal_code', None, 'ST', 'O', 0),
+        ('country', None, 'ID', 'O', 0),
+),
+    'CE': (\
+        ('identifier', None, 'ST', 'O', 0),
+        ('text', None, 'ST', 'O', 0),
+        ('name_of_coding_system', None, 'ST', 'O', 0),
+),
+    'CK': (\
+        ('id_number', numtransform, 'NM', 'O', 0),
+        ('check_digit', numtransform, 'NM', 'O', 0),
+),
+    'CM': (\
+        ('field1', None, 'ST', 'O', 0),
+        ('field2', None, 'ST', 'O', 0),
+        ('field3', None, 'ST', 'O', 0),
+        ('field4', None, 'ST', 'O', 0),
+        ('field5', None, 'ST', 'O', 0),
+        ('field6', None, 'ST', 'O', 0),
+),
+    'CN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('family_name', None, 'ST', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('middle_initial', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+),
+    'CQ': (\
+        ('quantity', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'DT': (\
+        ('value', None, 'Date', 'O', 0),
+),
+    'FT': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'ID': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'NM': (\
+        ('value', numtransform, 'Double', 'O', 0),
+),
+    'PN': (\
+        ('family_name', None, 'String', 'O', 0),
+        ('given_name', None, 'String', 'O', 0),
+        ('middle_initial', None, 'String', 'O', 0),
+        ('suffix', None, 'String', 'O', 0),
+        ('prefix', None, 'String', 'O', 0),
+        ('degree', None, 'String', 'O', 0),
+),
+    'SI': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'ST': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'TN': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'TS': (\
+        ('value', None, 'Time', 'O', 0),
+),
+    'TX': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'UN': (\
+        ('value', None, 'String', 'O', 0),
+),
+}
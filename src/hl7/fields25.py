@@ -0,0 +1,3120 @@
+from hl7trans import *
+import compositetrans
+segments = {\
+    'ABS': (\
+        None,
+        ('discharge_care_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('transfer_medical_service_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('severity_of_illness_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('datetime_of_attestation', datetransform, 'TS', 'O', 0),
+        ('attested_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('triage_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('abstract_completion_datetime', datetransform, 'TS', 'O', 0),
+        ('abstracted_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('case_category_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('caesarian_section_indicator', None, 'ID', 'O', 0),
+        ('gestation_category_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('gestation_period_weeks', numtransform, 'NM', 'O', 0),
+        ('newborn_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('stillborn_indicator', None, 'ID', 'O', 0),
+),
+    'ACC': (\
+        None,
+        ('accident_datetime', datetransform, 'TS', 'O', 0),
+        ('accident_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('accident_location', None, 'ST', 'O', 0),
+        ('auto_accident_state', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('accident_job_related_indicator', None, 'ID', 'O', 0),
+        ('accident_death_indicator', None, 'ID', 'O', 0),
+        ('entered_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('accident_description', None, 'ST', 'O', 0),
+        ('brought_in_by', None, 'ST', 'O', 0),
+        ('police_notified_indicator', None, 'ID', 'O', 0),
+        ('accident_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+),
+    'ADD': (\
+        None,
+        ('addendum_continuation_pointer', None, 'ST', 'O', 0),
+),
+    'AFF': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('professional_organization', compositetrans.fieldtransformXON, 'XON', 'R', 0),
+        ('professional_organization_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('professional_organization_affiliation_date_range', compositetrans.fieldtransformDR, 'DR', 'O', -1),
+        ('professional_affiliation_additional_information', None, 'ST', 'O', 0),
+),
+    'AIG': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('resource_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('resource_type', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('resource_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('resource_quantity', numtransform, 'NM', 'O', 0),
+        ('resource_quantity_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('start_datetime_offset', numtransform, 'NM', 'O', 0),
+        ('start_datetime_offset_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('duration', numtransform, 'NM', 'O', 0),
+        ('duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allow_substitution_code', None, 'IS', 'O', 0),
+        ('filler_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'AIL': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('location_resource_id', compositetrans.fieldtransformPL, 'PL', 'O', -1),
+        ('location_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('location_group', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('start_datetime_offset', numtransform, 'NM', 'O', 0),
+        ('start_datetime_offset_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('duration', numtransform, 'NM', 'O', 0),
+        ('duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allow_substitution_code', None, 'IS', 'O', 0),
+        ('filler_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'AIP': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('personnel_resource_id', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('resource_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('resource_group', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('start_datetime_offset', numtransform, 'NM', 'O', 0),
+        ('start_datetime_offset_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('duration', numtransform, 'NM', 'O', 0),
+        ('duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allow_substitution_code', None, 'IS', 'O', 0),
+        ('filler_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'AIS': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('universal_service_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('start_datetime_offset', numtransform, 'NM', 'O', 0),
+        ('start_datetime_offset_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('duration', numtransform, 'NM', 'O', 0),
+        ('duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allow_substitution_code', None, 'IS', 'O', 0),
+        ('filler_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('placer_supplemental_service_information', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('filler_supplemental_service_information', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+),
+    'AL1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('allergen_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergen_codemnemonicdescription', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('allergy_severity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergy_reaction_code', None, 'ST', 'O', -1),
+        ('identification_date', datetransform, 'DT', 'O', 0),
+),
+    'APR': (\
+        None,
+        ('time_selection_criteria', compositetrans.fieldtransformSCV, 'SCV', 'O', -1),
+        ('resource_selection_criteria', compositetrans.fieldtransformSCV, 'SCV', 'O', -1),
+        ('location_selection_criteria', compositetrans.fieldtransformSCV, 'SCV', 'O', -1),
+        ('slot_spacing_criteria', numtransform, 'NM', 'O', 0),
+        ('filler_override_criteria', compositetrans.fieldtransformSCV, 'SCV', 'O', -1),
+),
+    'ARQ': (\
+        None,
+        ('placer_appointment_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('filler_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('occurrence_number', numtransform, 'NM', 'O', 0),
+        ('placer_group_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('schedule_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('request_event_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_duration', numtransform, 'NM', 'O', 0),
+        ('appointment_duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('requested_start_datetime_range', compositetrans.fieldtransformDR, 'DR', 'O', -1),
+        ('priority', None, 'ST', 'O', 0),
+        ('repeating_interval', compositetrans.fieldtransformRI, 'RI', 'O', 0),
+        ('repeating_interval_duration', None, 'ST', 'O', 0),
+        ('placer_contact_person', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('placer_contact_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('placer_contact_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('placer_contact_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('entered_by_person', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('entered_by_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('entered_by_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('parent_placer_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('parent_filler_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('placer_order_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+),
+    'AUT': (\
+        None,
+        ('authorizing_payor_plan_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('authorizing_payor_company_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('authorizing_payor_company_name', None, 'ST', 'O', 0),
+        ('authorization_effective_date', datetransform, 'TS', 'O', 0),
+        ('authorization_expiration_date', datetransform, 'TS', 'O', 0),
+        ('authorization_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('reimbursement_limit', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('requested_number_of_treatments', numtransform, 'NM', 'O', 0),
+        ('authorized_number_of_treatments', numtransform, 'NM', 'O', 0),
+        ('process_date', datetransform, 'TS', 'O', 0),
+),
+    'BHS': (\
+        None,
+        ('batch_field_separator', None, 'ST', 'R', 0),
+        ('batch_encoding_characters', None, 'ST', 'R', 0),
+        ('batch_sending_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('batch_sending_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('batch_receiving_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('batch_receiving_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('batch_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('batch_security', None, 'ST', 'O', 0),
+        ('batch_nameidtype', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_control_id', None, 'ST', 'O', 0),
+        ('reference_batch_control_id', None, 'ST', 'O', 0),
+),
+    'BLC': (\
+        None,
+        ('blood_product_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('blood_amount', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+),
+    'BLG': (\
+        None,
+        ('when_to_charge', compositetrans.fieldtransformCCD, 'CCD', 'O', 0),
+        ('charge_type', None, 'ID', 'O', 0),
+        ('account_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('charge_type_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'BPO': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('universal_service_id', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('processing_requirements', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('quantity', numtransform, 'NM', 'R', 0),
+        ('amount', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('intended_use_datetime', datetransform, 'TS', 'O', 0),
+        ('intended_dispense_from_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('intended_dispense_from_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('requested_dispense_datetime', datetransform, 'TS', 'O', 0),
+        ('requested_dispense_to_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('requested_dispense_to_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('indication_for_use', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('informed_consent_indicator', None, 'ID', 'O', 0),
+),
+    'BPX': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('dispense_status', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('status', None, 'ID', 'R', 0),
+        ('datetime_of_status', datetransform, 'TS', 'R', 0),
+        ('donation_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('component', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('donation_typeintended_use', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('commercial_product', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('manufacturer', compositetrans.fieldtransformXON, 'XON', 'O', 0),
+        ('lot_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('blood_group', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('special_testing', compositetrans.fieldtransformCNE, 'CNE', 'O', -1),
+        ('expiration_datetime', datetransform, 'TS', 'O', 0),
+        ('quantity', numtransform, 'NM', 'R', 0),
+        ('amount', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('unique_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('actual_dispensed_to_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('actual_dispensed_to_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('dispensed_to_receiver', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('dispensing_individual', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+),
+    'BTS': (\
+        None,
+        ('batch_message_count', None, 'ST', 'O', 0),
+        ('batch_comment', None, 'ST', 'O', 0),
+        ('batch_totals', numtransform, 'NM', 'O', -1),
+),
+    'BTX': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('donation_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('component', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('blood_group', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('commercial_product', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('manufacturer', compositetrans.fieldtransformXON, 'XON', 'O', 0),
+        ('lot_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('quantity', numtransform, 'NM', 'R', 0),
+        ('amount', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('transfusiondisposition_status', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('message_status', None, 'ID', 'R', 0),
+        ('datetime_of_status', datetransform, 'TS', 'R', 0),
+        ('administrator', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('verifier', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('transfusion_start_datetime_of_status', datetransform, 'TS', 'O', 0),
+        ('transfusion_end_datetime_of_status', datetransform, 'TS', 'O', 0),
+        ('adverse_reaction_type', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('transfusion_interrupted_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'CDM': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('charge_code_alias', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('charge_description_short', None, 'ST', 'R', 0),
+        ('charge_description_long', None, 'ST', 'O', 0),
+        ('description_override_indicator', None, 'IS', 'O', 0),
+        ('exploding_charges', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('procedure_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('activeinactive_flag', None, 'ID', 'O', 0),
+        ('inventory_number', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('resource_load', numtransform, 'NM', 'O', 0),
+        ('contract_number', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('contract_organization', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('room_fee_indicator', None, 'ID', 'O', 0),
+),
+    'CER': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('serial_number', None, 'ST', 'O', 0),
+        ('version', None, 'ST', 'O', 0),
+        ('granting_authority', compositetrans.fieldtransformXON, 'XON', 'O', 0),
+        ('issuing_authority', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('signature_of_issuing_authority', compositetrans.fieldtransformED, 'ED', 'O', 0),
+        ('granting_country', None, 'ID', 'O', 0),
+        ('granting_stateprovince', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('granting_countyparish', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('certificate_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('certificate_domain', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('subject_id', None, 'ID', 'O', 0),
+        ('subject_name', None, 'ST', 'R', 0),
+        ('subject_directory_attribute_extension_health_professional_data', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('subject_public_key_info', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('authority_key_identifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('basic_constraint', None, 'ID', 'O', 0),
+        ('crl_distribution_point', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('jurisdiction_country', None, 'ID', 'O', 0),
+        ('jurisdiction_stateprovince', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('jurisdiction_countyparish', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('jurisdiction_breadth', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('granting_date', datetransform, 'TS', 'O', 0),
+        ('issuing_date', datetransform, 'TS', 'O', 0),
+        ('activation_date', datetransform, 'TS', 'O', 0),
+        ('inactivation_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+        ('renewal_date', datetransform, 'TS', 'O', 0),
+        ('revocation_date', datetransform, 'TS', 'O', 0),
+        ('revocation_reason_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('certificate_status', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'CM0': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('sponsor_study_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('alternate_study_id', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('title_of_study', None, 'ST', 'R', 0),
+        ('chairman_of_study', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('last_irb_approval_date', datetransform, 'DT', 'O', 0),
+        ('total_accrual_to_date', numtransform, 'NM', 'O', 0),
+        ('last_accrual_date', datetransform, 'DT', 'O', 0),
+        ('contact_for_study', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('contacts_telephone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('contacts_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+),
+    'CM1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('study_phase_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('description_of_study_phase', None, 'ST', 'R', 0),
+),
+    'CM2': (\
+        None,
+        ('set_id_cm2', None, 'SI', 'O', 0),
+        ('scheduled_time_point', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('description_of_time_point', None, 'ST', 'O', 0),
+        ('events_scheduled_this_time_point', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+),
+    'CNS': (\
+        None,
+        ('starting_notification_reference_number', numtransform, 'NM', 'O', 0),
+        ('ending_notification_reference_number', numtransform, 'NM', 'O', 0),
+        ('starting_notification_datetime', datetransform, 'TS', 'O', 0),
+        ('ending_notification_datetime', datetransform, 'TS', 'O', 0),
+        ('starting_notification_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ending_notification_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'CON': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('consent_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('consent_form_id', None, 'ST', 'O', 0),
+        ('consent_form_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('consent_text', None, 'FT', 'O', -1),
+        ('subject_specific_consent_text', None, 'FT', 'O', -1),
+        ('consent_background', None, 'FT', 'O', -1),
+        ('subject_specific_consent_background', None, 'FT', 'O', -1),
+        ('consenter_imposed_limitations', None, 'FT', 'O', -1),
+        ('consent_mode', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('consent_status', compositetrans.fieldtransformCNE, 'CNE', 'R', 0),
+        ('consent_discussion_datetime', datetransform, 'TS', 'O', 0),
+        ('consent_decision_datetime', datetransform, 'TS', 'O', 0),
+        ('consent_effective_datetime', datetransform, 'TS', 'O', 0),
+        ('consent_end_datetime', datetransform, 'TS', 'O', 0),
+        ('subject_competence_indicator', None, 'ID', 'O', 0),
+        ('translator_assistance_indicator', None, 'ID', 'O', 0),
+        ('language_translated_to', None, 'ID', 'O', 0),
+        ('informational_material_supplied_indicator', None, 'ID', 'O', 0),
+        ('consent_bypass_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('consent_disclosure_level', None, 'ID', 'O', 0),
+        ('consent_non_disclosure_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('non_subject_consenter_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('consenter_id', compositetrans.fieldtransformXPN, 'XPN', 'R', -1),
+        ('relationship_to_subject_table', None, 'IS', 'R', -1),
+),
+    'CSP': (\
+        None,
+        ('study_phase_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('datetime_study_phase_began', datetransform, 'TS', 'R', 0),
+        ('datetime_study_phase_ended', datetransform, 'TS', 'O', 0),
+        ('study_phase_evaluability', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'CSR': (\
+        None,
+        ('sponsor_study_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('alternate_study_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('institution_registering_the_patient', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('sponsor_patient_id', compositetrans.fieldtransformCX, 'CX', 'R', 0),
+        ('alternate_patient_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('datetime_of_patient_study_registration', datetransform, 'TS', 'R', 0),
+        ('person_performing_study_registration', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('study_authorizing_provider', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('datetime_patient_study_consent_signed', datetransform, 'TS', 'O', 0),
+        ('patient_study_eligibility_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('study_randomization_datetime', datetransform, 'TS', 'O', -1),
+        ('randomized_study_arm', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('stratum_for_study_randomization', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('patient_evaluability_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('datetime_ended_study', datetransform, 'TS', 'O', 0),
+        ('reason_ended_study', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'CSS': (\
+        None,
+        ('study_scheduled_time_point', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('study_scheduled_patient_time_point', datetransform, 'TS', 'O', 0),
+        ('study_quality_control_codes', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+),
+    'CTD': (\
+        None,
+        ('contact_role', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('contact_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('contact_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('contact_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('contact_communication_information', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('preferred_method_of_contact', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('contact_identifiers', compositetrans.fieldtransformPLN, 'PLN', 'O', -1),
+),
+    'CTI': (\
+        None,
+        ('sponsor_study_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('study_phase_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('study_scheduled_time_point', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'DB1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('disabled_person_code', None, 'IS', 'O', 0),
+        ('disabled_person_identifier', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('disabled_indicator', None, 'ID', 'O', 0),
+        ('disability_start_date', datetransform, 'DT', 'O', 0),
+        ('disability_end_date', datetransform, 'DT', 'O', 0),
+        ('disability_return_to_work_date', datetransform, 'DT', 'O', 0),
+        ('disability_unable_to_work_date', datetransform, 'DT', 'O', 0),
+),
+    'DG1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('diagnosis_coding_method', None, 'ID', 'O', 0),
+        ('diagnosis_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('diagnosis_description', None, 'ST', 'O', 0),
+        ('diagnosis_datetime', datetransform, 'TS', 'O', 0),
+        ('diagnosis_type', None, 'IS', 'R', 0),
+        ('major_diagnostic_category', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('diagnostic_related_group', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('drg_approval_indicator', None, 'ID', 'O', 0),
+        ('drg_grouper_review_code', None, 'IS', 'O', 0),
+        ('outlier_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('outlier_days', numtransform, 'NM', 'O', 0),
+        ('outlier_cost', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('grouper_version_and_type', None, 'ST', 'O', 0),
+        ('diagnosis_priority', None, 'ID', 'O', 0),
+        ('diagnosing_clinician', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('diagnosis_classification', None, 'IS', 'O', 0),
+        ('confidential_indicator', None, 'ID', 'O', 0),
+        ('attestation_datetime', datetransform, 'TS', 'O', 0),
+        ('diagnosis_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('diagnosis_action_code', None, 'ID', 'O', 0),
+),
+    'DRG': (\
+        None,
+        ('diagnostic_related_group', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('drg_assigned_datetime', datetransform, 'TS', 'O', 0),
+        ('drg_approval_indicator', None, 'ID', 'O', 0),
+        ('drg_grouper_review_code', None, 'IS', 'O', 0),
+        ('outlier_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('outlier_days', numtransform, 'NM', 'O', 0),
+        ('outlier_cost', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('drg_payor', None, 'IS', 'O', 0),
+        ('outlier_reimbursement', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('confidential_indicator', None, 'ID', 'O', 0),
+        ('drg_transfer_type', None, 'IS', 'O', 0),
+),
+    'DSC': (\
+        None,
+        ('continuation_pointer', None, 'ST', 'O', 0),
+        ('continuation_style', None, 'ID', 'O', 0),
+),
+    'DSP': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('display_level', None, 'SI', 'O', 0),
+        ('data_line', None, 'TX', 'R', 0),
+        ('logical_break_point', None, 'ST', 'O', 0),
+        ('result_id', None, 'TX', 'O', 0),
+),
+    'ECD': (\
+        None,
+        ('reference_command_number', numtransform, 'NM', 'R', 0),
+        ('remote_control_command', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('response_required', None, 'ID', 'O', 0),
+        ('requested_completion_time', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('parameters', None, 'TX', 'O', -1),
+),
+    'ECR': (\
+        None,
+        ('command_response', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('datetime_completed', datetransform, 'TS', 'R', 0),
+        ('command_response_parameters', None, 'TX', 'O', -1),
+),
+    'ED': (\
+),
+    'EDU': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('academic_degree', None, 'IS', 'O', 0),
+        ('academic_degree_program_date_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('academic_degree_program_participation_date_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('academic_degree_granted_date', datetransform, 'DT', 'O', 0),
+        ('school', compositetrans.fieldtransformXON, 'XON', 'O', 0),
+        ('school_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('school_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('major_field_of_study', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+),
+    'EQL': (\
+        None,
+        ('query_tag', None, 'ST', 'O', 0),
+        ('queryresponse_format_code', None, 'ID', 'R', 0),
+        ('eql_query_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('eql_query_statement', None, 'ST', 'R', 0),
+),
+    'EQP': (\
+        None,
+        ('event_type', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('file_name', None, 'ST', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'R', 0),
+        ('end_datetime', datetransform, 'TS', 'O', 0),
+        ('transaction_data', None, 'FT', 'R', 0),
+),
+    'EQU': (\
+        None,
+        ('equipment_instance_identifier', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('event_datetime', datetransform, 'TS', 'R', 0),
+        ('equipment_state', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('localremote_control_state', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('alert_level', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'ERQ': (\
+        None,
+        ('query_tag', None, 'ST', 'O', 0),
+        ('event_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('input_parameter_list', compositetrans.fieldtransformQIP, 'QIP', 'O', -1),
+),
+    'ERR': (\
+        None,
+        ('error_code_and_location', compositetrans.fieldtransformELD, 'ELD', 'O', -1),
+        ('error_location', compositetrans.fieldtransformERL, 'ERL', 'O', -1),
+        ('hl7_error_code', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('severity', None, 'ID', 'R', 0),
+        ('application_error_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('application_error_parameter', None, 'ST', 'O', -1),
+        ('diagnostic_information', None, 'TX', 'O', 0),
+        ('user_message', None, 'TX', 'O', 0),
+        ('inform_person_indicator', None, 'IS', 'O', -1),
+        ('override_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('override_reason_code', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('help_desk_contact_point', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+),
+    'EVN': (\
+        None,
+        ('event_type_code', None, 'ID', 'O', 0),
+        ('recorded_datetime', datetransform, 'TS', 'R', 0),
+        ('datetime_planned_event', datetransform, 'TS', 'O', 0),
+        ('event_reason_code', None, 'IS', 'O', 0),
+        ('operator_id', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('event_occurred', datetransform, 'TS', 'O', 0),
+        ('event_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+),
+    'FAC': (\
+        None,
+        ('facility_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('facility_type', None, 'ID', 'O', 0),
+        ('facility_address', compositetrans.fieldtransformXAD, 'XAD', 'R', -1),
+        ('facility_telecommunication', compositetrans.fieldtransformXTN, 'XTN', 'R', 0),
+        ('contact_person', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('contact_title', None, 'ST', 'O', -1),
+        ('contact_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('contact_telecommunication', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('signature_authority', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('signature_authority_title', None, 'ST', 'O', 0),
+        ('signature_authority_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('signature_authority_telecommunication', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+),
+    'FHS': (\
+        None,
+        ('file_field_separator', None, 'ST', 'R', 0),
+        ('file_encoding_characters', None, 'ST', 'R', 0),
+        ('file_sending_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('file_sending_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('file_receiving_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('file_receiving_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('file_creation_datetime', datetransform, 'TS', 'O', 0),
+        ('file_security', None, 'ST', 'O', 0),
+        ('file_nameid', None, 'ST', 'O', 0),
+        ('file_header_comment', None, 'ST', 'O', 0),
+        ('file_control_id', None, 'ST', 'O', 0),
+        ('reference_file_control_id', None, 'ST', 'O', 0),
+),
+    'FT1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('transaction_id', None, 'ST', 'O', 0),
+        ('transaction_batch_id', None, 'ST', 'O', 0),
+        ('transaction_date', compositetrans.fieldtransformDR, 'DR', 'R', 0),
+        ('transaction_posting_date', datetransform, 'TS', 'O', 0),
+        ('transaction_type', None, 'IS', 'R', 0),
+        ('transaction_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('transaction_description', None, 'ST', 'O', 0),
+        ('transaction_description_alternative', None, 'ST', 'O', 0),
+        ('transaction_quantity', numtransform, 'NM', 'O', 0),
+        ('transaction_amount_extended', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('transaction_amount_unit', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('department_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insurance_plan_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insurance_amount', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('assigned_patient_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('fee_schedule', None, 'IS', 'O', 0),
+        ('patient_type', None, 'IS', 'O', 0),
+        ('diagnosis_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('performed_by_code', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('ordered_by_code', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('unit_cost', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('entered_by_code', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('procedure_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('procedure_code_modifier', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('advanced_beneficiary_notice_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('medically_necessary_duplicate_procedure_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('ndc_code', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('payment_reference_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('transaction_reference_key', None, 'SI', 'O', -1),
+),
+    'FTS': (\
+        None,
+        ('file_batch_count', numtransform, 'NM', 'O', 0),
+        ('file_trailer_comment', None, 'ST', 'O', 0),
+),
+    'GOL': (\
+        None,
+        ('action_code', None, 'ID', 'R', 0),
+        ('action_datetime', datetransform, 'TS', 'R', 0),
+        ('goal_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('goal_instance_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('episode_of_care_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('goal_list_priority', numtransform, 'NM', 'O', 0),
+        ('goal_established_datetime', datetransform, 'TS', 'O', 0),
+        ('expected_goal_achieve_datetime', datetransform, 'TS', 'O', 0),
+        ('goal_classification', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('goal_management_discipline', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('current_goal_review_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('current_goal_review_datetime', datetransform, 'TS', 'O', 0),
+        ('next_goal_review_datetime', datetransform, 'TS', 'O', 0),
+        ('previous_goal_review_datetime', datetransform, 'TS', 'O', 0),
+        ('goal_review_interval', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('goal_evaluation', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('goal_evaluation_comment', None, 'ST', 'O', -1),
+        ('goal_life_cycle_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('goal_life_cycle_status_datetime', datetransform, 'TS', 'O', 0),
+        ('goal_target_type', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('goal_target_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+),
+    'GP1': (\
+        None,
+        ('type_of_bill_code', None, 'IS', 'R', 0),
+        ('revenue_code', None, 'IS', 'O', -1),
+        ('overall_claim_disposition_code', None, 'IS', 'O', 0),
+        ('oce_edits_per_visit_code', None, 'IS', 'O', -1),
+        ('outlier_cost', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+),
+    'GP2': (\
+        None,
+        ('revenue_code', None, 'IS', 'O', 0),
+        ('number_of_service_units', numtransform, 'NM', 'O', 0),
+        ('charge', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('reimbursement_action_code', None, 'IS', 'O', 0),
+        ('denial_or_rejection_code', None, 'IS', 'O', 0),
+        ('oce_edit_code', None, 'IS', 'O', -1),
+        ('ambulatory_payment_classification_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('modifier_edit_code', None, 'IS', 'O', -1),
+        ('payment_adjustment_code', None, 'IS', 'O', 0),
+        ('packaging_status_code', None, 'IS', 'O', 0),
+        ('expected_cms_payment_amount', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('reimbursement_type_code', None, 'IS', 'O', 0),
+        ('co_pay_amount', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('pay_rate_per_service_unit', numtransform, 'NM', 'O', 0),
+),
+    'GT1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('guarantor_number', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('guarantor_name', compositetrans.fieldtransformXPN, 'XPN', 'R', -1),
+        ('guarantor_spouse_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('guarantor_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('guarantor_ph_num_home', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('guarantor_ph_num_business', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('guarantor_datetime_of_birth', datetransform, 'TS', 'O', 0),
+        ('guarantor_administrative_sex', None, 'IS', 'O', 0),
+        ('guarantor_type', None, 'IS', 'O', 0),
+        ('guarantor_relationship', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('guarantor_ssn', None, 'ST', 'O', 0),
+        ('guarantor_date_begin', datetransform, 'DT', 'O', 0),
+        ('guarantor_date_end', datetransform, 'DT', 'O', 0),
+        ('guarantor_priority', numtransform, 'NM', 'O', 0),
+        ('guarantor_employer_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('guarantor_employer_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('guarantor_employer_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('guarantor_employee_id_number', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('guarantor_employment_status', None, 'IS', 'O', 0),
+        ('guarantor_organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('guarantor_billing_hold_flag', None, 'ID', 'O', 0),
+        ('guarantor_credit_rating_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('guarantor_death_date_and_time', datetransform, 'TS', 'O', 0),
+        ('guarantor_death_flag', None, 'ID', 'O', 0),
+        ('guarantor_charge_adjustment_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('guarantor_household_annual_income', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('guarantor_household_size', numtransform, 'NM', 'O', 0),
+        ('guarantor_employer_id_number', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('guarantor_marital_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('guarantor_hire_effective_date', datetransform, 'DT', 'O', 0),
+        ('employment_stop_date', datetransform, 'DT', 'O', 0),
+        ('living_dependency', None, 'IS', 'O', 0),
+        ('ambulatory_status', None, 'IS', 'O', -1),
+        ('citizenship', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('primary_language', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('living_arrangement', None, 'IS', 'O', 0),
+        ('publicity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('protection_indicator', None, 'ID', 'O', 0),
+        ('student_indicator', None, 'IS', 'O', 0),
+        ('religion', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('mothers_maiden_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('nationality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ethnic_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('contact_persons_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('contact_persons_telephone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('contact_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('contact_relationship', None, 'IS', 'O', 0),
+        ('job_title', None, 'ST', 'O', 0),
+        ('job_codeclass', compositetrans.fieldtransformJCC, 'JCC', 'O', 0),
+        ('guarantor_employers_organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('handicap', None, 'IS', 'O', 0),
+        ('job_status', None, 'IS', 'O', 0),
+        ('guarantor_financial_class', compositetrans.fieldtransformFC, 'FC', 'O', 0),
+        ('guarantor_race', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('guarantor_birth_place', None, 'ST', 'O', 0),
+        ('vip_indicator', None, 'IS', 'O', 0),
+),
+    'IAM': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('allergen_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergen_codemnemonicdescription', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('allergy_severity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergy_reaction_code', None, 'ST', 'O', -1),
+        ('allergy_action_code', compositetrans.fieldtransformCNE, 'CNE', 'R', 0),
+        ('allergy_unique_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('action_reason', None, 'ST', 'O', 0),
+        ('sensitivity_to_causative_agent_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergen_group_codemnemonicdescription', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('onset_date', datetransform, 'DT', 'O', 0),
+        ('onset_date_text', None, 'ST', 'O', 0),
+        ('reported_datetime', datetransform, 'TS', 'O', 0),
+        ('reported_by', compositetrans.fieldtransformXPN, 'XPN', 'O', 0),
+        ('relationship_to_patient_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('alert_device_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('allergy_clinical_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('statused_by_person', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('statused_by_organization', compositetrans.fieldtransformXON, 'XON', 'O', 0),
+        ('statused_at_datetime', datetransform, 'TS', 'O', 0),
+),
+    'IIM': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('service_item_code', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('inventory_lot_number', None, 'ST', 'O', 0),
+        ('inventory_expiration_date', datetransform, 'TS', 'O', 0),
+        ('inventory_manufacturer_name', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('inventory_location', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('inventory_received_date', datetransform, 'TS', 'O', 0),
+        ('inventory_received_quantity', numtransform, 'NM', 'O', 0),
+        ('inventory_received_quantity_unit', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('inventory_received_item_cost', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('inventory_on_hand_date', datetransform, 'TS', 'O', 0),
+        ('inventory_on_hand_quantity', numtransform, 'NM', 'O', 0),
+        ('inventory_on_hand_quantity_unit', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('procedure_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('procedure_code_modifier', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+),
+    'IN1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('insurance_plan_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('insurance_company_id', compositetrans.fieldtransformCX, 'CX', 'R', -1),
+        ('insurance_company_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('insurance_company_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('insurance_co_contact_person', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('insurance_co_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('group_number', None, 'ST', 'O', 0),
+        ('group_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('insureds_group_emp_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('insureds_group_emp_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('plan_effective_date', datetransform, 'DT', 'O', 0),
+        ('plan_expiration_date', datetransform, 'DT', 'O', 0),
+        ('authorization_information', compositetrans.fieldtransformAUI, 'AUI', 'O', 0),
+        ('plan_type', None, 'IS', 'O', 0),
+        ('name_of_insured', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('insureds_relationship_to_patient', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insureds_date_of_birth', datetransform, 'TS', 'O', 0),
+        ('insureds_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('assignment_of_benefits', None, 'IS', 'O', 0),
+        ('coordination_of_benefits', None, 'IS', 'O', 0),
+        ('coord_of_ben_priority', None, 'ST', 'O', 0),
+        ('notice_of_admission_flag', None, 'ID', 'O', 0),
+        ('notice_of_admission_date', datetransform, 'DT', 'O', 0),
+        ('report_of_eligibility_flag', None, 'ID', 'O', 0),
+        ('report_of_eligibility_date', datetransform, 'DT', 'O', 0),
+        ('release_information_code', None, 'IS', 'O', 0),
+        ('pre_admit_cert_pac', None, 'ST', 'O', 0),
+        ('verification_datetime', datetransform, 'TS', 'O', 0),
+        ('verification_by', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('type_of_agreement_code', None, 'IS', 'O', 0),
+        ('billing_status', None, 'IS', 'O', 0),
+        ('lifetime_reserve_days', numtransform, 'NM', 'O', 0),
+        ('delay_before_lr_day', numtransform, 'NM', 'O', 0),
+        ('company_plan_code', None, 'IS', 'O', 0),
+        ('policy_number', None, 'ST', 'O', 0),
+        ('policy_deductible', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('policy_limit_amount', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('policy_limit_days', numtransform, 'NM', 'O', 0),
+        ('room_rate_semi_private', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('room_rate_private', compositetrans.fieldtransformCP, 'CP', 'O', 0),
+        ('insureds_employment_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insureds_administrative_sex', None, 'IS', 'O', 0),
+        ('insureds_employers_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('verification_status', None, 'ST', 'O', 0),
+        ('prior_insurance_plan_id', None, 'IS', 'O', 0),
+        ('coverage_type', None, 'IS', 'O', 0),
+        ('handicap', None, 'IS', 'O', 0),
+        ('insureds_id_number', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('signature_code', None, 'IS', 'O', 0),
+        ('signature_code_date', datetransform, 'DT', 'O', 0),
+        ('insureds_birth_place', None, 'ST', 'O', 0),
+        ('vip_indicator', None, 'IS', 'O', 0),
+),
+    'IN2': (\
+        None,
+        ('insureds_employee_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('insureds_social_security_number', None, 'ST', 'O', 0),
+        ('insureds_employers_name_and_id', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('employer_information_data', None, 'IS', 'O', 0),
+        ('mail_claim_party', None, 'IS', 'O', -1),
+        ('medicare_health_ins_card_number', None, 'ST', 'O', 0),
+        ('medicaid_case_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('medicaid_case_number', None, 'ST', 'O', 0),
+        ('military_sponsor_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('military_id_number', None, 'ST', 'O', 0),
+        ('dependent_of_military_recipient', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('military_organization', None, 'ST', 'O', 0),
+        ('military_station', None, 'ST', 'O', 0),
+        ('military_service', None, 'IS', 'O', 0),
+        ('military_rankgrade', None, 'IS', 'O', 0),
+        ('military_status', None, 'IS', 'O', 0),
+        ('military_retire_date', datetransform, 'DT', 'O', 0),
+        ('military_non_avail_cert_on_file', None, 'ID', 'O', 0),
+        ('baby_coverage', None, 'ID', 'O', 0),
+        ('combine_baby_bill', None, 'ID', 'O', 0),
+        ('blood_deductible', None, 'ST', 'O', 0),
+        ('special_coverage_approval_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('special_coverage_approval_title', None, 'ST', 'O', 0),
+        ('non_covered_insurance_code', None, 'IS', 'O', -1),
+        ('payor_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('payor_subscriber_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('eligibility_source', None, 'IS', 'O', 0),
+        ('room_coverage_typeamount', compositetrans.fieldtransformRMC, 'RMC', 'O', -1),
+        ('policy_typeamount', compositetrans.fieldtransformPTA, 'PTA', 'O', -1),
+        ('daily_deductible', compositetrans.fieldtransformDDI, 'DDI', 'O', 0),
+        ('living_dependency', None, 'IS', 'O', 0),
+        ('ambulatory_status', None, 'IS', 'O', -1),
+        ('citizenship', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('primary_language', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('living_arrangement', None, 'IS', 'O', 0),
+        ('publicity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('protection_indicator', None, 'ID', 'O', 0),
+        ('student_indicator', None, 'IS', 'O', 0),
+        ('religion', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('mothers_maiden_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('nationality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ethnic_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('marital_status', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('insureds_employment_start_date', datetransform, 'DT', 'O', 0),
+        ('employment_stop_date', datetransform, 'DT', 'O', 0),
+        ('job_title', None, 'ST', 'O', 0),
+        ('job_codeclass', compositetrans.fieldtransformJCC, 'JCC', 'O', 0),
+        ('job_status', None, 'IS', 'O', 0),
+        ('employer_contact_person_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('employer_contact_person_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('employer_contact_reason', None, 'IS', 'O', 0),
+        ('insureds_contact_persons_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('insureds_contact_person_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('insureds_contact_person_reason', None, 'IS', 'O', -1),
+        ('relationship_to_the_patient_start_date', datetransform, 'DT', 'O', 0),
+        ('relationship_to_the_patient_stop_date', datetransform, 'DT', 'O', -1),
+        ('insurance_co_contact_reason', None, 'IS', 'O', 0),
+        ('insurance_co_contact_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('policy_scope', None, 'IS', 'O', 0),
+        ('policy_source', None, 'IS', 'O', 0),
+        ('patient_member_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('guarantors_relationship_to_insured', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('insureds_phone_number_home', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('insureds_employer_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('military_handicapped_program', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('suspend_flag', None, 'ID', 'O', 0),
+        ('copay_limit_flag', None, 'ID', 'O', 0),
+        ('stoploss_limit_flag', None, 'ID', 'O', 0),
+        ('insured_organization_name_and_id', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('insured_employer_organization_name_and_id', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('race', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('cms_patients_relationship_to_insured', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'IN3': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('certification_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('certified_by', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('certification_required', None, 'ID', 'O', 0),
+        ('penalty', compositetrans.fieldtransformMOP, 'MOP', 'O', 0),
+        ('certification_datetime', datetransform, 'TS', 'O', 0),
+        ('certification_modify_datetime', datetransform, 'TS', 'O', 0),
+        ('operator', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('certification_begin_date', datetransform, 'DT', 'O', 0),
+        ('certification_end_date', datetransform, 'DT', 'O', 0),
+        ('days', compositetrans.fieldtransformDTN, 'DTN', 'O', 0),
+        ('non_concur_codedescription', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('non_concur_effective_datetime', datetransform, 'TS', 'O', 0),
+        ('physician_reviewer', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('certification_contact', None, 'ST', 'O', 0),
+        ('certification_contact_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('appeal_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('certification_agency', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('certification_agency_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('pre_certification_requirement', compositetrans.fieldtransformICD, 'ICD', 'O', -1),
+        ('case_manager', None, 'ST', 'O', 0),
+        ('second_opinion_date', datetransform, 'DT', 'O', 0),
+        ('second_opinion_status', None, 'IS', 'O', 0),
+        ('second_opinion_documentation_received', None, 'IS', 'O', -1),
+        ('second_opinion_physician', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+),
+    'INV': (\
+        None,
+        ('substance_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('substance_status', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('substance_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('inventory_container_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('container_carrier_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('position_on_carrier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('initial_quantity', numtransform, 'NM', 'O', 0),
+        ('current_quantity', numtransform, 'NM', 'O', 0),
+        ('available_quantity', numtransform, 'NM', 'O', 0),
+        ('consumption_quantity', numtransform, 'NM', 'O', 0),
+        ('quantity_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('expiration_datetime', datetransform, 'TS', 'O', 0),
+        ('first_used_datetime', datetransform, 'TS', 'O', 0),
+        ('on_board_stability_duration', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('testfluid_identifiers', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('manufacturer_lot_number', None, 'ST', 'O', 0),
+        ('manufacturer_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('supplier_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('on_board_stability_time', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('target_value', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+),
+    'IPC': (\
+        None,
+        ('accession_identifier', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('requested_procedure_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('study_instance_uid', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('scheduled_procedure_step_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('modality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('protocol_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('scheduled_station_name', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('scheduled_procedure_step_location', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('scheduled_ae_title', None, 'ST', 'O', 0),
+),
+    'ISD': (\
+        None,
+        ('reference_interaction_number_unique_identifier', numtransform, 'NM', 'R', 0),
+        ('interaction_type_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('interaction_active_state', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+),
+    'LAN': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('language_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('language_ability_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('language_proficiency_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'LCC': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('location_department', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('accommodation_type', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('charge_code', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+),
+    'LCH': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('segment_unique_key', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('location_characteristic_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('location_characteristic_value', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+),
+    'LDP': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('location_department', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('location_service', None, 'IS', 'O', -1),
+        ('specialty_type', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('valid_patient_classes', None, 'IS', 'O', -1),
+        ('activeinactive_flag', None, 'ID', 'O', 0),
+        ('activation_date', datetransform, 'TS', 'O', 0),
+        ('inactivation_date', datetransform, 'TS', 'O', 0),
+        ('inactivated_reason', None, 'ST', 'O', 0),
+        ('visiting_hours', compositetrans.fieldtransformVH, 'VH', 'O', -1),
+        ('contact_phone', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('location_cost_center', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'LOC': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('location_description', None, 'ST', 'O', 0),
+        ('location_type', None, 'IS', 'R', -1),
+        ('organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('location_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('location_phone', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('license_number', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('location_equipment', None, 'IS', 'O', -1),
+        ('location_service_code', None, 'IS', 'O', 0),
+),
+    'LRL': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('segment_unique_key', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('location_relationship_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('organizational_location_relationship_value', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('patient_location_relationship_value', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+),
+    'MFA': (\
+        None,
+        ('record_level_event_code', None, 'ID', 'R', 0),
+        ('mfn_control_id', None, 'ST', 'O', 0),
+        ('event_completion_datetime', datetransform, 'TS', 'O', 0),
+        ('mfn_record_level_error_return', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('primary_key_value', None, 'ST', 'R', -1),
+        ('primary_key_value_type', None, 'ID', 'R', -1),
+),
+    'MFE': (\
+        None,
+        ('record_level_event_code', None, 'ID', 'R', 0),
+        ('mfn_control_id', None, 'ST', 'O', 0),
+        ('effective_datetime', datetransform, 'TS', 'O', 0),
+        ('primary_key_value', None, 'ST', 'R', -1),
+        ('primary_key_value_type', None, 'ID', 'R', -1),
+),
+    'MFI': (\
+        None,
+        ('master_file_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('master_file_application_identifier', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('file_level_event_code', None, 'ID', 'R', 0),
+        ('entered_datetime', datetransform, 'TS', 'O', 0),
+        ('effective_datetime', datetransform, 'TS', 'O', 0),
+        ('response_level_code', None, 'ID', 'R', 0),
+),
+    'MRG': (\
+        None,
+        ('prior_patient_identifier_list', compositetrans.fieldtransformCX, 'CX', 'R', -1),
+        ('prior_alternate_patient_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('prior_patient_account_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('prior_patient_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('prior_visit_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('prior_alternate_visit_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('prior_patient_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+),
+    'MSA': (\
+        None,
+        ('acknowledgment_code', None, 'ID', 'R', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('text_message', None, 'ST', 'O', 0),
+        ('expected_sequence_number', numtransform, 'NM', 'O', 0),
+        ('delayed_acknowledgment_type', None, 'ID', 'O', 0),
+        ('error_condition', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'MSH': (\
+        ('field_separator', None, 'ST', 'R', 0),
+        ('encoding_characters', None, 'ST', 'R', 0),
+        ('sending_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('sending_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('receiving_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('receiving_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('datetime_of_message', datetransform, 'TS', 'R', 0),
+        ('security', None, 'ST', 'O', 0),
+        ('message_type', compositetrans.fieldtransformMSG, 'MSG', 'R', 0),
+        ('message_control_id', None, 'ST', 'R', 0),
+        ('processing_id', compositetrans.fieldtransformPT, 'PT', 'R', 0),
+        ('version_id', compositetrans.fieldtransformVID, 'VID', 'R', 0),
+        ('sequence_number', numtransform, 'NM', 'O', 0),
+        ('continuation_pointer', None, 'ST', 'O', 0),
+        ('accept_acknowledgment_type', None, 'ID', 'O', 0),
+        ('application_acknowledgment_type', None, 'ID', 'O', 0),
+        ('country_code', None, 'ID', 'O', 0),
+        ('character_set', None, 'ID', 'O', -1),
+        ('principal_language_of_message', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('alternate_character_set_handling_scheme', None, 'ID', 'O', 0),
+        ('message_profile_identifier', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+),
+    'NCK': (\
+        None,
+        ('system_datetime', datetransform, 'TS', 'R', 0),
+),
+    'NDS': (\
+        None,
+        ('notification_reference_number', numtransform, 'NM', 'R', 0),
+        ('notification_datetime', datetransform, 'TS', 'R', 0),
+        ('notification_alert_severity', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('notification_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+),
+    'NK1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('relationship', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('business_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('contact_role', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('start_date', datetransform, 'DT', 'O', 0),
+        ('end_date', datetransform, 'DT', 'O', 0),
+        ('next_of_kinassociated_parties_job_title', None, 'ST', 'O', 0),
+        ('next_of_kinassociated_parties_job_codeclass', compositetrans.fieldtransformJCC, 'JCC', 'O', 0),
+        ('next_of_kinassociated_parties_employee_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('marital_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administrative_sex', None, 'IS', 'O', 0),
+        ('datetime_of_birth', datetransform, 'TS', 'O', 0),
+        ('living_dependency', None, 'IS', 'O', -1),
+        ('ambulatory_status', None, 'IS', 'O', -1),
+        ('citizenship', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('primary_language', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('living_arrangement', None, 'IS', 'O', 0),
+        ('publicity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('protection_indicator', None, 'ID', 'O', 0),
+        ('student_indicator', None, 'IS', 'O', 0),
+        ('religion', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('mothers_maiden_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('nationality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ethnic_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('contact_reason', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('contact_persons_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('contact_persons_telephone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('contact_persons_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('next_of_kinassociated_partys_identifiers', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('job_status', None, 'IS', 'O', 0),
+        ('race', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('handicap', None, 'IS', 'O', 0),
+        ('contact_person_social_security_number', None, 'ST', 'O', 0),
+        ('next_of_kin_birth_place', None, 'ST', 'O', 0),
+        ('vip_indicator', None, 'IS', 'O', 0),
+),
+    'NPU': (\
+        None,
+        ('bed_location', compositetrans.fieldtransformPL, 'PL', 'R', 0),
+        ('bed_status', None, 'IS', 'O', 0),
+),
+    'NSC': (\
+        None,
+        ('application_change_type', None, 'IS', 'R', 0),
+        ('current_cpu', None, 'ST', 'O', 0),
+        ('current_fileserver', None, 'ST', 'O', 0),
+        ('current_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('current_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('new_cpu', None, 'ST', 'O', 0),
+        ('new_fileserver', None, 'ST', 'O', 0),
+        ('new_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('new_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+),
+    'NST': (\
+        None,
+        ('statistics_available', None, 'ID', 'R', 0),
+        ('source_identifier', None, 'ST', 'O', 0),
+        ('source_type', None, 'ID', 'O', 0),
+        ('statistics_start', datetransform, 'TS', 'O', 0),
+        ('statistics_end', datetransform, 'TS', 'O', 0),
+        ('receive_character_count', numtransform, 'NM', 'O', 0),
+        ('send_character_count', numtransform, 'NM', 'O', 0),
+        ('messages_received', numtransform, 'NM', 'O', 0),
+        ('messages_sent', numtransform, 'NM', 'O', 0),
+        ('checksum_errors_received', numtransform, 'NM', 'O', 0),
+        ('length_errors_received', numtransform, 'NM', 'O', 0),
+        ('other_errors_received', numtransform, 'NM', 'O', 0),
+        ('connect_timeouts', numtransform, 'NM', 'O', 0),
+        ('receive_timeouts', numtransform, 'NM', 'O', 0),
+        ('application_control_level_errors', numtransform, 'NM', 'O', 0),
+),
+    'NTE': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('source_of_comment', None, 'ID', 'O', 0),
+        ('comment', None, 'FT', 'O', -1),
+        ('comment_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'OBR': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('placer_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('universal_service_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('priority', None, 'ID', 'O', 0),
+        ('requested_datetime', datetransform, 'TS', 'O', 0),
+        ('observation_datetime', datetransform, 'TS', 'O', 0),
+        ('observation_end_datetime', datetransform, 'TS', 'O', 0),
+        ('collection_volume', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('collector_identifier', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('specimen_action_code', None, 'ID', 'O', 0),
+        ('danger_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('relevant_clinical_information', None, 'ST', 'O', 0),
+        ('specimen_received_datetime', datetransform, 'TS', 'O', 0),
+        ('specimen_source', compositetrans.fieldtransformSPS, 'SPS', 'O', 0),
+        ('ordering_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('order_callback_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('placer_field_1', None, 'ST', 'O', 0),
+        ('placer_field_2', None, 'ST', 'O', 0),
+        ('filler_field_1', None, 'ST', 'O', 0),
+        ('filler_field_2', None, 'ST', 'O', 0),
+        ('results_rptstatus_chng_datetime', datetransform, 'TS', 'O', 0),
+        ('charge_to_practice', compositetrans.fieldtransformMOC, 'MOC', 'O', 0),
+        ('diagnostic_serv_sect_id', None, 'ID', 'O', 0),
+        ('result_status', None, 'ID', 'O', 0),
+        ('parent_result', compositetrans.fieldtransformPRL, 'PRL', 'O', 0),
+        ('quantitytiming', compositetrans.fieldtransformTQ, 'TQ', 'O', -1),
+        ('result_copies_to', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('parent', compositetrans.fieldtransformEIP, 'EIP', 'O', 0),
+        ('transportation_mode', None, 'ID', 'O', 0),
+        ('reason_for_study', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('principal_result_interpreter', compositetrans.fieldtransformNDL, 'NDL', 'O', 0),
+        ('assistant_result_interpreter', compositetrans.fieldtransformNDL, 'NDL', 'O', -1),
+        ('technician', compositetrans.fieldtransformNDL, 'NDL', 'O', -1),
+        ('transcriptionist', compositetrans.fieldtransformNDL, 'NDL', 'O', -1),
+        ('scheduled_datetime', datetransform, 'TS', 'O', 0),
+        ('number_of_sample_containers_', numtransform, 'NM', 'O', 0),
+        ('transport_logistics_of_collected_sample', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('collectors_comment_', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('transport_arrangement_responsibility', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('transport_arranged', None, 'ID', 'O', 0),
+        ('escort_required', None, 'ID', 'O', 0),
+        ('planned_patient_transport_comment', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('procedure_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('procedure_code_modifier', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('placer_supplemental_service_information', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('filler_supplemental_service_information', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('medically_necessary_duplicate_procedure_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('result_handling', None, 'IS', 'O', 0),
+),
+    'OBX': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('value_type', None, 'ID', 'O', 0),
+        ('observation_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('observation_sub_id', None, 'ST', 'O', 0),
+        ('observation_value', None, 'ST', 'O', -1),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('references_range', None, 'ST', 'O', 0),
+        ('abnormal_flags', None, 'IS', 'O', -1),
+        ('probability', numtransform, 'NM', 'O', 0),
+        ('nature_of_abnormal_test', None, 'ID', 'O', -1),
+        ('observation_result_status', None, 'ID', 'R', 0),
+        ('effective_date_of_reference_range', datetransform, 'TS', 'O', 0),
+        ('user_defined_access_checks', None, 'ST', 'O', 0),
+        ('datetime_of_the_observation', datetransform, 'TS', 'O', 0),
+        ('producers_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('responsible_observer', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('observation_method', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('equipment_instance_identifier', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('datetime_of_the_analysis', datetransform, 'TS', 'O', 0),
+),
+    'ODS': (\
+        None,
+        ('type', None, 'ID', 'R', 0),
+        ('service_period', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('diet_supplement_or_preference_code', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('text_instruction', None, 'ST', 'O', -1),
+),
+    'ODT': (\
+        None,
+        ('tray_type', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('service_period', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('text_instruction', None, 'ST', 'O', 0),
+),
+    'OM1': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'R', 0),
+        ('producers_servicetestobservation_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('permitted_data_types', None, 'ID', 'O', -1),
+        ('specimen_required', None, 'ID', 'R', 0),
+        ('producer_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('observation_description', None, 'TX', 'O', 0),
+        ('other_servicetestobservation_ids_for_the_observation', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('other_names', None, 'ST', 'R', -1),
+        ('preferred_report_name_for_the_observation', None, 'ST', 'O', 0),
+        ('preferred_short_name_or_mnemonic_for_observation', None, 'ST', 'O', 0),
+        ('preferred_long_name_for_the_observation', None, 'ST', 'O', 0),
+        ('orderability', None, 'ID', 'O', 0),
+        ('identity_of_instrument_used_to_perform_this_study', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('coded_representation_of_method', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('portable_device_indicator', None, 'ID', 'O', 0),
+        ('observation_producing_departmentsection', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('telephone_number_of_section', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('nature_of_servicetestobservation', None, 'IS', 'R', 0),
+        ('report_subheader', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('report_display_order', None, 'ST', 'O', 0),
+        ('datetime_stamp_for_any_change_in_definition_for_the_observation', datetransform, 'TS', 'O', 0),
+        ('effective_datetime_of_change', datetransform, 'TS', 'O', 0),
+        ('typical_turn_around_time', numtransform, 'NM', 'O', 0),
+        ('processing_time', numtransform, 'NM', 'O', 0),
+        ('processing_priority', None, 'ID', 'O', -1),
+        ('reporting_priority', None, 'ID', 'O', 0),
+        ('outside_sites_where_observation_may_be_performed', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('address_of_outside_sites', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('phone_number_of_outside_site', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('confidentiality_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('observations_required_to_interpret_the_observation', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('interpretation_of_observations', None, 'TX', 'O', 0),
+        ('contraindications_to_observations', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('reflex_testsobservations', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('rules_that_trigger_reflex_testing', None, 'TX', 'O', 0),
+        ('fixed_canned_message', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('patient_preparation', None, 'TX', 'O', 0),
+        ('procedure_medication', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('factors_that_may_affect_the_observation', None, 'TX', 'O', 0),
+        ('servicetestobservation_performance_schedule', None, 'ST', 'O', -1),
+        ('description_of_test_methods', None, 'TX', 'O', 0),
+        ('kind_of_quantity_observed', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('point_versus_interval', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('challenge_information', None, 'TX', 'O', 0),
+        ('relationship_modifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('target_anatomic_site_of_test', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('modality_of_imaging_measurement', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'OM2': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'O', 0),
+        ('units_of_measure', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('range_of_decimal_precision', numtransform, 'NM', 'O', -1),
+        ('corresponding_si_units_of_measure', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('si_conversion_factor', None, 'TX', 'O', 0),
+        ('reference_normal_range_ordinal_and_continuous_observations', compositetrans.fieldtransformRFR, 'RFR', 'O', -1),
+        ('critical_range_for_ordinal_and_continuous_observations', compositetrans.fieldtransformRFR, 'RFR', 'O', -1),
+        ('absolute_range_for_ordinal_and_continuous_observations', compositetrans.fieldtransformRFR, 'RFR', 'O', 0),
+        ('delta_check_criteria', compositetrans.fieldtransformDLT, 'DLT', 'O', -1),
+        ('minimum_meaningful_increments', numtransform, 'NM', 'O', 0),
+),
+    'OM3': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'O', 0),
+        ('preferred_coding_system', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('valid_coded_answers', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('normal_textcodes_for_categorical_observations', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('abnormal_textcodes_for_categorical_observations', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('critical_textcodes_for_categorical_observations', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('value_type', None, 'ID', 'O', 0),
+),
+    'OM4': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'O', 0),
+        ('derived_specimen', None, 'ID', 'O', 0),
+        ('container_description', None, 'TX', 'O', 0),
+        ('container_volume', numtransform, 'NM', 'O', 0),
+        ('container_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('specimen', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('additive', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('preparation', None, 'TX', 'O', 0),
+        ('special_handling_requirements', None, 'TX', 'O', 0),
+        ('normal_collection_volume', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('minimum_collection_volume', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('specimen_requirements', None, 'TX', 'O', 0),
+        ('specimen_priorities', None, 'ID', 'O', -1),
+        ('specimen_retention_time', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+),
+    'OM5': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'O', 0),
+        ('testobservations_included_within_an_ordered_test_battery', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('observation_id_suffixes', None, 'ST', 'O', 0),
+),
+    'OM6': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'O', 0),
+        ('derivation_rule', None, 'TX', 'O', 0),
+),
+    'OM7': (\
+        None,
+        ('sequence_number_testobservation_master_file', numtransform, 'NM', 'R', 0),
+        ('universal_service_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('category_identifier', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('category_description', None, 'TX', 'O', 0),
+        ('category_synonym', None, 'ST', 'O', -1),
+        ('effective_testservice_start_datetime', datetransform, 'TS', 'O', 0),
+        ('effective_testservice_end_datetime', datetransform, 'TS', 'O', 0),
+        ('testservice_default_duration_quantity', numtransform, 'NM', 'O', 0),
+        ('testservice_default_duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('testservice_default_frequency', None, 'IS', 'O', 0),
+        ('consent_indicator', None, 'ID', 'O', 0),
+        ('consent_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('consent_effective_start_datetime', datetransform, 'TS', 'O', 0),
+        ('consent_effective_end_datetime', datetransform, 'TS', 'O', 0),
+        ('consent_interval_quantity', numtransform, 'NM', 'O', 0),
+        ('consent_interval_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('consent_waiting_period_quantity', numtransform, 'NM', 'O', 0),
+        ('consent_waiting_period_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('effective_datetime_of_change', datetransform, 'TS', 'O', 0),
+        ('entered_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('orderable_at_location', compositetrans.fieldtransformPL, 'PL', 'O', -1),
+        ('formulary_status', None, 'IS', 'O', 0),
+        ('special_order_indicator', None, 'ID', 'O', 0),
+        ('primary_key_value', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+),
+    'ORC': (\
+        None,
+        ('order_control', None, 'ID', 'R', 0),
+        ('placer_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('placer_group_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('order_status', None, 'ID', 'O', 0),
+        ('response_flag', None, 'ID', 'O', 0),
+        ('quantitytiming', compositetrans.fieldtransformTQ, 'TQ', 'O', -1),
+        ('parent', compositetrans.fieldtransformEIP, 'EIP', 'O', 0),
+        ('datetime_of_transaction', datetransform, 'TS', 'O', 0),
+        ('entered_by', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('verified_by', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('ordering_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('enterers_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('call_back_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('order_effective_datetime', datetransform, 'TS', 'O', 0),
+        ('order_control_code_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('entering_organization', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('entering_device', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('action_by', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('advanced_beneficiary_notice_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ordering_facility_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('ordering_facility_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('ordering_facility_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('ordering_provider_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('order_status_modifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('advanced_beneficiary_notice_override_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('fillers_expected_availability_datetime', datetransform, 'TS', 'O', 0),
+        ('confidentiality_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('order_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('enterer_authorization_mode', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+),
+    'ORG': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('organization_unit_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('organization_unit_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('primary_org_unit_indicator', None, 'ID', 'O', 0),
+        ('practitioner_org_unit_identifier', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('health_care_provider_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('health_care_provider_classification_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('health_care_provider_area_of_specialization_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('effective_date_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('employment_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('board_approval_indicator', None, 'ID', 'O', 0),
+        ('primary_care_physician_indicator', None, 'ID', 'O', 0),
+),
+    'OVR': (\
+        None,
+        ('business_rule_override_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('business_rule_override_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('override_comments', None, 'TX', 'O', 0),
+        ('override_entered_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('override_authorized_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+),
+    'PCR': (\
+        None,
+        ('implicated_product', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('generic_product', None, 'IS', 'O', 0),
+        ('product_class', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('total_duration_of_therapy', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('product_manufacture_date', datetransform, 'TS', 'O', 0),
+        ('product_expiration_date', datetransform, 'TS', 'O', 0),
+        ('product_implantation_date', datetransform, 'TS', 'O', 0),
+        ('product_explantation_date', datetransform, 'TS', 'O', 0),
+        ('single_use_device', None, 'IS', 'O', 0),
+        ('indication_for_product_use', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('product_problem', None, 'IS', 'O', 0),
+        ('product_seriallot_number', None, 'ST', 'O', -1),
+        ('product_available_for_inspection', None, 'IS', 'O', 0),
+        ('product_evaluation_performed', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('product_evaluation_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('product_evaluation_results', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('evaluated_product_source', None, 'ID', 'O', 0),
+        ('date_product_returned_to_manufacturer', datetransform, 'TS', 'O', 0),
+        ('device_operator_qualifications', None, 'ID', 'O', 0),
+        ('relatedness_assessment', None, 'ID', 'O', 0),
+        ('action_taken_in_response_to_the_event', None, 'ID', 'O', -1),
+        ('event_causality_observations', None, 'ID', 'O', -1),
+        ('indirect_exposure_mechanism', None, 'ID', 'O', -1),
+),
+    'PD1': (\
+        None,
+        ('living_dependency', None, 'IS', 'O', -1),
+        ('living_arrangement', None, 'IS', 'O', 0),
+        ('patient_primary_facility', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('patient_primary_care_provider_name_id_no', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('student_indicator', None, 'IS', 'O', 0),
+        ('handicap', None, 'IS', 'O', 0),
+        ('living_will_code', None, 'IS', 'O', 0),
+        ('organ_donor_code', None, 'IS', 'O', 0),
+        ('separate_bill', None, 'ID', 'O', 0),
+        ('duplicate_patient', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('publicity_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('protection_indicator', None, 'ID', 'O', 0),
+        ('protection_indicator_effective_date', datetransform, 'DT', 'O', 0),
+        ('place_of_worship', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('advance_directive_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('immunization_registry_status', None, 'IS', 'O', 0),
+        ('immunization_registry_status_effective_date', datetransform, 'DT', 'O', 0),
+        ('publicity_code_effective_date', datetransform, 'DT', 'O', 0),
+        ('military_branch', None, 'IS', 'O', 0),
+        ('military_rankgrade', None, 'IS', 'O', 0),
+        ('military_status', None, 'IS', 'O', 0),
+),
+    'PDA': (\
+        None,
+        ('death_cause_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('death_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('death_certified_indicator', None, 'ID', 'O', 0),
+        ('death_certificate_signed_datetime', datetransform, 'TS', 'O', 0),
+        ('death_certified_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('autopsy_indicator', None, 'ID', 'O', 0),
+        ('autopsy_start_and_end_datetime', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('autopsy_performed_by', compositetrans.fieldtransformXCN, 'XCN', 'O', 0),
+        ('coroner_indicator', None, 'ID', 'O', 0),
+),
+    'PDC': (\
+        None,
+        ('manufacturerdistributor', compositetrans.fieldtransformXON, 'XON', 'R', -1),
+        ('country', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('brand_name', None, 'ST', 'R', 0),
+        ('device_family_name', None, 'ST', 'O', 0),
+        ('generic_name', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('model_identifier', None, 'ST', 'O', -1),
+        ('catalogue_identifier', None, 'ST', 'O', 0),
+        ('other_identifier', None, 'ST', 'O', -1),
+        ('product_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('marketing_basis', None, 'ID', 'O', 0),
+        ('marketing_approval_id', None, 'ST', 'O', 0),
+        ('labeled_shelf_life', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('expected_shelf_life', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('date_first_marketed', datetransform, 'TS', 'O', 0),
+        ('date_last_marketed', datetransform, 'TS', 'O', 0),
+),
+    'PEO': (\
+        None,
+        ('event_identifiers_used', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('event_symptomdiagnosis_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('event_onset_datetime', datetransform, 'TS', 'R', 0),
+        ('event_exacerbation_datetime', datetransform, 'TS', 'O', 0),
+        ('event_improved_datetime', datetransform, 'TS', 'O', 0),
+        ('event_ended_datatime', datetransform, 'TS', 'O', 0),
+        ('event_location_occurred_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('event_qualification', None, 'ID', 'O', -1),
+        ('event_serious', None, 'ID', 'O', 0),
+        ('event_expected', None, 'ID', 'O', 0),
+        ('event_outcome', None, 'ID', 'O', -1),
+        ('patient_outcome', None, 'ID', 'O', 0),
+        ('event_description_from_others', None, 'FT', 'O', -1),
+        ('event_from_original_reporter', None, 'FT', 'O', -1),
+        ('event_description_from_patient', None, 'FT', 'O', -1),
+        ('event_description_from_practitioner', None, 'FT', 'O', -1),
+        ('event_description_from_autopsy', None, 'FT', 'O', -1),
+        ('cause_of_death', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('primary_observer_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('primary_observer_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('primary_observer_telephone', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('primary_observers_qualification', None, 'ID', 'O', 0),
+        ('confirmation_provided_by', None, 'ID', 'O', 0),
+        ('primary_observer_aware_datetime', datetransform, 'TS', 'O', 0),
+        ('primary_observers_identity_may_be_divulged', None, 'ID', 'O', 0),
+),
+    'PES': (\
+        None,
+        ('sender_organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('sender_individual_name', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('sender_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('sender_telephone', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('sender_event_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('sender_sequence_number', numtransform, 'NM', 'O', 0),
+        ('sender_event_description', None, 'FT', 'O', -1),
+        ('sender_comment', None, 'FT', 'O', 0),
+        ('sender_aware_datetime', datetransform, 'TS', 'O', 0),
+        ('event_report_date', datetransform, 'TS', 'R', 0),
+        ('event_report_timingtype', None, 'ID', 'O', -1),
+        ('event_report_source', None, 'ID', 'O', 0),
+        ('event_reported_to', None, 'ID', 'O', -1),
+),
+    'PID': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('patient_identifier_list', compositetrans.fieldtransformCX, 'CX', 'R', -1),
+        ('alternate_patient_id', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('patient_name', compositetrans.fieldtransformXPN, 'XPN', 'R', -1),
+        ('mothers_maiden_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('datetime_of_birth', datetransform, 'TS', 'O', 0),
+        ('administrative_sex', None, 'IS', 'O', 0),
+        ('patient_alias', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('race', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('patient_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('county_code', None, 'IS', 'O', 0),
+        ('phone_number_home', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('phone_number_business', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('primary_language', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('marital_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('religion', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('patient_account_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('ssn_number_patient', None, 'ST', 'O', 0),
+        ('drivers_license_number_patient', compositetrans.fieldtransformDLN, 'DLN', 'O', 0),
+        ('mothers_identifier', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('ethnic_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('birth_place', None, 'ST', 'O', 0),
+        ('multiple_birth_indicator', None, 'ID', 'O', 0),
+        ('birth_order', numtransform, 'NM', 'O', 0),
+        ('citizenship', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('veterans_military_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('nationality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('patient_death_date_and_time', datetransform, 'TS', 'O', 0),
+        ('patient_death_indicator', None, 'ID', 'O', 0),
+        ('identity_unknown_indicator', None, 'ID', 'O', 0),
+        ('identity_reliability_code', None, 'IS', 'O', -1),
+        ('last_update_datetime', datetransform, 'TS', 'O', 0),
+        ('last_update_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('species_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('breed_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('strain', None, 'ST', 'O', 0),
+        ('production_class_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('tribal_citizenship', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+),
+    'PR1': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('procedure_coding_method', None, 'IS', 'O', 0),
+        ('procedure_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('procedure_description', None, 'ST', 'O', 0),
+        ('procedure_datetime', datetransform, 'TS', 'R', 0),
+        ('procedure_functional_type', None, 'IS', 'O', 0),
+        ('procedure_minutes', numtransform, 'NM', 'O', 0),
+        ('anesthesiologist', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('anesthesia_code', None, 'IS', 'O', 0),
+        ('anesthesia_minutes', numtransform, 'NM', 'O', 0),
+        ('surgeon', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('procedure_practitioner', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('consent_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('procedure_priority', None, 'ID', 'O', 0),
+        ('associated_diagnosis_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('procedure_code_modifier', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('procedure_drg_type', None, 'IS', 'O', 0),
+        ('tissue_type_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('procedure_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('procedure_action_code', None, 'ID', 'O', 0),
+),
+    'PRA': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('practitioner_group', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('practitioner_category', None, 'IS', 'O', -1),
+        ('provider_billing', None, 'ID', 'O', 0),
+        ('specialty', compositetrans.fieldtransformSPD, 'SPD', 'O', -1),
+        ('practitioner_id_numbers', compositetrans.fieldtransformPLN, 'PLN', 'O', -1),
+        ('privileges', compositetrans.fieldtransformPIP, 'PIP', 'O', -1),
+        ('date_entered_practice', datetransform, 'DT', 'O', 0),
+        ('institution', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('date_left_practice', datetransform, 'DT', 'O', 0),
+        ('government_reimbursement_billing_eligibility', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('set_id', None, 'SI', 'O', 0),
+),
+    'PRB': (\
+        None,
+        ('action_code', None, 'ID', 'R', 0),
+        ('action_datetime', datetransform, 'TS', 'R', 0),
+        ('problem_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('problem_instance_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('episode_of_care_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('problem_list_priority', numtransform, 'NM', 'O', 0),
+        ('problem_established_datetime', datetransform, 'TS', 'O', 0),
+        ('anticipated_problem_resolution_datetime', datetransform, 'TS', 'O', 0),
+        ('actual_problem_resolution_datetime', datetransform, 'TS', 'O', 0),
+        ('problem_classification', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('problem_management_discipline', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('problem_persistence', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('problem_confirmation_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('problem_life_cycle_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('problem_life_cycle_status_datetime', datetransform, 'TS', 'O', 0),
+        ('problem_date_of_onset', datetransform, 'TS', 'O', 0),
+        ('problem_onset_text', None, 'ST', 'O', 0),
+        ('problem_ranking', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('certainty_of_problem', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('probability_of_problem_0_1', numtransform, 'NM', 'O', 0),
+        ('individual_awareness_of_problem', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('problem_prognosis', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('individual_awareness_of_prognosis', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('familysignificant_other_awareness_of_problemprognosis', None, 'ST', 'O', 0),
+        ('securitysensitivity', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'PRC': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('facility_id', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('department', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('valid_patient_classes', None, 'IS', 'O', -1),
+        ('price', compositetrans.fieldtransformCP, 'CP', 'O', -1),
+        ('formula', None, 'ST', 'O', -1),
+        ('minimum_quantity', numtransform, 'NM', 'O', 0),
+        ('maximum_quantity', numtransform, 'NM', 'O', 0),
+        ('minimum_price', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('maximum_price', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('effective_start_date', datetransform, 'TS', 'O', 0),
+        ('effective_end_date', datetransform, 'TS', 'O', 0),
+        ('price_override_flag', None, 'IS', 'O', 0),
+        ('billing_category', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('chargeable_flag', None, 'ID', 'O', 0),
+        ('activeinactive_flag', None, 'ID', 'O', 0),
+        ('cost', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('charge_on_indicator', None, 'IS', 'O', 0),
+),
+    'PRD': (\
+        None,
+        ('provider_role', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('provider_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('provider_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('provider_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('provider_communication_information', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('preferred_method_of_contact', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('provider_identifiers', compositetrans.fieldtransformPLN, 'PLN', 'O', -1),
+        ('effective_start_date_of_provider_role', datetransform, 'TS', 'O', 0),
+        ('effective_end_date_of_provider_role', datetransform, 'TS', 'O', 0),
+),
+    'PSH': (\
+        None,
+        ('report_type', None, 'ST', 'R', 0),
+        ('report_form_identifier', None, 'ST', 'O', 0),
+        ('report_date', datetransform, 'TS', 'R', 0),
+        ('report_interval_start_date', datetransform, 'TS', 'O', 0),
+        ('report_interval_end_date', datetransform, 'TS', 'O', 0),
+        ('quantity_manufactured', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('quantity_distributed', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('quantity_distributed_method', None, 'ID', 'O', 0),
+        ('quantity_distributed_comment', None, 'FT', 'O', 0),
+        ('quantity_in_use', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('quantity_in_use_method', None, 'ID', 'O', 0),
+        ('quantity_in_use_comment', None, 'FT', 'O', 0),
+        ('number_of_product_experience_reports_filed_by_facility', numtransform, 'NM', 'O', -1),
+        ('number_of_product_experience_reports_filed_by_distributor', numtransform, 'NM', 'O', -1),
+),
+    'PTH': (\
+        None,
+        ('action_code', None, 'ID', 'R', 0),
+        ('pathway_id', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('pathway_instance_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('pathway_established_datetime', datetransform, 'TS', 'R', 0),
+        ('pathway_life_cycle_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('change_pathway_life_cycle_status_datetime', datetransform, 'TS', 'O', 0),
+),
+    'PV1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('patient_class', None, 'IS', 'R', 0),
+        ('assigned_patient_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('admission_type', None, 'IS', 'O', 0),
+        ('preadmit_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('prior_patient_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('attending_doctor', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('referring_doctor', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('consulting_doctor', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('hospital_service', None, 'IS', 'O', 0),
+        ('temporary_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('preadmit_test_indicator', None, 'IS', 'O', 0),
+        ('re_admission_indicator', None, 'IS', 'O', 0),
+        ('admit_source', None, 'IS', 'O', 0),
+        ('ambulatory_status', None, 'IS', 'O', -1),
+        ('vip_indicator', None, 'IS', 'O', 0),
+        ('admitting_doctor', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('patient_type', None, 'IS', 'O', 0),
+        ('visit_number', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('financial_class', compositetrans.fieldtransformFC, 'FC', 'O', -1),
+        ('charge_price_indicator', None, 'IS', 'O', 0),
+        ('courtesy_code', None, 'IS', 'O', 0),
+        ('credit_rating', None, 'IS', 'O', 0),
+        ('contract_code', None, 'IS', 'O', -1),
+        ('contract_effective_date', datetransform, 'DT', 'O', -1),
+        ('contract_amount', numtransform, 'NM', 'O', -1),
+        ('contract_period', numtransform, 'NM', 'O', -1),
+        ('interest_code', None, 'IS', 'O', 0),
+        ('transfer_to_bad_debt_code', None, 'IS', 'O', 0),
+        ('transfer_to_bad_debt_date', datetransform, 'DT', 'O', 0),
+        ('bad_debt_agency_code', None, 'IS', 'O', 0),
+        ('bad_debt_transfer_amount', numtransform, 'NM', 'O', 0),
+        ('bad_debt_recovery_amount', numtransform, 'NM', 'O', 0),
+        ('delete_account_indicator', None, 'IS', 'O', 0),
+        ('delete_account_date', datetransform, 'DT', 'O', 0),
+        ('discharge_disposition', None, 'IS', 'O', 0),
+        ('discharged_to_location', compositetrans.fieldtransformDLD, 'DLD', 'O', 0),
+        ('diet_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('servicing_facility', None, 'IS', 'O', 0),
+        ('bed_status', None, 'IS', 'O', 0),
+        ('account_status', None, 'IS', 'O', 0),
+        ('pending_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('prior_temporary_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('admit_datetime', datetransform, 'TS', 'O', 0),
+        ('discharge_datetime', datetransform, 'TS', 'O', -1),
+        ('current_patient_balance', numtransform, 'NM', 'O', 0),
+        ('total_charges', numtransform, 'NM', 'O', 0),
+        ('total_adjustments', numtransform, 'NM', 'O', 0),
+        ('total_payments', numtransform, 'NM', 'O', 0),
+        ('alternate_visit_id', compositetrans.fieldtransformCX, 'CX', 'O', 0),
+        ('visit_indicator', None, 'IS', 'O', 0),
+        ('other_healthcare_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+),
+    'PV2': (\
+        None,
+        ('prior_pending_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('accommodation_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('admit_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('transfer_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('patient_valuables', None, 'ST', 'O', -1),
+        ('patient_valuables_location', None, 'ST', 'O', 0),
+        ('visit_user_code', None, 'IS', 'O', -1),
+        ('expected_admit_datetime', datetransform, 'TS', 'O', 0),
+        ('expected_discharge_datetime', datetransform, 'TS', 'O', 0),
+        ('estimated_length_of_inpatient_stay', numtransform, 'NM', 'O', 0),
+        ('actual_length_of_inpatient_stay', numtransform, 'NM', 'O', 0),
+        ('visit_description', None, 'ST', 'O', 0),
+        ('referral_source_code', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('previous_service_date', datetransform, 'DT', 'O', 0),
+        ('employment_illness_related_indicator', None, 'ID', 'O', 0),
+        ('purge_status_code', None, 'IS', 'O', 0),
+        ('purge_status_date', datetransform, 'DT', 'O', 0),
+        ('special_program_code', None, 'IS', 'O', 0),
+        ('retention_indicator', None, 'ID', 'O', 0),
+        ('expected_number_of_insurance_plans', numtransform, 'NM', 'O', 0),
+        ('visit_publicity_code', None, 'IS', 'O', 0),
+        ('visit_protection_indicator', None, 'ID', 'O', 0),
+        ('clinic_organization_name', compositetrans.fieldtransformXON, 'XON', 'O', -1),
+        ('patient_status_code', None, 'IS', 'O', 0),
+        ('visit_priority_code', None, 'IS', 'O', 0),
+        ('previous_treatment_date', datetransform, 'DT', 'O', 0),
+        ('expected_discharge_disposition', None, 'IS', 'O', 0),
+        ('signature_on_file_date', datetransform, 'DT', 'O', 0),
+        ('first_similar_illness_date', datetransform, 'DT', 'O', 0),
+        ('patient_charge_adjustment_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('recurring_service_code', None, 'IS', 'O', 0),
+        ('billing_media_code', None, 'ID', 'O', 0),
+        ('expected_surgery_date_and_time', datetransform, 'TS', 'O', 0),
+        ('military_partnership_code', None, 'ID', 'O', 0),
+        ('military_non_availability_code', None, 'ID', 'O', 0),
+        ('newborn_baby_indicator', None, 'ID', 'O', 0),
+        ('baby_detained_indicator', None, 'ID', 'O', 0),
+        ('mode_of_arrival_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('recreational_drug_use_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('admission_level_of_care_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('precaution_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('patient_condition_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('living_will_code', None, 'IS', 'O', 0),
+        ('organ_donor_code', None, 'IS', 'O', 0),
+        ('advance_directive_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('patient_status_effective_date', datetransform, 'DT', 'O', 0),
+        ('expected_loa_return_datetime', datetransform, 'TS', 'O', 0),
+        ('expected_pre_admission_testing_datetime', datetransform, 'TS', 'O', 0),
+        ('notify_clergy_code', None, 'IS', 'O', -1),
+),
+    'QAK': (\
+        None,
+        ('query_tag', None, 'ST', 'O', 0),
+        ('query_response_status', None, 'ID', 'O', 0),
+        ('message_query_name', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('hit_count', numtransform, 'NM', 'O', 0),
+        ('this_payload', numtransform, 'NM', 'O', 0),
+        ('hits_remaining', numtransform, 'NM', 'O', 0),
+),
+    'QID': (\
+        None,
+        ('query_tag', None, 'ST', 'R', 0),
+        ('message_query_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+),
+    'QPD': (\
+        None,
+        ('message_query_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('query_tag', None, 'ST', 'O', 0),
+        ('user_parameters_in_successive_fields', None, 'ST', 'O', 0),
+),
+    'QRD': (\
+        None,
+        ('query_datetime', datetransform, 'TS', 'R', 0),
+        ('query_format_code', None, 'ID', 'R', 0),
+        ('query_priority', None, 'ID', 'R', 0),
+        ('query_id', None, 'ST', 'R', 0),
+        ('deferred_response_type', None, 'ID', 'O', 0),
+        ('deferred_response_datetime', datetransform, 'TS', 'O', 0),
+        ('quantity_limited_request', compositetrans.fieldtransformCQ, 'CQ', 'R', 0),
+        ('who_subject_filter', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('what_subject_filter', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('what_department_data_code', compositetrans.fieldtransformCE, 'CE', 'R', -1),
+        ('what_data_code_value_qual', compositetrans.fieldtransformVR, 'VR', 'O', -1),
+        ('query_results_level', None, 'ID', 'O', 0),
+),
+    'QRF': (\
+        None,
+        ('where_subject_filter', None, 'ST', 'R', -1),
+        ('when_data_start_datetime', datetransform, 'TS', 'O', 0),
+        ('when_data_end_datetime', datetransform, 'TS', 'O', 0),
+        ('what_user_qualifier', None, 'ST', 'O', -1),
+        ('other_qry_subject_filter', None, 'ST', 'O', -1),
+        ('which_datetime_qualifier', None, 'ID', 'O', -1),
+        ('which_datetime_status_qualifier', None, 'ID', 'O', -1),
+        ('datetime_selection_qualifier', None, 'ID', 'O', -1),
+        ('when_quantitytiming_qualifier', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('search_confidence_threshold', numtransform, 'NM', 'O', 0),
+),
+    'QRI': (\
+        None,
+        ('candidate_confidence', numtransform, 'NM', 'O', 0),
+        ('match_reason_code', None, 'IS', 'O', -1),
+        ('algorithm_descriptor', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'RCP': (\
+        None,
+        ('query_priority', None, 'ID', 'O', 0),
+        ('quantity_limited_request', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('response_modality', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('execution_and_delivery_time', datetransform, 'TS', 'O', 0),
+        ('modify_indicator', None, 'ID', 'O', 0),
+        ('sort_by_field', compositetrans.fieldtransformSRT, 'SRT', 'O', -1),
+        ('segment_group_inclusion', None, 'ID', 'O', -1),
+),
+    'RDF': (\
+        None,
+        ('number_of_columns_per_row', numtransform, 'NM', 'R', 0),
+        ('column_description', compositetrans.fieldtransformRCD, 'RCD', 'R', -1),
+),
+    'RDT': (\
+        None,
+        ('column_value', None, 'ST', 'R', 0),
+),
+    'RF1': (\
+        None,
+        ('referral_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('referral_priority', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('referral_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('referral_disposition', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('referral_category', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('originating_referral_identifier', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+        ('process_date', datetransform, 'TS', 'O', 0),
+        ('referral_reason', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('external_referral_identifier', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+),
+    'RGS': (\
+        None,
+        ('set_id', None, 'SI', 'R', 0),
+        ('segment_action_code', None, 'ID', 'O', 0),
+        ('resource_group_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'RMI': (\
+        None,
+        ('risk_management_incident_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('datetime_incident', datetransform, 'TS', 'O', 0),
+        ('incident_type_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'ROL': (\
+        None,
+        ('role_instance_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('action_code', None, 'ID', 'R', 0),
+        ('role', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('role_person', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('role_begin_datetime', datetransform, 'TS', 'O', 0),
+        ('role_end_datetime', datetransform, 'TS', 'O', 0),
+        ('role_duration', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('role_action_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('provider_type', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('organization_unit_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('officehome_addressbirthplace', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('phone', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+),
+    'RQ1': (\
+        None,
+        ('anticipated_price', None, 'ST', 'O', 0),
+        ('manufacturer_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('manufacturers_catalog', None, 'ST', 'O', 0),
+        ('vendor_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('vendor_catalog', None, 'ST', 'O', 0),
+        ('taxable', None, 'ID', 'O', 0),
+        ('substitute_allowed', None, 'ID', 'O', 0),
+),
+    'RQD': (\
+        None,
+        ('requisition_line_number', None, 'SI', 'O', 0),
+        ('item_code_internal', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('item_code_external', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('hospital_item_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('requisition_quantity', numtransform, 'NM', 'O', 0),
+        ('requisition_unit_of_measure', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('dept_cost_center', None, 'IS', 'O', 0),
+        ('item_natural_account_code', None, 'IS', 'O', 0),
+        ('deliver_to_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('date_needed', datetransform, 'DT', 'O', 0),
+),
+    'RXA': (\
+        None,
+        ('give_sub_id_counter', numtransform, 'NM', 'R', 0),
+        ('administration_sub_id_counter', numtransform, 'NM', 'R', 0),
+        ('datetime_start_of_administration', datetransform, 'TS', 'R', 0),
+        ('datetime_end_of_administration', datetransform, 'TS', 'R', 0),
+        ('administered_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('administered_amount', numtransform, 'NM', 'R', 0),
+        ('administered_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administered_dosage_form', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administration_notes', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('administering_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('administered_at_location', compositetrans.fieldtransformLA2, 'LA2', 'O', 0),
+        ('administered_per_time_unit', None, 'ST', 'O', 0),
+        ('administered_strength', numtransform, 'NM', 'O', 0),
+        ('administered_strength_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substance_lot_number', None, 'ST', 'O', -1),
+        ('substance_expiration_date', datetransform, 'TS', 'O', -1),
+        ('substance_manufacturer_name', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('substancetreatment_refusal_reason', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('indication', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('completion_status', None, 'ID', 'O', 0),
+        ('action_code', None, 'ID', 'O', 0),
+        ('system_entry_datetime', datetransform, 'TS', 'O', 0),
+        ('administered_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('administered_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('administered_barcode_identifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('pharmacy_order_type', None, 'ID', 'O', 0),
+),
+    'RXC': (\
+        None,
+        ('rx_component_type', None, 'ID', 'R', 0),
+        ('component_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('component_amount', numtransform, 'NM', 'R', 0),
+        ('component_units', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('component_strength', numtransform, 'NM', 'O', 0),
+        ('component_strength_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('supplementary_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('component_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('component_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'RXD': (\
+        None,
+        ('dispense_sub_id_counter', numtransform, 'NM', 'R', 0),
+        ('dispensegive_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('datetime_dispensed', datetransform, 'TS', 'R', 0),
+        ('actual_dispense_amount', numtransform, 'NM', 'R', 0),
+        ('actual_dispense_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('actual_dosage_form', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('prescription_number', None, 'ST', 'R', 0),
+        ('number_of_refills_remaining', numtransform, 'NM', 'O', 0),
+        ('dispense_notes', None, 'ST', 'O', -1),
+        ('dispensing_provider', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('substitution_status', None, 'ID', 'O', 0),
+        ('total_daily_dose', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('dispense_to_location', compositetrans.fieldtransformLA2, 'LA2', 'O', 0),
+        ('needs_human_review', None, 'ID', 'O', 0),
+        ('pharmacytreatment_suppliers_special_dispensing_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('actual_strength', numtransform, 'NM', 'O', 0),
+        ('actual_strength_unit', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substance_lot_number', None, 'ST', 'O', -1),
+        ('substance_expiration_date', datetransform, 'TS', 'O', -1),
+        ('substance_manufacturer_name', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('indication', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('dispense_package_size', numtransform, 'NM', 'O', 0),
+        ('dispense_package_size_unit', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('dispense_package_method', None, 'ID', 'O', 0),
+        ('supplementary_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('initiating_location', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('packagingassembly_location', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('actual_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('actual_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('dispense_to_pharmacy', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('dispense_to_pharmacy_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('pharmacy_order_type', None, 'ID', 'O', 0),
+        ('dispense_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'RXE': (\
+        None,
+        ('quantitytiming', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('give_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('give_amount_minimum', numtransform, 'NM', 'R', 0),
+        ('give_amount_maximum', numtransform, 'NM', 'O', 0),
+        ('give_units', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('give_dosage_form', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('providers_administration_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('deliver_to_location', compositetrans.fieldtransformLA1, 'LA1', 'O', 0),
+        ('substitution_status', None, 'ID', 'O', 0),
+        ('dispense_amount', numtransform, 'NM', 'O', 0),
+        ('dispense_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('number_of_refills', numtransform, 'NM', 'O', 0),
+        ('ordering_providers_dea_number', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('pharmacisttreatment_suppliers_verifier_id', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('prescription_number', None, 'ST', 'O', 0),
+        ('number_of_refills_remaining', numtransform, 'NM', 'O', 0),
+        ('number_of_refillsdoses_dispensed', numtransform, 'NM', 'O', 0),
+        ('dt_of_most_recent_refill_or_dose_dispensed', datetransform, 'TS', 'O', 0),
+        ('total_daily_dose', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('needs_human_review', None, 'ID', 'O', 0),
+        ('pharmacytreatment_suppliers_special_dispensing_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('give_per_time_unit', None, 'ST', 'O', 0),
+        ('give_rate_amount', None, 'ST', 'O', 0),
+        ('give_rate_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('give_strength', numtransform, 'NM', 'O', 0),
+        ('give_strength_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('give_indication', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('dispense_package_size', numtransform, 'NM', 'O', 0),
+        ('dispense_package_size_unit', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('dispense_package_method', None, 'ID', 'O', 0),
+        ('supplementary_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('original_order_datetime', datetransform, 'TS', 'O', 0),
+        ('give_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('give_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('controlled_substance_schedule', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('formulary_status', None, 'ID', 'O', 0),
+        ('pharmaceutical_substance_alternative', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('pharmacy_of_most_recent_fill', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('initial_dispense_amount', numtransform, 'NM', 'O', 0),
+        ('dispensing_pharmacy', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('dispensing_pharmacy_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('deliver_to_patient_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('deliver_to_address', compositetrans.fieldtransformXAD, 'XAD', 'O', 0),
+        ('pharmacy_order_type', None, 'ID', 'O', 0),
+),
+    'RXG': (\
+        None,
+        ('give_sub_id_counter', numtransform, 'NM', 'R', 0),
+        ('dispense_sub_id_counter', numtransform, 'NM', 'O', 0),
+        ('quantitytiming', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+        ('give_code', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('give_amount_minimum', numtransform, 'NM', 'R', 0),
+        ('give_amount_maximum', numtransform, 'NM', 'O', 0),
+        ('give_units', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('give_dosage_form', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administration_notes', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('substitution_status', None, 'ID', 'O', 0),
+        ('dispense_to_location', compositetrans.fieldtransformLA2, 'LA2', 'O', 0),
+        ('needs_human_review', None, 'ID', 'O', 0),
+        ('pharmacytreatment_suppliers_special_administration_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('give_per_time_unit', None, 'ST', 'O', 0),
+        ('give_rate_amount', None, 'ST', 'O', 0),
+        ('give_rate_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('give_strength', numtransform, 'NM', 'O', 0),
+        ('give_strength_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substance_lot_number', None, 'ST', 'O', -1),
+        ('substance_expiration_date', datetransform, 'TS', 'O', -1),
+        ('substance_manufacturer_name', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('indication', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('give_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('give_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('give_barcode_identifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('pharmacy_order_type', None, 'ID', 'O', 0),
+),
+    'RXO': (\
+        None,
+        ('requested_give_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('requested_give_amount_minimum', numtransform, 'NM', 'O', 0),
+        ('requested_give_amount_maximum', numtransform, 'NM', 'O', 0),
+        ('requested_give_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('requested_dosage_form', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('providers_pharmacytreatment_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('providers_administration_instructions', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('deliver_to_location', compositetrans.fieldtransformLA1, 'LA1', 'O', 0),
+        ('allow_substitutions', None, 'ID', 'O', 0),
+        ('requested_dispense_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('requested_dispense_amount', numtransform, 'NM', 'O', 0),
+        ('requested_dispense_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('number_of_refills', numtransform, 'NM', 'O', 0),
+        ('ordering_providers_dea_number', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('pharmacisttreatment_suppliers_verifier_id', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('needs_human_review', None, 'ID', 'O', 0),
+        ('requested_give_per_time_unit', None, 'ST', 'O', 0),
+        ('requested_give_strength', numtransform, 'NM', 'O', 0),
+        ('requested_give_strength_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('indication', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('requested_give_rate_amount', None, 'ST', 'O', 0),
+        ('requested_give_rate_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('total_daily_dose', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('supplementary_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('requested_drug_strength_volume', numtransform, 'NM', 'O', 0),
+        ('requested_drug_strength_volume_units', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('pharmacy_order_type', None, 'ID', 'O', 0),
+        ('dispensing_interval', numtransform, 'NM', 'O', 0),
+),
+    'RXR': (\
+        None,
+        ('route', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('administration_site', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('administration_device', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administration_method', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('routing_instruction', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('administration_site_modifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'SAC': (\
+        None,
+        ('external_accession_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('accession_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('container_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('primary_parent_container_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('equipment_container_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('specimen_source', compositetrans.fieldtransformSPS, 'SPS', 'O', 0),
+        ('registration_datetime', datetransform, 'TS', 'O', 0),
+        ('container_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('carrier_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('carrier_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('position_in_carrier', compositetrans.fieldtransformNA, 'NA', 'O', 0),
+        ('tray_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('tray_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('position_in_tray', compositetrans.fieldtransformNA, 'NA', 'O', 0),
+        ('location', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('container_height', numtransform, 'NM', 'O', 0),
+        ('container_diameter', numtransform, 'NM', 'O', 0),
+        ('barrier_delta', numtransform, 'NM', 'O', 0),
+        ('bottom_delta', numtransform, 'NM', 'O', 0),
+        ('container_heightdiameterdelta_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('container_volume', numtransform, 'NM', 'O', 0),
+        ('available_specimen_volume', numtransform, 'NM', 'O', 0),
+        ('initial_specimen_volume', numtransform, 'NM', 'O', 0),
+        ('volume_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('separator_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('cap_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('additive', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_component', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('dilution_factor', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('treatment', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('temperature', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('hemolysis_index', numtransform, 'NM', 'O', 0),
+        ('hemolysis_index_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('lipemia_index', numtransform, 'NM', 'O', 0),
+        ('lipemia_index_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('icterus_index', numtransform, 'NM', 'O', 0),
+        ('icterus_index_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('fibrin_index', numtransform, 'NM', 'O', 0),
+        ('fibrin_index_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('system_induced_contaminants', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('drug_interference', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('artificial_blood', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('special_handling_code', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('other_environmental_factors', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+),
+    'SCH': (\
+        None,
+        ('placer_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('filler_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('occurrence_number', numtransform, 'NM', 'O', 0),
+        ('placer_group_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('schedule_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('event_reason', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('appointment_reason', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_duration', numtransform, 'NM', 'O', 0),
+        ('appointment_duration_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('appointment_timing_quantity', compositetrans.fieldtransformTQ, 'TQ', 'O', -1),
+        ('placer_contact_person', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('placer_contact_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('placer_contact_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('placer_contact_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('filler_contact_person', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('filler_contact_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', 0),
+        ('filler_contact_address', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('filler_contact_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('entered_by_person', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('entered_by_phone_number', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('entered_by_location', compositetrans.fieldtransformPL, 'PL', 'O', 0),
+        ('parent_placer_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('parent_filler_appointment_id', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('filler_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('placer_order_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+),
+    'SFT': (\
+        None,
+        ('software_vendor_organization', compositetrans.fieldtransformXON, 'XON', 'R', 0),
+        ('software_certified_version_or_release_number', None, 'ST', 'R', 0),
+        ('software_product_name', None, 'ST', 'R', 0),
+        ('software_binary_id', None, 'ST', 'R', 0),
+        ('software_product_information', None, 'TX', 'O', 0),
+        ('software_install_date', datetransform, 'TS', 'O', 0),
+),
+    'SID': (\
+        None,
+        ('applicationmethod_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('substance_lot_number', None, 'ST', 'O', 0),
+        ('substance_container_identifier', None, 'ST', 'O', 0),
+        ('substance_manufacturer_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'SPM': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('specimen_id', compositetrans.fieldtransformEIP, 'EIP', 'O', 0),
+        ('specimen_parent_ids', compositetrans.fieldtransformEIP, 'EIP', 'O', -1),
+        ('specimen_type', compositetrans.fieldtransformCWE, 'CWE', 'R', 0),
+        ('specimen_type_modifier', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_additives', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_collection_method', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_source_site', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_source_site_modifier', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_collection_site', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_role', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_collection_amount', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('grouped_specimen_count', numtransform, 'NM', 'O', 0),
+        ('specimen_description', None, 'ST', 'O', -1),
+        ('specimen_handling_code', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_risk_code', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_collection_datetime', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('specimen_received_datetime', datetransform, 'TS', 'O', 0),
+        ('specimen_expiration_datetime', datetransform, 'TS', 'O', 0),
+        ('specimen_availability', None, 'ID', 'O', 0),
+        ('specimen_reject_reason', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_quality', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_appropriateness', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_condition', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('specimen_current_quantity', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('number_of_specimen_containers', numtransform, 'NM', 'O', 0),
+        ('container_type', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('container_condition', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_child_role', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'SPR': (\
+        None,
+        ('query_tag', None, 'ST', 'O', 0),
+        ('queryresponse_format_code', None, 'ID', 'R', 0),
+        ('stored_procedure_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('input_parameter_list', compositetrans.fieldtransformQIP, 'QIP', 'O', -1),
+),
+    'STF': (\
+        None,
+        ('primary_key_value', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('staff_identifier_list', compositetrans.fieldtransformCX, 'CX', 'O', -1),
+        ('staff_name', compositetrans.fieldtransformXPN, 'XPN', 'O', -1),
+        ('staff_type', None, 'IS', 'O', -1),
+        ('administrative_sex', None, 'IS', 'O', 0),
+        ('datetime_of_birth', datetransform, 'TS', 'O', 0),
+        ('activeinactive_flag', None, 'ID', 'O', 0),
+        ('department', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('hospital_service', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('phone', compositetrans.fieldtransformXTN, 'XTN', 'O', -1),
+        ('officehome_addressbirthplace', compositetrans.fieldtransformXAD, 'XAD', 'O', -1),
+        ('institution_activation_date', compositetrans.fieldtransformDIN, 'DIN', 'O', -1),
+        ('institution_inactivation_date', compositetrans.fieldtransformDIN, 'DIN', 'O', -1),
+        ('backup_person_id', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('e_mail_address', None, 'ST', 'O', -1),
+        ('preferred_method_of_contact', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('marital_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('job_title', None, 'ST', 'O', 0),
+        ('job_codeclass', compositetrans.fieldtransformJCC, 'JCC', 'O', 0),
+        ('employment_status_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('additional_insured_on_auto', None, 'ID', 'O', 0),
+        ('drivers_license_number_staff', compositetrans.fieldtransformDLN, 'DLN', 'O', 0),
+        ('copy_auto_ins', None, 'ID', 'O', 0),
+        ('auto_ins_expires', datetransform, 'DT', 'O', 0),
+        ('date_last_dmv_review', datetransform, 'DT', 'O', 0),
+        ('date_next_dmv_review', datetransform, 'DT', 'O', 0),
+        ('race', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('ethnic_group', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('re_activation_approval_indicator', None, 'ID', 'O', 0),
+        ('citizenship', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('death_date_and_time', datetransform, 'TS', 'O', 0),
+        ('death_indicator', None, 'ID', 'O', 0),
+        ('institution_relationship_type_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('institution_relationship_period', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('expected_return_date', datetransform, 'DT', 'O', 0),
+        ('cost_center_code', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('generic_classification_indicator', None, 'ID', 'O', 0),
+        ('inactive_reason_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'TCC': (\
+        None,
+        ('universal_service_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('test_application_identifier', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('specimen_source', compositetrans.fieldtransformSPS, 'SPS', 'O', 0),
+        ('auto_dilution_factor_default', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('rerun_dilution_factor_default', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('pre_dilution_factor_default', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('endogenous_content_of_pre_dilution_diluent', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('inventory_limits_warning_level', numtransform, 'NM', 'O', 0),
+        ('automatic_rerun_allowed', None, 'ID', 'O', 0),
+        ('automatic_repeat_allowed', None, 'ID', 'O', 0),
+        ('automatic_reflex_allowed', None, 'ID', 'O', 0),
+        ('equipment_dynamic_range', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('processing_type', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'TCD': (\
+        None,
+        ('universal_service_identifier', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('auto_dilution_factor', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('rerun_dilution_factor', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('pre_dilution_factor', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('endogenous_content_of_pre_dilution_diluent', compositetrans.fieldtransformSN, 'SN', 'O', 0),
+        ('automatic_repeat_allowed', None, 'ID', 'O', 0),
+        ('reflex_allowed', None, 'ID', 'O', 0),
+        ('analyte_repeat_status', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'TQ1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('quantity', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('repeat_pattern', compositetrans.fieldtransformRPT, 'RPT', 'O', -1),
+        ('explicit_time', datetransform, 'TM', 'O', -1),
+        ('relative_time_and_units', compositetrans.fieldtransformCQ, 'CQ', 'O', -1),
+        ('service_duration', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('end_datetime', datetransform, 'TS', 'O', 0),
+        ('priority', compositetrans.fieldtransformCWE, 'CWE', 'O', -1),
+        ('condition_text', None, 'TX', 'O', 0),
+        ('text_instruction', None, 'TX', 'O', 0),
+        ('conjunction', None, 'ID', 'O', 0),
+        ('occurrence_duration', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('total_occurrences', numtransform, 'NM', 'O', 0),
+),
+    'TQ2': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('sequenceresults_flag', None, 'ID', 'O', 0),
+        ('related_placer_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('related_filler_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('related_placer_group_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('sequence_condition_code', None, 'ID', 'O', 0),
+        ('cyclic_entryexit_indicator', None, 'ID', 'O', 0),
+        ('sequence_condition_time_interval', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('cyclic_group_maximum_number_of_repeats', numtransform, 'NM', 'O', 0),
+        ('special_service_request_relationship', None, 'ID', 'O', 0),
+),
+    'TXA': (\
+        None,
+        ('set_id_txa', None, 'SI', 'R', 0),
+        ('document_type', None, 'IS', 'R', 0),
+        ('document_content_presentation', None, 'ID', 'O', 0),
+        ('activity_datetime', datetransform, 'TS', 'O', 0),
+        ('primary_activity_provider_codename', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('origination_datetime', datetransform, 'TS', 'O', 0),
+        ('transcription_datetime', datetransform, 'TS', 'O', 0),
+        ('edit_datetime', datetransform, 'TS', 'O', -1),
+        ('originator_codename', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('assigned_document_authenticator', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('transcriptionist_codename', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('unique_document_number', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('parent_document_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('placer_order_number', compositetrans.fieldtransformEI, 'EI', 'O', -1),
+        ('filler_order_number', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('unique_document_file_name', None, 'ST', 'O', 0),
+        ('document_completion_status', None, 'ID', 'R', 0),
+        ('document_confidentiality_status', None, 'ID', 'O', 0),
+        ('document_availability_status', None, 'ID', 'O', 0),
+        ('document_storage_status', None, 'ID', 'O', 0),
+        ('document_change_reason', None, 'ST', 'O', 0),
+        ('authentication_person_time_stamp', compositetrans.fieldtransformPPN, 'PPN', 'O', -1),
+        ('distributed_copies_code_and_name_of_recipients', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+),
+    'UB1': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('blood_deductible_43', numtransform, 'NM', 'O', 0),
+        ('blood_furnished_pints_of_40', numtransform, 'NM', 'O', 0),
+        ('blood_replaced_pints_41', numtransform, 'NM', 'O', 0),
+        ('blood_not_replaced_pints42', numtransform, 'NM', 'O', 0),
+        ('co_insurance_days_25', numtransform, 'NM', 'O', 0),
+        ('condition_code_35_39', None, 'IS', 'O', -1),
+        ('covered_days_23', numtransform, 'NM', 'O', 0),
+        ('non_covered_days_24', numtransform, 'NM', 'O', 0),
+        ('value_amount_code_46_49', compositetrans.fieldtransformUVC, 'UVC', 'O', -1),
+        ('number_of_grace_days_90', numtransform, 'NM', 'O', 0),
+        ('special_program_indicator_44', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('psrour_approval_indicator_87', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('psrour_approved_stay_from_88', datetransform, 'DT', 'O', 0),
+        ('psrour_approved_stay_to_89', datetransform, 'DT', 'O', 0),
+        ('occurrence_28_32', compositetrans.fieldtransformOCD, 'OCD', 'O', -1),
+        ('occurrence_span_33', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('occur_span_start_date33', datetransform, 'DT', 'O', 0),
+        ('occur_span_end_date_33', datetransform, 'DT', 'O', 0),
+        ('ub_82_locator_2', None, 'ST', 'O', 0),
+        ('ub_82_locator_9', None, 'ST', 'O', 0),
+        ('ub_82_locator_27', None, 'ST', 'O', 0),
+        ('ub_82_locator_45', None, 'ST', 'O', 0),
+),
+    'UB2': (\
+        None,
+        ('set_id', None, 'SI', 'O', 0),
+        ('co_insurance_days_9', None, 'ST', 'O', 0),
+        ('condition_code_24_30', None, 'IS', 'O', -1),
+        ('covered_days_7', None, 'ST', 'O', 0),
+        ('non_covered_days_8', None, 'ST', 'O', 0),
+        ('value_amount_code', compositetrans.fieldtransformUVC, 'UVC', 'O', -1),
+        ('occurrence_code_date_32_35', compositetrans.fieldtransformOCD, 'OCD', 'O', -1),
+        ('occurrence_span_codedates_36', compositetrans.fieldtransformOSP, 'OSP', 'O', -1),
+        ('ub92_locator_2_state', None, 'ST', 'O', -1),
+        ('ub92_locator_11_state', None, 'ST', 'O', -1),
+        ('ub92_locator_31_national', None, 'ST', 'O', 0),
+        ('document_control_number', None, 'ST', 'O', -1),
+        ('ub92_locator_49_national', None, 'ST', 'O', -1),
+        ('ub92_locator_56_state', None, 'ST', 'O', -1),
+        ('ub92_locator_57_national', None, 'ST', 'O', 0),
+        ('ub92_locator_78_state', None, 'ST', 'O', -1),
+        ('special_visit_count', numtransform, 'NM', 'O', 0),
+),
+    'URD': (\
+        None,
+        ('ru_datetime', datetransform, 'TS', 'O', 0),
+        ('report_priority', None, 'ID', 'O', 0),
+        ('ru_who_subject_definition', compositetrans.fieldtransformXCN, 'XCN', 'R', -1),
+        ('ru_what_subject_definition', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('ru_what_department_code', compositetrans.fieldtransformCE, 'CE', 'O', -1),
+        ('ru_displayprint_locations', None, 'ST', 'O', -1),
+        ('ru_results_level', None, 'ID', 'O', 0),
+),
+    'URS': (\
+        None,
+        ('ru_where_subject_definition', None, 'ST', 'R', -1),
+        ('ru_when_data_start_datetime', datetransform, 'TS', 'O', 0),
+        ('ru_when_data_end_datetime', datetransform, 'TS', 'O', 0),
+        ('ru_what_user_qualifier', None, 'ST', 'O', -1),
+        ('ru_other_results_subject_definition', None, 'ST', 'O', -1),
+        ('ru_which_datetime_qualifier', None, 'ID', 'O', -1),
+        ('ru_which_datetime_status_qualifier', None, 'ID', 'O', -1),
+        ('ru_datetime_selection_qualifier', None, 'ID', 'O', -1),
+        ('ru_quantitytiming_qualifier', compositetrans.fieldtransformTQ, 'TQ', 'O', 0),
+),
+    'VAR': (\
+        None,
+        ('variance_instance_id', compositetrans.fieldtransformEI, 'EI', 'R', 0),
+        ('documented_datetime', datetransform, 'TS', 'R', 0),
+        ('stated_variance_datetime', datetransform, 'TS', 'O', 0),
+        ('variance_originator', compositetrans.fieldtransformXCN, 'XCN', 'O', -1),
+        ('variance_classification', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('variance_description', None, 'ST', 'O', -1),
+),
+    'VTQ': (\
+        None,
+        ('query_tag', None, 'ST', 'O', 0),
+        ('queryresponse_format_code', None, 'ID', 'R', 0),
+        ('vt_query_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('virtual_table_name', compositetrans.fieldtransformCE, 'CE', 'R', 0),
+        ('selection_criteria', compositetrans.fieldtransformQSC, 'QSC', 'O', -1),
+),
+}
+composites = {\
+    'AD': (\
+        ('street_address', None, 'ST', 'O', 0),
+        ('other_designation', None, 'ST', 'O', 0),
+        ('city', None, 'ST', 'O', 0),
+        ('state_or_province', None, 'ST', 'O', 0),
+        ('zip_or_postal_code', None, 'ST', 'O', 0),
+        ('country', None, 'ID', 'O', 0),
+        ('address_type', None, 'ID', 'O', 0),
+        ('other_geographic_designation', None, 'ST', 'O', 0),
+),
+    'AUI': (\
+        ('authorization_number', None, 'ST', 'O', 0),
+        ('date', datetransform, 'DT', 'O', 0),
+        ('source', None, 'ST', 'O', 0),
+),
+    'CCD': (\
+        ('invocation_event', None, 'ID', 'O', 0),
+        ('datetime', datetransform, 'TS', 'O', 0),
+),
+    'CE': (\
+        ('identifier', None, 'ST', 'O', 0),
+        ('text', None, 'ST', 'O', 0),
+        ('name_of_coding_system', None, 'ID', 'O', 0),
+        ('alternate_identifier', None, 'ST', 'O', 0),
+        ('alternate_text', None, 'ST', 'O', 0),
+        ('name_of_alternate_coding_system', None, 'ID', 'O', 0),
+),
+    'CNE': (\
+        ('identifier', None, 'ST', 'O', 0),
+        ('text', None, 'ST', 'O', 0),
+        ('name_of_coding_system', None, 'ID', 'O', 0),
+        ('alternate_identifier', None, 'ST', 'O', 0),
+        ('alternate_text', None, 'ST', 'O', 0),
+        ('name_of_alternate_coding_system', None, 'ID', 'O', 0),
+        ('coding_system_version_id', None, 'ST', 'O', 0),
+        ('alternate_coding_system_version_id', None, 'ST', 'O', 0),
+        ('original_text', None, 'ST', 'O', 0),
+),
+    'CNN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('family_name', None, 'ST', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('second_and_further_given_names_or_initials_thereof', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+        ('degree', None, 'IS', 'O', 0),
+        ('source_table', None, 'IS', 'O', 0),
+        ('assigning_authority_namespace_id', None, 'IS', 'O', 0),
+        ('assigning_authority_universal_id', None, 'ST', 'O', 0),
+        ('assigning_authority_universal_id_type', None, 'ID', 'O', 0),
+),
+    'CP': (\
+        ('price', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('price_type', None, 'ID', 'O', 0),
+        ('from_value', numtransform, 'NM', 'O', 0),
+        ('to_value', numtransform, 'NM', 'O', 0),
+        ('range_units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('range_type', None, 'ID', 'O', 0),
+),
+    'CQ': (\
+        ('quantity', numtransform, 'NM', 'O', 0),
+        ('units', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'CWE': (\
+        ('identifier', None, 'ST', 'O', 0),
+        ('text', None, 'ST', 'O', 0),
+        ('name_of_coding_system', None, 'ID', 'O', 0),
+        ('alternate_identifier', None, 'ST', 'O', 0),
+        ('alternate_text', None, 'ST', 'O', 0),
+        ('name_of_alternate_coding_system', None, 'ID', 'O', 0),
+        ('coding_system_version_id', None, 'ST', 'O', 0),
+        ('alternate_coding_system_version_id', None, 'ST', 'O', 0),
+        ('original_text', None, 'ST', 'O', 0),
+),
+    'CX': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('check_digit', None, 'ST', 'O', 0),
+        ('check_digit_scheme', None, 'ID', 'O', 0),
+        ('assigning_authority', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('identifier_type_code', None, 'ID', 'O', 0),
+        ('assigning_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('effective_date', datetransform, 'DT', 'O', 0),
+        ('expiration_date', datetransform, 'DT', 'O', 0),
+        ('assigning_jurisdiction', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('assigning_agency_or_department', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'DDI': (\
+        ('delay_days', numtransform, 'NM', 'O', 0),
+        ('monetary_amount', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('number_of_days', numtransform, 'NM', 'O', 0),
+),
+    'DIN': (\
+        ('date', datetransform, 'TS', 'O', 0),
+        ('institution_name', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'DLD': (\
+        ('discharge_location', None, 'IS', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+),
+    'DLN': (\
+        ('license_number', None, 'ST', 'O', 0),
+        ('issuing_state_province_country', None, 'IS', 'O', 0),
+        ('expiration_date', datetransform, 'DT', 'O', 0),
+),
+    'DLT': (\
+        ('normal_range', compositetrans.fieldtransformNR, 'NR', 'O', 0),
+        ('numeric_threshold', numtransform, 'NM', 'O', 0),
+        ('change_computation', None, 'ID', 'O', 0),
+        ('days_retained', numtransform, 'NM', 'O', 0),
+),
+    'DR': (\
+        ('range_start_datetime', datetransform, 'TS', 'O', 0),
+        ('range_end_datetime', datetransform, 'TS', 'O', 0),
+),
+    'DT': (\
+        ('value', None, 'Date', 'O', 0),
+),
+    'DTM': (\
+        ('value', compositetrans.fieldtransformDateTime, 'DateTime', 'O', 0),
+),
+    'DTN': (\
+        ('day_type', None, 'IS', 'O', 0),
+        ('number_of_days', numtransform, 'NM', 'O', 0),
+),
+    'ED': (\
+        ('source_application', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('type_of_data', None, 'ID', 'O', 0),
+        ('data_subtype', None, 'ID', 'O', 0),
+        ('encoding', None, 'ID', 'O', 0),
+        ('data', None, 'TX', 'O', 0),
+),
+    'EI': (\
+        ('entity_identifier', None, 'ST', 'O', 0),
+        ('namespace_id', None, 'IS', 'O', 0),
+        ('universal_id', None, 'ST', 'O', 0),
+        ('universal_id_type', None, 'ID', 'O', 0),
+),
+    'EIP': (\
+        ('placer_assigned_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('filler_assigned_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+),
+    'ELD': (\
+        ('segment_id', None, 'ST', 'O', 0),
+        ('segment_sequence', numtransform, 'NM', 'O', 0),
+        ('field_position', numtransform, 'NM', 'O', 0),
+        ('code_identifying_error', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'ERL': (\
+        ('segment_id', None, 'ST', 'O', 0),
+        ('segment_sequence', numtransform, 'NM', 'O', 0),
+        ('field_position', numtransform, 'NM', 'O', 0),
+        ('field_repetition', numtransform, 'NM', 'O', 0),
+        ('component_number', numtransform, 'NM', 'O', 0),
+        ('sub_component_number', numtransform, 'NM', 'O', 0),
+),
+    'FC': (\
+        ('financial_class_code', None, 'IS', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+),
+    'FN': (\
+        ('surname', None, 'ST', 'O', 0),
+        ('own_surname_prefix', None, 'ST', 'O', 0),
+        ('own_surname', None, 'ST', 'O', 0),
+        ('surname_prefix_from_partnerspouse', None, 'ST', 'O', 0),
+        ('surname_from_partnerspouse', None, 'ST', 'O', 0),
+),
+    'FT': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'GTS': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'HD': (\
+        ('namespace_id', None, 'IS', 'O', 0),
+        ('universal_id', None, 'ST', 'O', 0),
+        ('universal_id_type', None, 'ID', 'O', 0),
+),
+    'ICD': (\
+        ('certification_patient_type', None, 'IS', 'O', 0),
+        ('certification_required', None, 'ID', 'O', 0),
+        ('datetime_certification_required', datetransform, 'TS', 'O', 0),
+),
+    'ID': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'IS': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'JCC': (\
+        ('job_code', None, 'IS', 'O', 0),
+        ('job_class', None, 'IS', 'O', 0),
+        ('job_description_text', None, 'TX', 'O', 0),
+),
+    'LA1': (\
+        ('point_of_care', None, 'IS', 'O', 0),
+        ('room', None, 'IS', 'O', 0),
+        ('bed', None, 'IS', 'O', 0),
+        ('facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('location_status', None, 'IS', 'O', 0),
+        ('patient_location_type', None, 'IS', 'O', 0),
+        ('building', None, 'IS', 'O', 0),
+        ('floor', None, 'IS', 'O', 0),
+        ('address', compositetrans.fieldtransformAD, 'AD', 'O', 0),
+),
+    'LA2': (\
+        ('point_of_care', None, 'IS', 'O', 0),
+        ('room', None, 'IS', 'O', 0),
+        ('bed', None, 'IS', 'O', 0),
+        ('facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('location_status', None, 'IS', 'O', 0),
+        ('patient_location_type', None, 'IS', 'O', 0),
+        ('building', None, 'IS', 'O', 0),
+        ('floor', None, 'IS', 'O', 0),
+        ('street_address', None, 'ST', 'O', 0),
+        ('other_designation', None, 'ST', 'O', 0),
+        ('city', None, 'ST', 'O', 0),
+        ('state_or_province', None, 'ST', 'O', 0),
+        ('zip_or_postal_code', None, 'ST', 'O', 0),
+        ('country', None, 'ID', 'O', 0),
+        ('address_type', None, 'ID', 'O', 0),
+        ('other_geographic_designation', None, 'ST', 'O', 0),
+),
+    'MO': (\
+        ('quantity', numtransform, 'NM', 'O', 0),
+        ('denomination', None, 'ID', 'O', 0),
+),
+    'MOC': (\
+        ('monetary_amount', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+        ('charge_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'MOP': (\
+        ('money_or_percentage_indicator', None, 'ID', 'O', 0),
+        ('money_or_percentage_quantity', numtransform, 'NM', 'O', 0),
+        ('currency_denomination', None, 'ID', 'O', 0),
+),
+    'MSG': (\
+        ('message_code', None, 'ID', 'O', 0),
+        ('trigger_event', None, 'ID', 'O', 0),
+        ('message_structure', None, 'ID', 'O', 0),
+),
+    'NA': (\
+        ('value1', numtransform, 'NM', 'O', 0),
+        ('value2', numtransform, 'NM', 'O', 0),
+        ('value3', numtransform, 'NM', 'O', 0),
+        ('value4', numtransform, 'NM', 'O', 0),
+),
+    'NDL': (\
+        ('name', compositetrans.fieldtransformCNN, 'CNN', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('end_datetime', datetransform, 'TS', 'O', 0),
+        ('point_of_care', None, 'IS', 'O', 0),
+        ('room', None, 'IS', 'O', 0),
+        ('bed', None, 'IS', 'O', 0),
+        ('facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('location_status', None, 'IS', 'O', 0),
+        ('patient_location_type', None, 'IS', 'O', 0),
+        ('building', None, 'IS', 'O', 0),
+        ('floor', None, 'IS', 'O', 0),
+),
+    'NM': (\
+        ('value', numtransform, 'Double', 'O', 0),
+),
+    'NR': (\
+        ('low_value', numtransform, 'NM', 'O', 0),
+        ('high_value', numtransform, 'NM', 'O', 0),
+),
+    'OCD': (\
+        ('occurrence_code', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('occurrence_date', datetransform, 'DT', 'O', 0),
+),
+    'OSD': (\
+        ('sequenceresults_flag', None, 'ID', 'O', 0),
+        ('placer_order_number_entity_identifier', None, 'ST', 'O', 0),
+        ('placer_order_number_namespace_id', None, 'IS', 'O', 0),
+        ('filler_order_number_entity_identifier', None, 'ST', 'O', 0),
+        ('filler_order_number_namespace_id', None, 'IS', 'O', 0),
+        ('sequence_condition_value', None, 'ST', 'O', 0),
+        ('maximum_number_of_repeats', numtransform, 'NM', 'O', 0),
+        ('placer_order_number_universal_id', None, 'ST', 'O', 0),
+        ('placer_order_number_universal_id_type', None, 'ID', 'O', 0),
+        ('filler_order_number_universal_id', None, 'ST', 'O', 0),
+        ('filler_order_number_universal_id_type', None, 'ID', 'O', 0),
+),
+    'OSP': (\
+        ('occurrence_span_code', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('occurrence_span_start_date', datetransform, 'DT', 'O', 0),
+        ('occurrence_span_stop_date', datetransform, 'DT', 'O', 0),
+),
+    'PIP': (\
+        ('privilege', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('privilege_class', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('expiration_date', datetransform, 'DT', 'O', 0),
+        ('activation_date', datetransform, 'DT', 'O', 0),
+        ('facility', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+),
+    'PL': (\
+        ('point_of_care', None, 'IS', 'O', 0),
+        ('room', None, 'IS', 'O', 0),
+        ('bed', None, 'IS', 'O', 0),
+        ('facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('location_status', None, 'IS', 'O', 0),
+        ('person_location_type', None, 'IS', 'O', 0),
+        ('building', None, 'IS', 'O', 0),
+        ('floor', None, 'IS', 'O', 0),
+        ('location_description', None, 'ST', 'O', 0),
+        ('comprehensive_location_identifier', compositetrans.fieldtransformEI, 'EI', 'O', 0),
+        ('assigning_authority_for_location', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+),
+    'PLN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('type_of_id_number', None, 'IS', 'O', 0),
+        ('stateother_qualifying_information', None, 'ST', 'O', 0),
+        ('expiration_date', datetransform, 'DT', 'O', 0),
+),
+    'PPN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('family_name', compositetrans.fieldtransformFN, 'FN', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('second_and_further_given_names_or_initials_thereof', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+        ('degree', None, 'IS', 'O', 0),
+        ('source_table', None, 'IS', 'O', 0),
+        ('assigning_authority', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('name_type_code', None, 'ID', 'O', 0),
+        ('identifier_check_digit', None, 'ST', 'O', 0),
+        ('check_digit_scheme', None, 'ID', 'O', 0),
+        ('identifier_type_code', None, 'ID', 'O', 0),
+        ('assigning_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('datetime_action_performed', datetransform, 'TS', 'O', 0),
+        ('name_representation_code', None, 'ID', 'O', 0),
+        ('name_context', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('name_validity_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('name_assembly_order', None, 'ID', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+        ('professional_suffix', None, 'ST', 'O', 0),
+        ('assigning_jurisdiction', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('assigning_agency_or_department', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'PRL': (\
+        ('parent_observation_identifier', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('parent_observation_sub_identifier', None, 'ST', 'O', 0),
+        ('parent_observation_value_descriptor', None, 'TX', 'O', 0),
+),
+    'PT': (\
+        ('processing_id', None, 'ID', 'O', 0),
+        ('processing_mode', None, 'ID', 'O', 0),
+),
+    'PTA': (\
+        ('policy_type', None, 'IS', 'O', 0),
+        ('amount_class', None, 'IS', 'O', 0),
+        ('money_or_percentage_quantity', numtransform, 'NM', 'O', 0),
+        ('money_or_percentage', compositetrans.fieldtransformMOP, 'MOP', 'O', 0),
+),
+    'QIP': (\
+        ('segment_field_name', None, 'ST', 'O', 0),
+        ('values', None, 'ST', 'O', 0),
+),
+    'QSC': (\
+        ('segment_field_name', None, 'ST', 'O', 0),
+        ('relational_operator', None, 'ID', 'O', 0),
+        ('value', None, 'ST', 'O', 0),
+        ('relational_conjunction', None, 'ID', 'O', 0),
+),
+    'RCD': (\
+        ('segment_field_name', None, 'ST', 'O', 0),
+        ('hl7_data_type', None, 'ID', 'O', 0),
+        ('maximum_column_width', numtransform, 'NM', 'O', 0),
+),
+    'RFR': (\
+        ('numeric_range', compositetrans.fieldtransformNR, 'NR', 'O', 0),
+        ('administrative_sex', None, 'IS', 'O', 0),
+        ('age_range', compositetrans.fieldtransformNR, 'NR', 'O', 0),
+        ('gestational_age_range', compositetrans.fieldtransformNR, 'NR', 'O', 0),
+        ('species', None, 'ST', 'O', 0),
+        ('racesubspecies', None, 'ST', 'O', 0),
+        ('conditions', None, 'TX', 'O', 0),
+),
+    'RI': (\
+        ('repeat_pattern', None, 'IS', 'O', 0),
+        ('explicit_time_interval', None, 'ST', 'O', 0),
+),
+    'RMC': (\
+        ('room_type', None, 'IS', 'O', 0),
+        ('amount_type', None, 'IS', 'O', 0),
+        ('coverage_amount', numtransform, 'NM', 'O', 0),
+        ('money_or_percentage', compositetrans.fieldtransformMOP, 'MOP', 'O', 0),
+),
+    'RPT': (\
+        ('repeat_pattern_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('calendar_alignment', None, 'ID', 'O', 0),
+        ('phase_range_begin_value', numtransform, 'NM', 'O', 0),
+        ('phase_range_end_value', numtransform, 'NM', 'O', 0),
+        ('period_quantity', numtransform, 'NM', 'O', 0),
+        ('period_units', None, 'IS', 'O', 0),
+        ('institution_specified_time', None, 'ID', 'O', 0),
+        ('event', None, 'ID', 'O', 0),
+        ('event_offset_quantity', numtransform, 'NM', 'O', 0),
+        ('event_offset_units', None, 'IS', 'O', 0),
+        ('general_timing_specification', compositetrans.fieldtransformGTS, 'GTS', 'O', 0),
+),
+    'SAD': (\
+        ('street_or_mailing_address', None, 'ST', 'O', 0),
+        ('street_name', None, 'ST', 'O', 0),
+        ('dwelling_number', None, 'ST', 'O', 0),
+),
+    'SCV': (\
+        ('parameter_class', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('parameter_value', None, 'ST', 'O', 0),
+),
+    'SI': (\
+        ('value', compositetrans.fieldtransformInteger, 'Integer', 'O', 0),
+),
+    'SN': (\
+        ('comparator', None, 'ST', 'O', 0),
+        ('num1', numtransform, 'NM', 'O', 0),
+        ('separatorsuffix', None, 'ST', 'O', 0),
+        ('num2', numtransform, 'NM', 'O', 0),
+),
+    'SPD': (\
+        ('specialty_name', None, 'ST', 'O', 0),
+        ('governing_board', None, 'ST', 'O', 0),
+        ('eligible_or_certified', None, 'ID', 'O', 0),
+        ('date_of_certification', datetransform, 'DT', 'O', 0),
+),
+    'SPS': (\
+        ('specimen_source_name_or_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('additives', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_collection_method', None, 'TX', 'O', 0),
+        ('body_site', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('site_modifier', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('collection_method_modifier_code', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('specimen_role', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'SRT': (\
+        ('sort_by_field', None, 'ST', 'O', 0),
+        ('sequencing', None, 'ID', 'O', 0),
+),
+    'ST': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'TM': (\
+        ('value', None, 'Time', 'O', 0),
+),
+    'TQ': (\
+        ('quantity', compositetrans.fieldtransformCQ, 'CQ', 'O', 0),
+        ('interval', compositetrans.fieldtransformRI, 'RI', 'O', 0),
+        ('duration', None, 'ST', 'O', 0),
+        ('start_datetime', datetransform, 'TS', 'O', 0),
+        ('end_datetime', datetransform, 'TS', 'O', 0),
+        ('priority', None, 'ST', 'O', 0),
+        ('condition', None, 'ST', 'O', 0),
+        ('text', None, 'TX', 'O', 0),
+        ('conjunction', None, 'ID', 'O', 0),
+        ('order_sequencing', compositetrans.fieldtransformOSD, 'OSD', 'O', 0),
+        ('occurrence_duration', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('total_occurrences', numtransform, 'NM', 'O', 0),
+),
+    'TS': (\
+        ('time', compositetrans.fieldtransformDTM, 'DTM', 'O', 0),
+        ('degree_of_precision', None, 'ID', 'O', 0),
+),
+    'TX': (\
+        ('value', None, 'String', 'O', 0),
+),
+    'UVC': (\
+        ('value_code', compositetrans.fieldtransformCNE, 'CNE', 'O', 0),
+        ('value_amount', compositetrans.fieldtransformMO, 'MO', 'O', 0),
+),
+    'VH': (\
+        ('start_day_range', None, 'ID', 'O', 0),
+        ('end_day_range', None, 'ID', 'O', 0),
+        ('start_hour_range', datetransform, 'TM', 'O', 0),
+        ('end_hour_range', datetransform, 'TM', 'O', 0),
+),
+    'VID': (\
+        ('version_id', None, 'ID', 'O', 0),
+        ('internationalization_code', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('international_version_id', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+),
+    'VR': (\
+        ('first_data_code_value', None, 'ST', 'O', 0),
+        ('last_data_code_value', None, 'ST', 'O', 0),
+),
+    'XAD': (\
+        ('street_address', compositetrans.fieldtransformSAD, 'SAD', 'O', 0),
+        ('other_designation', None, 'ST', 'O', 0),
+        ('city', None, 'ST', 'O', 0),
+        ('state_or_province', None, 'ST', 'O', 0),
+        ('zip_or_postal_code', None, 'ST', 'O', 0),
+        ('country', None, 'ID', 'O', 0),
+        ('address_type', None, 'ID', 'O', 0),
+        ('other_geographic_designation', None, 'ST', 'O', 0),
+        ('countyparish_code', None, 'IS', 'O', 0),
+        ('census_tract', None, 'IS', 'O', 0),
+        ('address_representation_code', None, 'ID', 'O', 0),
+        ('address_validity_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+),
+    'XCN': (\
+        ('id_number', None, 'ST', 'O', 0),
+        ('family_name', compositetrans.fieldtransformFN, 'FN', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('second_and_further_given_names_or_initials_thereof', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+        ('degree', None, 'IS', 'O', 0),
+        ('source_table', None, 'IS', 'O', 0),
+        ('assigning_authority', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('name_type_code', None, 'ID', 'O', 0),
+        ('identifier_check_digit', None, 'ST', 'O', 0),
+        ('check_digit_scheme', None, 'ID', 'O', 0),
+        ('identifier_type_code', None, 'ID', 'O', 0),
+        ('assigning_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('name_representation_code', None, 'ID', 'O', 0),
+        ('name_context', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('name_validity_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('name_assembly_order', None, 'ID', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+        ('professional_suffix', None, 'ST', 'O', 0),
+        ('assigning_jurisdiction', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+        ('assigning_agency_or_department', compositetrans.fieldtransformCWE, 'CWE', 'O', 0),
+),
+    'XON': (\
+        ('organization_name', None, 'ST', 'O', 0),
+        ('organization_name_type_code', None, 'IS', 'O', 0),
+        ('id_number', numtransform, 'NM', 'O', 0),
+        ('check_digit', numtransform, 'NM', 'O', 0),
+        ('check_digit_scheme', None, 'ID', 'O', 0),
+        ('assigning_authority', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('identifier_type_code', None, 'ID', 'O', 0),
+        ('assigning_facility', compositetrans.fieldtransformHD, 'HD', 'O', 0),
+        ('name_representation_code', None, 'ID', 'O', 0),
+        ('organization_identifier', None, 'ST', 'O', 0),
+),
+    'XPN': (\
+        ('family_name', compositetrans.fieldtransformFN, 'FN', 'O', 0),
+        ('given_name', None, 'ST', 'O', 0),
+        ('second_and_further_given_names_or_initials_thereof', None, 'ST', 'O', 0),
+        ('suffix', None, 'ST', 'O', 0),
+        ('prefix', None, 'ST', 'O', 0),
+        ('degree', None, 'IS', 'O', 0),
+        ('name_type_code', None, 'ID', 'O', 0),
+        ('name_representation_code', None, 'ID', 'O', 0),
+        ('name_context', compositetrans.fieldtransformCE, 'CE', 'O', 0),
+        ('name_validity_range', compositetrans.fieldtransformDR, 'DR', 'O', 0),
+        ('name_assembly_order', None, 'ID', 'O', 0),
+        ('effective_date', datetransform, 'TS', 'O', 0),
+        ('expiration_date', datetransform, 'TS', 'O', 0),
+        ('professional_suffix', None, 'ST', 'O', 0),
+),
+    'XTN': (\
+        ('telephone_number', None, 'ST', 'O', 0),
+        ('telecommunication_use_code', None, 'ID', 'O', 0),
+        ('telecommunication_equipment_type', None, 'ID', 'O', 0),
+        ('email_address', None, 'ST', 'O', 0),
+        ('country_code', numtransform, 'NM', 'O', 0),
+        ('areacity_code', numtransform, 'NM', 'O', 0),
+        ('local_number', numtransform, 'NM', 'O', 0),
+        ('extension', numtransform, 'NM', 'O', 0),
+        ('any_text', None, 'ST', 'O', 0),
+        ('extension_prefix', None, 'ST', 'O', 0),
+        ('speed_dial_code', None, 'ST', 'O', 0),
+        ('unformatted_telephone_number', None, 'ST', 'O', 0),
+),
+}
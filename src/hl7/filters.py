@@ -0,0 +1,309 @@
+"""Filter expressions compiled to closures over raw messages.
+
+A :cls:`Filter` is compiled once from an expression such as::
+
+    MSH.message_type = "ORU^R01"
+        and any(OBX.observation_identifier.identifier in {"2345-7", "2951-2"})
+
+and then called on the raw text of each message.  Field paths are those
+of :func:`hl7.compile_path`, resolved against the schema here rather
+than per message.  The fields are pulled out of the text with a
+:cls:`hl7.Projection` per segment id, the first time a condition needs
+them, so that the segments not named are never split and a message
+failing on its MSH has nothing past it looked at.
+
+A path names the first occurrence of its field, except inside ``any(...)``
+and ``all(...)``, which try their condition on every segment of the one
+segment id it names.  Values are compared as raw text (a missing field
+being None), or as numbers when compared with a number, values that are
+not HL7 numbers (see :func:`hl7.tonumber`) then being None.  Also
+available are ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``not in``,
+``exists(path)``, ``not`` and parentheses.
+
+>>> f = Filter('MSH.message_type = "ORU^R01" and '
+...            'any(OBX.observation_identifier.identifier in {"2345-7", "2951-2"} '
+...            'and OBX.observation_value > 100)')
+>>> f('MSH|^~\\\\&|LAB||||||ORU^R01|C1|P|2.4\\rOBX|1|NM|2345-7^GLU||182')
+True
+>>> f('MSH|^~\\\\&|LAB||||||ORU^R01|C1|P|2.4\\rOBX|1|NM|2951-2^NA||99')
+False
+>>> f('MSH|^~\\\\&|LAB||||||ADT^A01|C1|P|2.4\\rPID|||1')
+False
+"""
+
+import re
+
+from hl7trans import tonumber
+from peek import line_end
+from projection import Projection, compile_path
+
+__all__ = ['Filter']
+
+_token = re.compile(r'''\s*(?:
+    (?P<string>"(?:[^"\\]|\\.)*") |
+    (?P<number>-?\d+(?:\.\d*)?(?![\w.])) |
+    (?P<path>[A-Z][A-Z0-9]{2}(?:\.\w+)+) |
+    (?P<name>[a-z_]+) |
+    (?P<op>!=|<=|>=|[=<>(){},])
+    )''', re.VERBOSE)
+
+_KEYWORDS = frozenset(['and', 'or', 'not', 'in', 'any', 'all', 'exists'])
+
+def _tokenize(expression):
+    tokens = []
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        m = _token.match(expression, pos)
+        if m is None:
+            raise ValueError, "bad filter at %s" % repr(expression[pos:])
+        kind = m.lastgroup
+        val = m.group(kind)
+        if kind == 'string':
+            val = re.sub(r'\\(.)', r'\1', val[1:-1])
+        elif kind == 'number':
+            val = float(val)
+        elif kind == 'name':
+            if val not in _KEYWORDS:
+                raise ValueError, "unknown word %s in filter" % repr(val)
+            kind = 'op'
+        tokens.append((kind, val))
+        pos = m.end()
+    tokens.append(('end', None))
+    return tokens
+
+## comparisons on (field value, literal); None never orders
+_COMPARE = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a is not None and a < b,
+    '<=': lambda a, b: a is not None and a <= b,
+    '>': lambda a, b: a is not None and a > b,
+    '>=': lambda a, b: a is not None and a >= b,
+}
+
+class _Fields(object):
+    """The fields of one message, extracted a segment id at a time."""
+    __slots__ = ('text', 'projections', 'values')
+
+    def __init__(self, text, projections):
+        self.text = text
+        self.projections = projections
+        self.values = {}
+
+    def get(self, path, segid):
+        values = self.values.get(path)
+        if values is None:
+            text = self.text
+            if segid == 'MSH' and text.startswith('MSH'):
+                text = text[:line_end(text, 0)]
+            self.values.update(self.projections[segid].extract(text))
+            values = self.values[path]
+        return values
+
+class Filter(object):
+    """Precompiled filter *expression*, its paths resolved against the
+    schema nearest to *version*.  Calling it on the raw text of a
+    message says whether the message matches.
+    """
+    def __init__(self, expression, version='2.5'):
+        self.expression = expression
+        self.version = version
+        ## path -> segment id, for the Projections
+        self._paths = {}
+        self._tokens = _tokenize(expression)
+        self._pos = 0
+        self._scope = None
+        self._test = self._or()
+        if self._tokens[self._pos][0] != 'end':
+            self._fail()
+        del self._tokens
+        bysegment = {}
+        for (path, segid) in self._paths.items():
+            bysegment.setdefault(segid, []).append(path)
+        self._projections = {}
+        for (segid, paths) in bysegment.items():
+            paths.sort()
+            self._projections[segid] = Projection(paths, version)
+        self.paths = sorted(self._paths)
+
+    def __call__(self, text):
+        return self._test(_Fields(text, self._projections), 0)
+
+    def __repr__(self):
+        return "Filter(%r)" % self.expression
+
+    ## recursive descent, building a closure ``test(fields, i)`` per
+    ## node, *i* being the occurrence within any() and all()
+
+    def _peek(self):
+        return self._tokens[self._pos]
+
+    def _next(self):
+        tok = self._tokens[self._pos]
+        self._pos += 1
+        return tok
+
+    def _fail(self):
+        (kind, val) = self._peek()
+        if kind == 'end':
+            raise ValueError, "unexpected end of filter %s" % \
+                        repr(self.expression)
+        raise ValueError, "unexpected %s in filter %s" % (repr(val),
+                                                          repr(self.expression))
+
+    def _expect(self, op):
+        if self._next() != ('op', op):
+            self._pos -= 1
+            self._fail()
+
+    def _or(self):
+        tests = [self._and()]
+        while self._peek() == ('op', 'or'):
+            self._next()
+            tests.append(self._and())
+        if len(tests) == 1:
+            return tests[0]
+        def test(fields, i):
+            for t in tests:
+                if t(fields, i):
+                    return True
+            return False
+        return test
+
+    def _and(self):
+        tests = [self._not()]
+        while self._peek() == ('op', 'and'):
+            self._next()
+            tests.append(self._not())
+        if len(tests) == 1:
+            return tests[0]
+        def test(fields, i):
+            for t in tests:
+                if not t(fields, i):
+                    return False
+            return True
+        return test
+
+    def _not(self):
+        if self._peek() == ('op', 'not'):
+            self._next()
+            inner = self._not()
+            return lambda fields, i: not inner(fields, i)
+        return self._atom()
+
+    def _atom(self):
+        (kind, val) = self._next()
+        if kind == 'op' and val == '(':
+            test = self._or()
+            self._expect(')')
+            return test
+        if kind == 'op' and val in ('any', 'all'):
+            return self._quantifier(val)
+        if kind == 'op' and val == 'exists':
+            self._expect('(')
+            value = self._path()
+            self._expect(')')
+            return lambda fields, i: value(fields, i) is not None
+        if kind == 'path':
+            self._pos -= 1
+            return self._comparison()
+        self._pos -= 1
+        self._fail()
+
+    def _quantifier(self, which):
+        if self._scope is not None:
+            raise ValueError, "nested %s() in filter %s" % (which,
+                                                          repr(self.expression))
+        self._expect('(')
+        self._scope = []
+        inner = self._or()
+        self._expect(')')
+        (scope, self._scope) = (self._scope, None)
+        segids = set([segid for (path, segid) in scope])
+        if len(segids) != 1:
+            raise ValueError, "%s() must name fields of one segment in " \
+                        "filter %s" % (which, repr(self.expression))
+        ## every path of the segment has a value per occurrence
+        (path, segid) = scope[0]
+        if which == 'any':
+            def test(fields, i):
+                for j in xrange(len(fields.get(path, segid))):
+                    if inner(fields, j):
+                        return True
+                return False
+        else:
+            def test(fields, i):
+                for j in xrange(len(fields.get(path, segid))):
+                    if not inner(fields, j):
+                        return False
+                return True
+        return test
+
+    def _path(self):
+        """A closure ``value(fields, i)`` for the path to come."""
+        (kind, path) = self._next()
+        if kind != 'path':
+            self._pos -= 1
+            self._fail()
+        segid = compile_path(path, self.version)[0]
+        self._paths[path] = segid
+        if self._scope is not None:
+            self._scope.append((path, segid))
+            def value(fields, i):
+                values = fields.get(path, segid)
+                if i < len(values):
+                    return values[i]
+                return None
+        else:
+            def value(fields, i):
+                values = fields.get(path, segid)
+                if values:
+                    return values[0]
+                return None
+        return value
+
+    def _literal(self):
+        (kind, val) = self._next()
+        if kind not in ('string', 'number'):
+            self._pos -= 1
+            self._fail()
+        return val
+
+    def _comparison(self):
+        value = self._path()
+        (kind, op) = self._next()
+        negate = False
+        if (kind, op) == ('op', 'not'):
+            (kind, op) = self._next()
+            negate = True
+            if op != 'in':
+                self._pos -= 1
+                self._fail()
+        if kind != 'op' or op not in _COMPARE and op != 'in':
+            self._pos -= 1
+            self._fail()
+        if op == 'in':
+            self._expect('{')
+            literals = [self._literal()]
+            while self._peek() == ('op', ','):
+                self._next()
+                literals.append(self._literal())
+            self._expect('}')
+            strings = frozenset([v for v in literals
+                                 if isinstance(v, basestring)])
+            numbers = frozenset([v for v in literals if isinstance(v, float)])
+            def test(fields, i):
+                val = value(fields, i)
+                if val in strings:
+                    return not negate
+                if numbers and tonumber(val) in numbers:
+                    return not negate
+                return negate
+            return test
+        literal = self._literal()
+        compare = _COMPARE[op]
+        if isinstance(literal, float):
+            return lambda fields, i: compare(tonumber(value(fields, i)),
+                                             literal)
+        return lambda fields, i: compare(value(fields, i), literal)
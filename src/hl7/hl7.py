@@ -108,10 +108,13 @@ import pprint
 from xml.sax import saxutils, handler
 from xml import sax
 
-from segments import segment_revs
+from segments import segment_revs, resolve_version
+from composites import composite_revs
 import compositetrans
 from hl7util import *
 from hl7trans import *
+from hl7intern import *
+from hl7records import record_classes
 
 def ishl7(line):
     """Determines whether a *line* looks like an HL7 message.
@@ -143,7 +146,7 @@ def segments(segment_id, message):
     ## all segments that match
     return [segment for segment in message if segment[0][0] == segment_id]
 
-def parse(line):
+def parse(line, projection=None, interner=None):
     """Returns a instance of the Message class that allows indexed access
     to the data elements. 
 
@@ -151,15 +154,24 @@ def parse(line):
     >>> h = parse(message)
     >>> str(h) == message
     True
+
+    When a :cls:`hl7.Projection` is given, only the fields it names are
+    located (by counting separators) and a dict of their values is
+    returned instead of a Message.
+
+    Segment ids are always interned; other values are passed through
+    *interner* (e.g. an :cls:`hl7.InternTable`) when one is given.
     """
     ## Strip out unnecessary whitespace
     strmsg = line.strip()
+    if projection is not None:
+        return projection.extract(strmsg)
     ## The method for parsing the message
     plan = create_parse_plan(strmsg)
     ## Start spliting the methods based upon the ParsePlan
-    return _split(strmsg, plan)
+    return _split(strmsg, plan, None, interner)
 
-def _split(text, plan):
+def _split(text, plan, src=None, interner=None):
     """Recursive function to split the *text* into an n-deep list,
     according to the :cls:`hl7._ParsePlan`. 
     """
@@ -167,15 +179,75 @@ def _split(text, plan):
     if not plan:
         return text
     
-    ## Recurse so that the sub plans are used in order to split the data
-    ## into the approriate type as defined by the current plan.
-    data = [_split(x, plan.next()) for x in text.split(plan.separator)]
+    kls = plan.containers[0]
+    ## Containers that cache their source text (segments) start a new
+    ## source cell, which is shared with their children so that a
+    ## mutation anywhere below can invalidate it.
+    if kls._caches:
+        src = [text]
+    parts = text.split(plan.separator)
+    if kls is Segment:
+        ## the segment id is the first field; a field without component
+        ## separators splits into itself, so this is what ends up in
+        ## seg[0][0]
+        parts[0] = segment_ids(parts[0])
+    subplan = plan.next()
+    if subplan is None:
+        ## the last level holds plain strings, no need to recurse
+        if interner is not None:
+            parts = map(interner, parts)
+        data = parts
+    else:
+        ## Recurse so that the sub plans are used in order to split the
+        ## data into the approriate type as defined by the current plan.
+        data = [_split(x, subplan, src, interner) for x in parts]
     ## Return the instance of the current message part according
     ## to the plan
-    return plan.container(data)
+    container = plan.container(data)
+    if src is not None:
+        container._src = src
+    return container
+
+def _detached(container):
+    """A copy of *container*, and of the Containers in it, outside any
+    source cell."""
+    new = container.__class__(container.separator,
+                              [_detached(x) if isinstance(x, Container) else x
+                               for x in container])
+    new.__dict__.update(container.__dict__)
+    new.__dict__.pop('_src', None)
+    return new
+
+def _claim(container, src):
+    """Puts *container* and the Containers in it under the source cell
+    *src*.  Returns it, or a copy if it already belongs to another
+    cell."""
+    if container._src is not None:
+        if container._src is src:
+            return container
+        container = _detached(container)
+    if src is not None:
+        stack = [container]
+        while stack:
+            x = stack.pop()
+            x._src = src
+            stack.extend([y for y in x if isinstance(y, Container)])
+    return container
 
 class Container(list):
-    """Abstract root class for the parts of the HL7 message."""
+    """Abstract root class for the parts of the HL7 message.
+
+    Parsed containers remember the source text of their segment in a
+    one-element list (the "source cell") shared by the segment and its
+    fields.  Every mutating list method clears the cell, so that the
+    segment knows it has to be re-encoded.  A container is in one cell
+    only: copying it, or putting it into another segment, copies it.
+    """
+    ## the source cell, see above; None when not parsed from text
+    _src = None
+    ## whether this level keeps its own source cell
+    _caches = False
+
     def __init__(self, separator, sequence=[]):
         ## Initialize the list object, optionally passing in the
         ## sequence.  Since list([]) == [], using the default
@@ -190,11 +262,109 @@ class Container(list):
         ## method for turning the python-hl7 representation of HL7 into
         ## a standard string
         return self.separator.join((str(x) for x in self))
+
+    def _touch(self):
+        """Marks the enclosing segment as modified."""
+        src = self._src
+        if src is not None:
+            src[0] = None
+
+    def _adopt(self, values):
+        """Returns the children about to be added, put under our source
+        cell; those belonging to another one are copied."""
+        src = self._src
+        res = []
+        for x in values:
+            if isinstance(x, Container):
+                x = _claim(x, src)
+            res.append(x)
+        return res
+
+    def __copy__(self):
+        ## a shallow copy would share the source cell, and children
+        ## can only be in one
+        return _detached(self)
+
+    ## the mutating list methods, all of which dirty the segment
+
+    def __setitem__(self, key, value):
+        self._touch()
+        if isinstance(key, slice):
+            value = self._adopt(value)
+        else:
+            value = self._adopt((value,))[0]
+        super(Container, self).__setitem__(key, value)
+
+    def __setslice__(self, i, j, values):
+        self.__setitem__(slice(max(i, 0), max(j, 0)), values)
+
+    def __delitem__(self, key):
+        self._touch()
+        super(Container, self).__delitem__(key)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(max(i, 0), max(j, 0)))
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __imul__(self, n):
+        self._touch()
+        return super(Container, self).__imul__(n)
+
+    def append(self, value):
+        self._touch()
+        value = self._adopt((value,))[0]
+        super(Container, self).append(value)
+
+    def extend(self, values):
+        self._touch()
+        values = self._adopt(values)
+        super(Container, self).extend(values)
+
+    def insert(self, i, value):
+        self._touch()
+        value = self._adopt((value,))[0]
+        super(Container, self).insert(i, value)
+
+    def pop(self, *args):
+        self._touch()
+        return super(Container, self).pop(*args)
+
+    def remove(self, value):
+        self._touch()
+        super(Container, self).remove(value)
+
+    def reverse(self):
+        self._touch()
+        super(Container, self).reverse()
+
+    def sort(self, *args, **kwargs):
+        self._touch()
+        super(Container, self).sort(*args, **kwargs)
     
 class Message(Container):
     """Representation of an HL7 message. It contains a list
     of :cls:`hl7.Segment` instances.
     """
+    ## bumped whenever segments are added, removed or moved, so that
+    ## :cls:`hl7.cMessage` knows its wrappers are stale
+    _generation = 0
+
+    def _touch(self):
+        self._generation += 1
+        Container._touch(self)
+
+    def _adopt(self, values):
+        ## segments keep their own source cells
+        return list(values)
+
+    def __copy__(self):
+        new = Message(self.separator, self)
+        new.__dict__.update(self.__dict__)
+        return new
+
     def __getitem__(self, key):
         res = []
         #print "__getitem__", key, len(self)
@@ -214,7 +384,32 @@ class Segment(Container):
     Traditionally this is a line of a message that ends with a carriage
     return and is separated by pipes. It contains a list of
     :cls:`hl7.Field` instances.
+
+    A segment that has not been modified since it was parsed (or last
+    turned into a string) re-emits its text without re-encoding.
     """
+    _caches = True
+
+    def __str__(self):
+        src = self._src
+        if src is not None and src[0] is not None:
+            return src[0]
+        text = self.separator.join((str(x) for x in self))
+        ## only cache when every change below us would be seen; plain
+        ## lists put into a segment are not tracked
+        for x in self:
+            if not isinstance(x, (Container, basestring)):
+                return text
+        if src is None:
+            src = self._src = [text]
+            for (i, x) in enumerate(self):
+                if isinstance(x, Container):
+                    y = _claim(x, src)
+                    if y is not x:
+                        list.__setitem__(self, i, y)
+        else:
+            src[0] = text
+        return text
 
 class Field(Container):
     """Third level of an HL7 message, that traditionally is surrounded
@@ -277,14 +472,33 @@ class _ParsePlan(object):
 
 
 class Transform(object):
-    def __init__(self, message, data, segname):
+    """Attribute access to the fields of a segment, by the names of
+    the message's schema.
+
+    Fields are assigned in place (``pid.patient_name = 'DOE^JOHN'``).
+    A composite field with a single component reads as that string, and
+    an empty one as None, so components cannot be assigned through a
+    read in general: ``pid.patient_name.family_name = 'X'`` only works
+    when the field happens to hold several components.  Use
+    :meth:`field`, which always returns a writable
+    :cls:`hl7.FieldTransform`:
+
+        pid.field('patient_name').family_name = 'X'
+    """
+    def __init__(self, message, data, segname, transform=None):
         #print "Transform", segname, message, data
         self.data = data
         self._message = message
         self.segname = segname
-        self._transform = segment_revs[message._version].transforms[self.segname]
+        if transform is None:
+            transform = message._segments[segname]
+        self._transform = transform
 
     def __iter__(self):
+        ## the per-segment wrappers cMessage keeps for ORC, OBR and OBX
+        items = self.__dict__.get('_items')
+        if items is not None:
+            return iter(items)
         return TIter(self).__iter__()
 
     def __getitem__(self, key):
@@ -350,6 +564,44 @@ class Transform(object):
             val = typ(self, self.data, val)
         return val
 
+    def __setattr__(self, key, value):
+        if key.startswith('_') or key in ('data', 'segname'):
+            object.__setattr__(self, key, value)
+            return
+        self.set_field(self.get_transform(key)[0], value)
+
+    def set_field(self, idx, value):
+        """Writes *value* into field *idx* of the underlying segment, in
+        place, padding the segment with empty fields if it is too short.
+        See :func:`hl7.as_field` for the values accepted.
+        """
+        data = self.data
+        if not isinstance(data, Segment):
+            raise TypeError, "%s wraps %d segments, not one" % \
+                        (self.segname, len(data))
+        cs = component_separator(data)
+        if idx >= len(data):
+            data.extend([Field(cs, ['']) for i in xrange(idx + 1 - len(data))])
+        data[idx] = as_field(value, cs)
+        ## e.g. the OBX-5 converter picked from OBX-2
+        self.__dict__.pop('_valuetype', None)
+
+    def field(self, key):
+        """Returns a writable :cls:`hl7.FieldTransform` on the composite
+        field *key*, creating the field if the segment is too short, so
+        that components can be assigned whatever their current state:
+
+            pid.field('patient_name').family_name = 'X'
+        """
+        (idx, typ) = self.get_transform(key)
+        compname = datatype_of(typ)
+        if compname is None:
+            raise TypeError, "%s.%s is not a composite field" % \
+                        (self.segname, key)
+        if idx >= len(self.data):
+            self.set_field(idx, None)
+        return FieldTransform(self._message, self.data[idx], compname)
+
     def fieldcheck(self, val):
         if len(val) == 0:
             return None
@@ -364,6 +616,30 @@ class Transform(object):
             return self.transform[key]
         return self._transform[key]
 
+def component_separator(segment):
+    """The component separator used by the fields of *segment*."""
+    for x in segment:
+        if isinstance(x, Container):
+            return x.separator
+    return '^'
+
+def as_field(value, separator='^'):
+    """Turns *value* into a :cls:`hl7.Field` for assignment into a
+    segment: a string or other scalar becomes a single component, a
+    list or tuple one component per item.  Fields already belonging to
+    a parsed segment (including those wrapped by a FieldTransform) are
+    copied rather than shared.
+    """
+    if isinstance(value, FieldTransform):
+        value = value.data
+    if isinstance(value, Container):
+        if value._src is None:
+            return value
+        return Field(value.separator, value)
+    if isinstance(value, (list, tuple)):
+        return Field(separator, [encode_value(x) for x in value])
+    return Field(separator, [encode_value(value)])
+
 class cNTE(Transform):
     """
     """
@@ -428,21 +704,83 @@ class cOBR(Transform):
     """
     transform = { }
     
+def message_version(message):
+    """The version id (MSH-12) of the parsed *message*, None if it has
+    none."""
+    for seg in list.__iter__(message):
+        if len(seg) > 11 and seg[0][0] == 'MSH':
+            return seg[11][0] or None
+        break
+    return None
+
+## wrapper classes for the segments that have their own
+_wrappers = {'MSH': cMSH, 'NTE': cNTE, 'PID': cPID,
+             'ORC': cORC, 'OBX': cOBX, 'OBR': cOBR}
 
 class cMessage(object):
-    def __init__(self, hl7, version):
+    """Schema-aware view of the parsed message *hl7*.  *version* is
+    resolved to the nearest schema there is (see
+    :func:`hl7.resolve_version`); when None, MSH-12 of the message is.
+    """
+    def __init__(self, hl7, version=None):
         self._hl7 = hl7
-        self._version = version
+        if version is None:
+            version = message_version(hl7)
+        self._version = resolve_version(version)
+        ## resolved once here rather than by every Transform and
+        ## FieldTransform
+        self._segments = segment_revs[self._version].transforms
+        self._composites = composite_revs[self._version].transforms
+        self._records = record_classes(self._version)
+        self.invalidate()
+    def invalidate(self):
+        """Drops the cached segment wrappers.  Adding, removing or
+        moving segments of the message does this by itself; changing the
+        id of a segment in place does not.
+        """
+        self._cache = {}
+        self._generation = self._hl7._generation
+    def _wrapper(self, segname, many):
+        """The wrapper for the *segname* segments: of the first one, or
+        when *many* of all of them (iterating over their own wrappers),
+        built on first use.
+        """
+        if self._generation != self._hl7._generation:
+            self.invalidate()
+        t = self._cache.get(segname)
+        if t is None:
+            kls = _wrappers.get(segname, Transform)
+            segs = self._hl7[segname]
+            if many:
+                t = kls(self, segs, segname)
+                t._items = [kls(self, seg, segname, t._transform)
+                            for seg in segs]
+            else:
+                t = kls(self, segs[0], segname)
+            self._cache[segname] = t
+        return t
+    def append_segment(self, segname, **fields):
+        """Appends a new *segname* segment to the message, assigns the
+        named *fields* on it and returns its wrapper.
+        """
+        msh = list.__getitem__(self._hl7, 0)
+        seg = Segment(msh.separator,
+                      [Field(component_separator(msh), [segname])])
+        self._hl7.append(seg)
+        t = _wrappers.get(segname, Transform)(self, seg, segname)
+        for (k, v) in fields.items():
+            setattr(t, k, v)
+        return t
     def get_msh(self):
-        return cMSH(self, self._hl7['MSH'][0], 'MSH')
+        return self._wrapper('MSH', False)
     def get_pid(self):
-        return cPID(self, self._hl7['PID'][0], 'PID')
+        return self._wrapper('PID', False)
     def get_orc(self):
-        return cORC(self, self._hl7['ORC'], 'ORC')
+        return self._wrapper('ORC', True)
     def get_obr(self):
-        return cOBR(self, self._hl7['OBR'], 'OBR')
+        return self._wrapper('OBR', True)
     def get_obx(self):
-        return cOBX(self, self._hl7['OBX'], 'OBX')
+        return self._wrapper('OBX', True)
     MSH = property(get_msh)
     PID = property(get_pid)
     ORC = property(get_orc)
@@ -463,6 +801,27 @@ class cMessage(object):
         return None
 
 
+def build_message(version, **fields):
+    """Returns a new :cls:`hl7.cMessage` holding just an MSH segment
+    with the default encoding characters, the version id and the named
+    MSH *fields* set.  Further segments are added with
+    :meth:`cMessage.append_segment`.
+
+    >>> m = build_message('2.4', message_type=('ADT', 'A01'),
+    ...                   message_control_id='X1')
+    >>> m.append_segment('PID', patient_name=('DOE', 'JANE')).patient_name.given_name
+    'JANE'
+    >>> str(m._hl7).replace('\\n', '/')
+    'MSH|^~\\\\&|||||||ADT^A01|X1||2.4/PID|||||DOE^JANE'
+    """
+    msg = cMessage(parse('MSH|^~\\&'), version)
+    msh = msg.MSH
+    msh.version_id = version
+    for (k, v) in fields.items():
+        setattr(msh, k, v)
+    return msg
+
+
 # --- The ContentHandler
 
 class HL7Handler(handler.ContentHandler):
@@ -0,0 +1,72 @@
+"""String interning for the tokens that repeat across messages.
+
+Segment ids, coding system names, units, value types and facility codes
+turn up in nearly every message; without interning each occurrence is a
+separate string object.  :func:`hl7.parse` always passes segment ids
+through :data:`segment_ids`, and short field values through an
+:cls:`InternTable` when one is given.
+
+>>> t = InternTable()
+>>> a = t(''.join(['mg', '/dl']))
+>>> b = t(''.join(['mg/', 'dl']))
+>>> a is b, len(t)
+(True, 1)
+"""
+
+import sys
+
+__all__ = ['InternTable', 'segment_ids', 'string_footprint']
+
+class InternTable(object):
+    """A bounded intern table.  Strings longer than *maxlen* are passed
+    through untouched; once *maxsize* distinct strings are held, new
+    ones are no longer added (the table never evicts, so that the
+    strings already shared stay shared).  Works for both str and
+    unicode, unlike the builtin intern().
+    """
+    def __init__(self, maxsize=65536, maxlen=16):
+        self.maxsize = maxsize
+        self.maxlen = maxlen
+        self._strings = {}
+
+    def __call__(self, s):
+        if len(s) > self.maxlen:
+            return s
+        strings = self._strings
+        v = strings.get(s)
+        if v is not None:
+            return v
+        if len(strings) < self.maxsize:
+            strings[s] = s
+        return s
+
+    def __len__(self):
+        return len(self._strings)
+
+    def clear(self):
+        self._strings.clear()
+
+## segment ids are three characters, and there are only so many of them
+segment_ids = InternTable(maxsize=4096, maxlen=3)
+
+def string_footprint(messages):
+    """Walks the parsed *messages* and returns ``(total, distinct,
+    nbytes)``: the number of string references held by the component
+    lists, the number of distinct string objects among them and the
+    bytes those objects occupy.
+    """
+    seen = {}
+    total = 0
+    nbytes = 0
+    getsizeof = sys.getsizeof
+    stack = list(messages)
+    while stack:
+        x = stack.pop()
+        if isinstance(x, basestring):
+            total += 1
+            if id(x) not in seen:
+                seen[id(x)] = x
+                nbytes += getsizeof(x)
+        else:
+            stack.extend(x)
+    return (total, len(seen), nbytes)
@@ -0,0 +1,146 @@
+"""Bulk conversion of messages to dicts and JSON Lines.
+
+:func:`to_dict` walks the segments of a parsed message in field order
+against the generated positional tables (see :mod:`hl7.fields`), which
+give each field position its name and datatype, so no
+:cls:`hl7.Transform` is built and nothing goes through ``__getattr__``.
+Only populated fields and components are emitted.
+
+>>> d = to_dict(parse('MSH|^~\\\\&|GHH LAB||||||ADT^A01|X1|P|2.4\\n'
+...                   'PID|||555-44-4444||DOE^JANE'), '2.4')
+>>> pid = d['segments'][1]
+>>> pid['segment'], pid['fields']['patient_identifier_list']
+('PID', '555-44-4444')
+>>> sorted(pid['fields']['patient_name'].items())
+[('family_name', 'DOE'), ('given_name', 'JANE')]
+>>> d = to_dict(parse('MSH|^~\\\\&|LAB||||||ORU^R01|X2|P|2.3\\n'
+...                   'OBX|1|NM|2345-7^GLUCOSE^LN^G1^GLU LOCAL^99LOC'), '2.3')
+>>> obx3 = d['segments'][1]['fields']['observation_identifier']
+>>> obx3['name_of_coding_system'], obx3['name_of_coding_system_6']
+('LN', '99LOC')
+"""
+
+import json
+
+from hl7 import parse
+from fields import field_revs
+from segments import resolve_version
+
+__all__ = ['to_dict', 'write_jsonl', 'field_names']
+
+## per version: segment id -> list of (field name, component names or
+## None), indexed by field position
+_field_names = {}
+
+def _unique(names, offset):
+    """*names* with every repeat of a name suffixed with its position
+    (index + *offset*), so that no two positions share a key."""
+    seen = set()
+    res = []
+    for (i, name) in enumerate(names):
+        if name is not None:
+            if name in seen:
+                name = '%s_%d' % (name, i + offset)
+            seen.add(name)
+        res.append(name)
+    return tuple(res)
+
+def _names(layout):
+    return _unique([entry and entry[0] or None for entry in layout], 1)
+
+def field_names(version):
+    """Returns the positional field tables for *version* (or the nearest
+    there is, see :func:`hl7.resolve_version`), building them
+    from :data:`hl7.fields.field_revs` on first use.  Where a layout
+    gives a name twice, the later positions get it suffixed with their
+    number, e.g. ``name_of_coding_system_6`` for CE.6 in 2.3.
+
+    >>> field_names('2.2')['ORC'][2][0], field_names('2.2')['ORC'][4][0]
+    ('placer_order_num', 'placer_order_num_4')
+    """
+    version = resolve_version(version)
+    tables = _field_names.get(version)
+    if tables is not None:
+        return tables
+    revs = field_revs[version]
+    components = {}
+    for (dt, layout) in revs.composites.items():
+        components[dt] = _names(layout)
+    tables = {}
+    for (segid, layout) in revs.segments.items():
+        ## field numbers are one up for MSH, see to_dict
+        names = _unique([entry and entry[0] or None for entry in layout],
+                        segid == 'MSH' and 1 or 0)
+        tables[segid] = tuple([entry and (name, components.get(entry[2]))
+                               or (None, None)
+                               for (name, entry) in zip(names, layout)])
+    _field_names[version] = tables
+    return tables
+
+def to_dict(message, version):
+    """Returns ``{'version': version, 'segments': [...]}`` for the parsed
+    *message*, one ``{'segment': id, 'fields': {...}}`` per segment, in
+    order.  Simple fields map to their text, composite fields with more
+    than one component to a dict of the populated components.  Fields
+    and components the schema has no name for are keyed by position,
+    e.g. ``'ZPI.3'`` or ``'12'``.
+    """
+    tables = field_names(version)
+    segs = []
+    for seg in list.__iter__(message):
+        segid = seg[0][0]
+        layout = tables.get(segid, ())
+        nlayout = len(layout)
+        fields = {}
+        start = 1
+        offset = 0
+        if segid == 'MSH':
+            ## MSH-1 is the field separator itself, see segment_revs
+            fields['field_separator'] = seg.separator
+            if len(seg) > 1:
+                fields['encoding_characters'] = seg[1].separator.join(seg[1])
+            start = 2
+            offset = 1
+        for idx in xrange(start, len(seg)):
+            f = seg[idx]
+            if idx < nlayout and layout[idx][0] is not None:
+                (name, components) = layout[idx]
+            else:
+                name = '%s.%d' % (segid, idx + offset)
+                components = None
+            if len(f) == 1:
+                if f[0]:
+                    fields[name] = f[0]
+                continue
+            if components is None:
+                fields[name] = f.separator.join(f)
+                continue
+            ncomponents = len(components)
+            d = {}
+            for (ci, c) in enumerate(f):
+                if not c:
+                    continue
+                if ci < ncomponents and components[ci] is not None:
+                    d[components[ci]] = c
+                else:
+                    d[str(ci + 1)] = c
+            if d:
+                fields[name] = d
+        segs.append({'segment': segid, 'fields': fields})
+    return {'version': version, 'segments': segs}
+
+def write_jsonl(messages, out, version):
+    """Writes one JSON document per line to the file-like *out* for each
+    of *messages* (parsed, or raw text which is parsed here), streaming:
+    only one message is held at a time.  Returns the number written.
+    """
+    dumps = json.dumps
+    write = out.write
+    n = 0
+    for message in messages:
+        if isinstance(message, basestring):
+            message = parse(message)
+        write(dumps(to_dict(message, version), separators=(',', ':')))
+        write('\n')
+        n += 1
+    return n
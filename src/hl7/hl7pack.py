@@ -0,0 +1,197 @@
+"""Compact binary serialization of parsed messages.
+
+Pickling a :cls:`hl7.Message` stores every Segment and Field with its
+own ``separator`` attribute.  :func:`dumps` instead stores the message
+text (which clean segments hand back without re-encoding), the table of
+segment offsets into it and, optionally, a cache of already converted
+values; :func:`loads` slices the text at the stored offsets into
+segments that are only split into fields when first looked into, so
+that messages which are only passed on or re-encoded never are.
+
+>>> h = parse('MSH|^~\\\\&|GHH LAB|ELAB-3\\nPID|||555-44-4444||DOE^JANE')
+>>> data = dumps(h, {(1, 5): ('DOE', 'JANE')})
+>>> (m, values) = loads(data, with_values=True)
+>>> str(m) == str(h), m == h, values
+(True, True, {(1, 5): ('DOE', 'JANE')})
+"""
+
+import datetime
+import marshal
+import struct
+import sys
+from array import array
+
+from hl7 import Message, Segment, Field, parse
+from hl7intern import segment_ids
+
+__all__ = ['dumps', 'loads']
+
+MAGIC = 'HL7B'
+FORMAT = 1
+
+## flags
+UNICODE = 1
+VALUES = 2
+
+## magic, format, flags, number of segments, text bytes, value bytes
+_header = struct.Struct('<4sBBIII')
+
+## the segment offsets that follow are little-endian uint32s too
+_OFFSET = [code for code in 'IL' if array(code).itemsize == 4][0]
+_SWAP = sys.byteorder == 'big'
+
+## datetimes are not marshallable, so they travel as tagged tuples
+_DATETIME = '\x00datetime'
+_DATE = '\x00date'
+
+def _pack_value(v):
+    if isinstance(v, datetime.datetime):
+        return (_DATETIME, v.year, v.month, v.day, v.hour, v.minute,
+                v.second, v.microsecond)
+    if isinstance(v, datetime.date):
+        return (_DATE, v.year, v.month, v.day)
+    if isinstance(v, (tuple, list)):
+        return type(v)([_pack_value(x) for x in v])
+    return v
+
+def _unpack_value(v):
+    if isinstance(v, tuple) and v:
+        if v[0] == _DATETIME:
+            return datetime.datetime(*v[1:])
+        if v[0] == _DATE:
+            return datetime.date(*v[1:])
+    if isinstance(v, (tuple, list)):
+        return type(v)([_unpack_value(x) for x in v])
+    return v
+
+def _separators(message):
+    fs = '|'
+    cs = '^'
+    for seg in list.__iter__(message):
+        fs = seg.separator
+        for f in seg:
+            if isinstance(f, Field):
+                cs = f.separator
+                break
+        break
+    return (message.separator, fs, cs)
+
+def dumps(message, values=None):
+    """Serializes *message*, plus an optional dict of *values* (anything
+    marshal can store, and datetimes) such as typed field conversions
+    keyed by ``(segment, field)`` index.
+    """
+    seps = _separators(message)
+    texts = [str(seg) for seg in list.__iter__(message)]
+    offsets = array(_OFFSET)
+    end = 0
+    for t in texts:
+        end += len(t)
+        offsets.append(end)
+        ## the segment separator
+        end += 1
+    text = ''.join(seps) + message.separator.join(texts)
+    if _SWAP:
+        offsets.byteswap()
+    flags = 0
+    if isinstance(text, unicode):
+        flags |= UNICODE
+        text = text.encode('utf-8')
+    packed = ''
+    if values is not None:
+        flags |= VALUES
+        packed = marshal.dumps(dict([(k, _pack_value(v))
+                                     for (k, v) in values.items()]))
+    return ''.join([_header.pack(MAGIC, FORMAT, flags, len(texts),
+                                 len(text), len(packed)),
+                    offsets.tostring(), text, packed])
+
+def loads(data, with_values=False):
+    """Rebuilds the Message serialized by :func:`dumps`, returning
+    ``(message, values)`` when *with_values* is set.
+    """
+    (magic, fmt, flags, nsegs, ntext, npacked) = \
+                _header.unpack_from(data, 0)
+    if magic != MAGIC or fmt != FORMAT:
+        raise ValueError, "not a serialized hl7 message"
+    pos = _header.size
+    offsets = array(_OFFSET)
+    offsets.fromstring(data[pos:pos + 4 * nsegs])
+    if _SWAP:
+        offsets.byteswap()
+    pos += 4 * nsegs
+    text = data[pos:pos + ntext]
+    pos += ntext
+    if flags & UNICODE:
+        text = text.decode('utf-8')
+    (ms, fs, cs) = text[:3]
+    text = text[3:]
+    segs = []
+    start = 0
+    for end in offsets:
+        segs.append(_segment(text[start:end], fs, cs))
+        start = end + 1
+    message = list.__new__(Message)
+    list.extend(message, segs)
+    message.separator = ms
+    if not with_values:
+        return message
+    values = None
+    if flags & VALUES:
+        values = marshal.loads(data[pos:pos + npacked])
+        for (k, v) in values.items():
+            values[k] = _unpack_value(v)
+    return (message, values)
+
+_new = list.__new__
+_extend = list.extend
+
+class _LazySegment(Segment):
+    """A clean Segment whose fields are only split out of its text the
+    first time anything but its text is asked for; it then turns into a
+    plain :cls:`hl7.Segment`.  Equivalent to what :func:`hl7.parse`
+    produces, but built without going through the plan.
+    """
+    def _load(self):
+        d = self.__dict__
+        cs = d.pop('_cs')
+        src = self._src
+        parts = src[0].split(self.separator)
+        parts[0] = segment_ids(parts[0])
+        fields = []
+        for part in parts:
+            f = _new(Field)
+            _extend(f, part.split(cs))
+            f.separator = cs
+            f._src = src
+            fields.append(f)
+        _extend(self, fields)
+        self.__class__ = Segment
+
+def _loading(name):
+    def method(self, *args):
+        self._load()
+        ## comparisons look straight into the other list
+        for x in args:
+            if isinstance(x, _LazySegment):
+                x._load()
+        return getattr(self, name)(*args)
+    method.__name__ = name
+    return method
+
+for _name in ('__len__', '__getitem__', '__getslice__', '__iter__',
+              '__reversed__', '__contains__', '__eq__', '__ne__', '__lt__',
+              '__le__', '__gt__', '__ge__', '__add__', '__mul__', '__rmul__',
+              '__repr__', 'count', 'index', '__setitem__', '__setslice__',
+              '__delitem__', '__delslice__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'reverse', 'sort',
+              '__copy__', '__reduce__', '__reduce_ex__'):
+    setattr(_LazySegment, _name, _loading(_name))
+del _name
+
+def _segment(text, fs, cs):
+    seg = _new(_LazySegment)
+    seg.separator = fs
+    seg._src = [text]
+    seg._cs = cs
+    return seg
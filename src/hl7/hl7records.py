@@ -0,0 +1,103 @@
+"""Record classes for the composites read most often.
+
+A :cls:`hl7.FieldTransform` looks every component up by name, through
+``__getattr__`` and the composite's schema, on every access.  For the
+composites below a class with one slot per component is generated from
+the schema instead: the plain text components are all filled in when
+the record is built, straight from the component list, and the others
+(dates, nested composites) are converted on first access and kept.
+Records are FieldTransforms, so everything else works as before.
+
+>>> from composites import composite_revs
+>>> XPN = record_classes('2.4')['XPN']
+>>> class M: _version = '2.4'; _composites = composite_revs['2.4'].transforms
+>>> n = XPN(M(), ['DOE', 'JANE', '', '', 'DR'], 'XPN')
+>>> n.given_name, n.prefix, n.suffix, str(n.family_name)
+('JANE', 'DR', None, 'DOE')
+"""
+
+from hl7util import FieldTransform
+from composites import composite_revs
+
+__all__ = ['record_classes', 'RECORDS']
+
+## the composites that get record classes: person and organisation
+## names, identifiers, coded elements, addresses and hierarchic
+## designators (PN being the person name of 2.1 to 2.3)
+RECORDS = ('XPN', 'PN', 'CX', 'CE', 'CWE', 'XAD', 'XCN', 'HD')
+
+_setslot = object.__setattr__
+_delslot = object.__delattr__
+_getattr = FieldTransform.__getattr__
+_set_component = FieldTransform.set_component
+
+class Record(FieldTransform):
+    """Base of the generated record classes."""
+    __slots__ = ()
+    ## component name -> index, of the slots
+    _slots = {}
+
+    def __getattr__(self, key):
+        ## only reached for the components not converted yet
+        val = _getattr(self, key)
+        if key in self._slots:
+            _setslot(self, key, val)
+        return val
+
+    def set_component(self, idx, value):
+        _set_component(self, idx, value)
+        for (name, i) in self._slots.items():
+            if i == idx:
+                try:
+                    _delslot(self, name)
+                except AttributeError:
+                    pass
+
+## the generated __init__: what FieldTransform.__init__ does, for the
+## schema the class was made from, then each text component
+_template = '''\
+def __init__(self, obj, data, segname, transform=None):
+    _setslot(self, 'data', data)
+    _setslot(self, '_message', obj)
+    _setslot(self, '_version', obj._version)
+    _setslot(self, 'segname', segname)
+    if transform is None:
+        transform = _schema
+    _setslot(self, '_transform', transform)
+    n = len(data)
+%s
+'''
+
+def _record_class(name, transform):
+    slots = {}
+    lines = []
+    for (key, (idx, typ)) in transform.items():
+        if hasattr(FieldTransform, key):
+            continue
+        slots[key] = idx
+        if typ is None:
+            lines.append("    _setslot(self, %r, n > %d and data[%d] or None)"
+                         % (key, idx, idx))
+    ns = {'_setslot': _setslot, '_schema': transform}
+    exec _template % '\n'.join(lines) in ns
+    return type(name, (Record,), {'__slots__': tuple(slots.keys()),
+                                  '_slots': slots,
+                                  '__init__': ns['__init__']})
+
+## record classes by (resolved) version
+_classes = {}
+
+def record_classes(version):
+    """Returns the record classes for the schemas of *version*, by
+    composite name, generating them on first use.
+    """
+    classes = _classes.get(version)
+    if classes is not None:
+        return classes
+    transforms = composite_revs[version].transforms
+    classes = {}
+    for name in RECORDS:
+        if name in transforms:
+            classes[name] = _record_class(name, transforms[name])
+    _classes[version] = classes
+    return classes
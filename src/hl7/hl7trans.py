@@ -1,48 +1,383 @@
+import binascii
 import datetime
+import re
+
+## an HL7 NM value; float() accepts everything this matches
+_number = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)\s*$').match
+
+def tonumber(text):
+    """float(*text*), or None when *text* is not a number.  Never
+    raises, which matters on feeds full of bad values.
+
+    >>> tonumber('5.4'), tonumber(''), tonumber('>10'), tonumber('1e5')
+    (5.4, None, None, None)
+    """
+    if text and _number(text):
+        return float(text)
+    return None
 
 def numtransform(obj, data, dt):
     dt = dt[0]
-    return float(dt)
+    return tonumber(dt)
+
+class StructuredNumeric(object):
+    """An SN value (or a comparator-prefixed NM value): *comparator* is
+    one of '', '>', '<', '>=', '<=', '=', '<>'; *num1* and *num2* are
+    floats or None; *separator* is '-' (range), ':' or '/' (ratio),
+    '+' (categorical) or ''.
+    """
+    __slots__ = ('comparator', 'num1', 'separator', 'num2')
+
+    def __init__(self, comparator, num1, separator='', num2=None):
+        self.comparator = comparator
+        self.num1 = num1
+        self.separator = separator
+        self.num2 = num2
+
+    def __eq__(self, other):
+        return isinstance(other, StructuredNumeric) and \
+            (self.comparator, self.num1, self.separator, self.num2) == \
+            (other.comparator, other.num1, other.separator, other.num2)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "StructuredNumeric(%r, %r, %r, %r)" % \
+                    (self.comparator, self.num1, self.separator, self.num2)
+
+_comparators = frozenset(['', '>', '<', '>=', '<=', '=', '<>'])
+
+def sncomponents(comps):
+    """Builds a :cls:`StructuredNumeric` from the components of an SN
+    (or NM) value, None when they hold no number.
+
+    >>> sncomponents(['', '182'])
+    StructuredNumeric('', 182.0, '', None)
+    >>> sncomponents(['>', '10'])
+    StructuredNumeric('>', 10.0, '', None)
+    >>> sncomponents(['', '1', ':', '128'])
+    StructuredNumeric('', 1.0, ':', 128.0)
+    >>> sncomponents(['1', ':', '128'])
+    StructuredNumeric('', 1.0, ':', 128.0)
+    >>> sncomponents(['<0.5'])
+    StructuredNumeric('<', 0.5, '', None)
+    >>> sncomponents(['NEG']) is None
+    True
+    """
+    n = len(comps)
+    if n == 1:
+        ## NM-style text, possibly with the comparator in front
+        text = comps[0].strip()
+        comparator = text[:2]
+        if comparator not in _comparators:
+            comparator = text[:1]
+            if comparator not in _comparators:
+                comparator = ''
+        num1 = tonumber(text[len(comparator):])
+        if num1 is None:
+            return None
+        return StructuredNumeric(comparator, num1)
+    comparator = comps[0]
+    if comparator not in _comparators:
+        ## '1^:^128': the comparator left out rather than left empty
+        if tonumber(comparator) is None:
+            return None
+        comps = [''] + comps
+        comparator = ''
+        n += 1
+    num1 = tonumber(comps[1])
+    separator = ''
+    num2 = None
+    if n > 2:
+        separator = comps[2]
+    if n > 3:
+        num2 = tonumber(comps[3])
+    if num1 is None and num2 is None:
+        return None
+    return StructuredNumeric(comparator, num1, separator, num2)
+
+def sntransform(obj, data, val):
+    return sncomponents(val)
+
+_nan = float('nan')
+
+## the whole of an SN (or comparator-prefixed NM) value as one regular
+## expression, by component separator
+_sn_patterns = {}
+
+def _sn_pattern(separator):
+    pat = _sn_patterns.get(separator)
+    if pat is None:
+        num = r'\s*([-+]?(?:\d+\.?\d*|\.\d+))?\s*'
+        cs = re.escape(separator)
+        pat = re.compile(r'\s*(>=|<=|<>|[<>=])?(?:%s)?%s'
+                         r'(?:%s([^%s]*)(?:%s%s)?)?$' %
+                         (cs, num, cs, cs, cs, num)).match
+        _sn_patterns[separator] = pat
+    return pat
+
+def sncolumns(texts, separator='^'):
+    """Bulk :func:`sncomponents` over the raw text of many SN/NM values
+    (None allowed).  Returns four parallel lists: comparators, num1,
+    separators and num2, with NaN for the missing numbers.  Each value
+    costs a single regular expression match.
+    """
+    match = _sn_pattern(separator)
+    comparators = []
+    num1s = []
+    separators = []
+    num2s = []
+    for text in texts:
+        m = text and match(text)
+        if not m:
+            comparators.append('')
+            num1s.append(_nan)
+            separators.append('')
+            num2s.append(_nan)
+            continue
+        (comparator, num1, sep, num2) = m.groups()
+        if num1 is None and num2 is None:
+            comparators.append('')
+            num1s.append(_nan)
+            separators.append('')
+            num2s.append(_nan)
+            continue
+        comparators.append(comparator or '')
+        num1s.append(_nan if num1 is None else float(num1))
+        separators.append(sep or '')
+        num2s.append(_nan if num2 is None else float(num2))
+    return (comparators, num1s, separators, num2s)
     
+## the precisions of a DT/TS value, from the year to the second
+_DATE_LENGTHS = frozenset([4, 6, 8, 10, 12, 14])
+
+def todate(text):
+    """The datetime of the DT or TS *text*, or None when it is not one.
+    Missing parts default to the first month, day and so on; the time
+    zone is dropped, leaving the time as sent.  Never raises, like
+    :func:`tonumber`.
+
+    >>> todate('2002')
+    datetime.datetime(2002, 1, 1, 0, 0)
+    >>> todate('200202150930-0500')
+    datetime.datetime(2002, 2, 15, 9, 30)
+    >>> todate('20020215093012.25'), todate('200202152530'), todate('')
+    (datetime.datetime(2002, 2, 15, 9, 30, 12, 250000), None, None)
+    """
+    if not text:
+        return None
+    for c in '+-':
+        if c in text:
+            text = text[:text.index(c)]
+    micro = 0
+    if '.' in text:
+        (text, frac) = text.split('.', 1)
+        if not frac.isdigit() or len(text) != 14:
+            return None
+        micro = int((frac + '00000')[:6])
+    if len(text) not in _DATE_LENGTHS or not text.isdigit():
+        return None
+    try:
+        return datetime.datetime(int(text[:4]), int(text[4:6] or 1),
+                                 int(text[6:8] or 1), int(text[8:10] or 0),
+                                 int(text[10:12] or 0), int(text[12:14] or 0),
+                                 micro)
+    except ValueError:
+        return None
+
 def datetransform(obj, data, dt):
+    """:func:`todate` of the value, or its text when it is not a date."""
     dt = dt[0]
-    args = [dt[:4], dt[4:6], dt[6:8]]
-    if len(dt) > 8:
-        args.append(dt[8:10])
-    if len(dt) > 10:
-        args.append(dt[10:12])
-    if len(dt) > 12:
-        args.append(dt[12:14])
-    zargs = [0] * 7
-    zargs = zargs[len(args):]
-    args = args + zargs
-    args = map(int, args)
-    #args.append(datetime.tzinfo("+0000")) # TODO: extract possible timezone
-    args = tuple(args)
-    return datetime.datetime(*args)
+    res = todate(dt)
+    if res is None:
+        return dt
+    return res
+
+def encode_value(val):
+    """The reverse of the transforms: turns a python value back into
+    the text of a field or component.
+
+    >>> encode_value(datetime.datetime(2002, 2, 15, 9, 30))
+    '20020215093000'
+    >>> encode_value(5.4), encode_value(None)
+    ('5.4', '')
+    """
+    if val is None:
+        return ''
+    if isinstance(val, basestring):
+        return val
+    if isinstance(val, datetime.datetime):
+        return val.strftime('%Y%m%d%H%M%S')
+    if isinstance(val, datetime.date):
+        return val.strftime('%Y%m%d')
+    if isinstance(val, float):
+        return repr(val)
+    return str(val)
+
+def timetransform(obj, data, dt):
+    dt = dt[0]
+    args = [dt[:2], dt[2:4], dt[4:6]]
+    args = [int(x or 0) for x in args]
+    return datetime.time(*args)
+
+def texttrans(obj, data, val):
+    """Plain text values: the field as it appears in the message."""
+    if len(val) == 1:
+        return val[0]
+    return getattr(val, 'separator', '^').join(val)
+
+class Encapsulated(object):
+    """An ED value whose data (the fifth component) is left where it is:
+    characters *start* to *end* of *buffer*, which may be the component
+    string itself or a whole str, bytearray or mmap of raw messages.
+    The data is only ever read, and decoded, a chunk at a time.
+    """
+    __slots__ = ('buffer', 'start', 'end', 'source_application',
+                 'type_of_data', 'data_subtype', 'encoding')
+
+    def __init__(self, buffer, start, end, source_application=None,
+                 type_of_data=None, data_subtype=None, encoding=None):
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self.source_application = source_application
+        self.type_of_data = type_of_data
+        self.data_subtype = data_subtype
+        self.encoding = encoding
+
+    def __len__(self):
+        """Length of the data as encoded in the message."""
+        return self.end - self.start
+
+    def __repr__(self):
+        return "<Encapsulated %s/%s %s, %d characters>" % \
+                    (self.type_of_data, self.data_subtype, self.encoding,
+                     len(self))
+
+    def chunks(self, size=65536):
+        """Yields the decoded data in pieces of about *size* bytes:
+        Base64 and Hex are decoded, anything else is passed on as it
+        stands (HL7 escapes included).
+        """
+        encoding = (self.encoding or '').lower()
+        if encoding == 'base64':
+            ## whole quanta only, 4 characters for 3 bytes
+            step = max(size // 3, 1) * 4
+            decode = binascii.a2b_base64
+        elif encoding == 'hex':
+            step = max(size, 1) * 2
+            decode = binascii.a2b_hex
+        else:
+            step = max(size, 1)
+            decode = str
+        buf = self.buffer
+        end = self.end
+        for pos in xrange(self.start, end, step):
+            yield decode(buf[pos:min(pos + step, end)])
+
+    def decode_to(self, sink, size=65536):
+        """Writes the decoded data to the file-like *sink*, *size* bytes
+        at a time, and returns the number of bytes written.
+        """
+        write = sink.write
+        n = 0
+        for chunk in self.chunks(size):
+            write(chunk)
+            n += len(chunk)
+        return n
+
+def edtransform(obj, data, val):
+    """OBX-5 of value type ED: an :cls:`Encapsulated` over the data
+    component, which is not copied.
+    """
+    comps = list(val[:5]) + [None] * (5 - len(val))
+    text = comps[4]
+    if text is None:
+        ## not the full composite: take the value as the data
+        text = val[-1]
+        comps = [None] * 5
+    return Encapsulated(text, 0, len(text), comps[0] or None,
+                        comps[1] or None, comps[2] or None, comps[3] or None)
+
+class CompositeTrans(object):
+    """Converter for a composite OBX value type, bound to the schema of
+    the revision that defines it (which need not be the revision of the
+    message: ED values turn up in 2.3 feeds).
+    """
+    __slots__ = ('name', 'transform')
+
+    def __init__(self, name, transform):
+        self.name = name
+        self.transform = transform
+
+    def __call__(self, obj, data, val):
+        return fieldtransform(obj, data, val, self.name, self.transform)
+
+## OBX-2 value types with converters of their own: the simple ones,
+## and ED, whose data is not to be copied about
+_simple_valuetypes = {
+    'NM': numtransform,
+    'SN': sntransform,
+    'DT': datetransform,
+    'DTM': datetransform,
+    'TS': datetransform,
+    'TM': timetransform,
+    'ED': edtransform,
+    'ST': texttrans,
+    'TX': texttrans,
+    'FT': texttrans,
+    'ID': texttrans,
+    'IS': texttrans,
+    'SI': texttrans,
+    'TN': texttrans,
+    'UN': texttrans,
+}
+
+## converter tables, by message version, built on first use
+_valuetypes = {}
+
+def valuetypes(version):
+    """Returns the table mapping OBX-2 value types to converters for
+    messages of *version*.  Every datatype of every compositesNN module
+    is covered; where several revisions define a type, the message's
+    own revision wins, then the newest.
+    """
+    table = _valuetypes.get(version)
+    if table is not None:
+        return table
+    from composites import composite_revs
+    versions = composite_revs.keys()
+    versions.sort()
+    if version in versions:
+        versions.remove(version)
+        versions.append(version)
+    table = {}
+    for v in versions:
+        for (name, transform) in composite_revs[v].transforms.items():
+            table[name] = _simple_valuetypes.get(name) or \
+                                CompositeTrans(name, transform)
+    _valuetypes[version] = table
+    return table
 
 def typetrans(obj, data, val):
+    """OBX-2: returns the converter for the value type, see
+    :func:`valuetypes`.  Unknown and empty value types are treated as
+    text rather than failing.
+    """
     val = val[0]
     if val == u'' and data[3][0] == u'HTML': # HTML-formatted
-        return unicode
-    if val == u'NM':
-        return float
-    elif val == u'DT' or val == u'TM': # date
-        return lambda x: datetransform(None, None, x)
-    elif val == u'TX': # text
-        return unicode
-    elif val == u'ST': # same as string (geez)
-        return unicode
-    elif val == u'FT': # formatted text: TODO - format it.  duh.
-        return unicode
-    elif val == u'CE': # coded element
-        return lambda x:x
-    raise KeyError, "OBX 002 unrecognised value type '%s' on %s" % \
-                (val, repr(data))
-
+        return texttrans
+    version = obj._message._version
+    table = _valuetypes.get(version) or valuetypes(version)
+    return table.get(val, texttrans)
 
 def obxrestrans(obj, data, val):
-    val = val[0]
-    return obj.valuetype(val)
-
-
+    """OBX-5: converted by the value type's converter, which is looked
+    up once per OBX and then kept on the wrapper.
+    """
+    conv = obj.__dict__.get('_valuetype')
+    if conv is None:
+        conv = obj.valuetype or texttrans
+        obj._valuetype = conv
+    return conv(obj, data, val)
@@ -1,25 +1,56 @@
+from hl7trans import encode_value
+from composites import composite_revs
+from segments import resolve_version
+
+
+def datatype_of(typ):
+    """Name of the composite behind a ``compositetrans.fieldtransformXX``
+    transform, or None for the plain transforms.
+    """
+    name = getattr(typ, '__name__', '')
+    if name.startswith('fieldtransform'):
+        return name[len('fieldtransform'):]
+    return None
 
 class TIter(object):
+    """Iterates over the items of a Transform or FieldTransform, wrapping
+    each with the schema already resolved for the whole.
+    """
     def __init__(self, d):
         self.cls = d.__class__
         self._message = d._message
         self._segname = d.segname
+        self._transform = d._transform
         self.i = d.data.__iter__()
     def __iter__(self):
         return self
     def next(self):
         data = self.i.next()
-        return self.cls(self._message, data, self._segname)
+        return self.cls(self._message, data, self._segname, self._transform)
+
+def composite_transforms(obj):
+    """The composite schemas for the message *obj*: those cached on it
+    (see :cls:`hl7.cMessage`), else those of the nearest version.
+    """
+    transforms = getattr(obj, '_composites', None)
+    if transforms is None:
+        transforms = composite_revs[resolve_version(obj._version)].transforms
+    return transforms
+
+_setslot = object.__setattr__
 
 class FieldTransform(object):
-    def __init__(self, obj, data, segname):
-        from composites import composite_revs
-        self.data = data
-        self._message = obj
-        self._version = obj._version
-        self.segname = segname
-        cr = composite_revs[self._version]
-        self._transform = cr.transforms[self.segname]
+    __slots__ = ('data', '_message', '_version', 'segname', '_transform')
+
+    def __init__(self, obj, data, segname, transform=None):
+        ## straight into the slots, past __setattr__
+        _setslot(self, 'data', data)
+        _setslot(self, '_message', obj)
+        _setslot(self, '_version', obj._version)
+        _setslot(self, 'segname', segname)
+        if transform is None:
+            transform = composite_transforms(obj)[segname]
+        _setslot(self, '_transform', transform)
 
     def keys(self):
         return self._transform.keys()
@@ -52,18 +83,36 @@ class FieldTransform(object):
             if key > len(self.data):
                 return None
             return self.fieldcheck(self.data[key])
-        tf = self.get_transform(key)
-        idx = tf[0]
-        typ = tf[1]
-        if idx >= len(self.data):
+        (idx, typ) = self._transform[key]
+        data = self.data
+        if idx >= len(data):
             return None
-        val = self.data[idx]
+        val = data[idx]
         if typ is None:
             val = self.fieldcheck(val)
         if typ and val is not None:
-            val = typ(self, self.data, val)
+            val = typ(self, data, val)
         return val
 
+    def __setattr__(self, key, value):
+        if key.startswith('_') or key in ('data', 'segname'):
+            object.__setattr__(self, key, value)
+            return
+        idx = self.get_transform(key)[0]
+        self.set_component(idx, value)
+
+    def set_component(self, idx, value):
+        """Writes *value* into component *idx* of the underlying field,
+        padding the field with empty components if it is too short.
+        """
+        data = self.data
+        if not isinstance(data, list):
+            raise TypeError, "%s %s has no components to assign to" % \
+                        (self.segname, repr(data))
+        if idx >= len(data):
+            data.extend([''] * (idx + 1 - len(data)))
+        data[idx] = encode_value(value)
+
     def fieldcheck(self, val):
         if len(val) == 0:
             return None
@@ -76,19 +125,28 @@ class FieldTransform(object):
     def get_transform(self, key):
         return self._transform[key]
 
-def fieldtransform(obj, data, val, compname):
+def fieldtransform(obj, data, val, compname, transform=None):
     if isinstance(val, list):
         if len(val) == 0:
             return None
         if len(val) == 1 and len(val[0]) == 0:
             return None
         if len(val) == 1:
-            return FieldTransform(obj._message, val, compname)[0]
-    return FieldTransform(obj._message, val, compname)
+            ## what FieldTransform(...)[0] would give, without building it
+            return val[0]
+    message = obj._message
+    ## the record class for the composite, see hl7records, unless the
+    ## schema asked for is not the one it was generated from
+    kls = getattr(message, '_records', {}).get(compname, FieldTransform)
+    if transform is not None and kls is not FieldTransform and \
+            transform is not composite_transforms(message).get(compname):
+        kls = FieldTransform
+    return kls(message, val, compname, transform)
 
 import composites
 composites.fieldtransform = fieldtransform
 import compositetrans
 compositetrans.fieldtransform = fieldtransform
 composites.fieldtransform = fieldtransform
-
+import hl7trans
+hl7trans.fieldtransform = fieldtransform
@@ -0,0 +1,364 @@
+"""Append-only journal of raw messages, between receiving and processing.
+
+A receiver appends each message as it arrives and acknowledges it once
+:meth:`Journal.append` has returned: the message is then on disk, at
+the cost of a sequential write and a share of an fsync.  Workers read
+the journal in order and record how far they have got with
+:meth:`Journal.checkpoint`, so that after a crash :meth:`Journal.pending`
+replays exactly what they had not finished.
+
+The journal is a directory of segment files, each named after the
+sequence number of its first message, holding records of::
+
+    length (uint32) | crc32 (uint32) | sequence number (uint64) | message
+
+next to an index file of the record positions (uint32 each).  All
+numbers are little-endian.  A torn
+record at the end of the last segment, left by a crash, is cut off when
+the journal is opened.
+
+>>> import tempfile, shutil
+>>> path = tempfile.mkdtemp()
+>>> j = Journal(path)
+>>> j.append('MSH|^~\\\\&|A'), j.append('MSH|^~\\\\&|B')
+(0, 1)
+>>> j.checkpoint('router', 0)
+>>> list(j.pending('router'))
+[(1, 'MSH|^~\\\\&|B')]
+>>> j.close()
+
+After a crash the index may hold stale entries; the segment is what
+counts, and only a torn record at its end is dropped:
+
+>>> j = Journal(path); j.append('MSH|^~\\\\&|C'); j.close()
+2
+>>> open(os.path.join(path, _INDEX % 0), 'ab').write('\\0' * 4)
+>>> open(os.path.join(path, _SEGMENT % 0), 'ab').write('\\xff' * 9)
+>>> j = Journal(path)
+>>> len(j), [text[-1] for (seq, text) in j.replay()]
+(3, ['A', 'B', 'C'])
+>>> j.close(); shutil.rmtree(path)
+"""
+
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_right
+
+__all__ = ['Journal']
+
+## length, crc32 of the message, sequence number
+_record = struct.Struct('<IIQ')
+
+_SEGMENT = '%020d.log'
+_INDEX = '%020d.idx'
+_CHECKPOINT = '%s.ckpt'
+
+## index entries are little-endian on disk, like the records
+_SWAP = sys.byteorder == 'big'
+
+def _index_bytes(positions):
+    if _SWAP:
+        positions = array('I', positions)
+        positions.byteswap()
+    return positions.tostring()
+
+def _crc(data):
+    return zlib.crc32(data) & 0xffffffff
+
+def _fsync_dir(path):
+    ## makes new and renamed files durable; not possible everywhere
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    os.close(fd)
+
+class _Segment(object):
+    """A segment file, its first sequence number and record positions."""
+
+    def __init__(self, path, base):
+        self.path = path
+        self.base = base
+        self.positions = array('I')
+        self.size = 0
+
+    def filename(self, pattern):
+        return os.path.join(self.path, pattern % self.base)
+
+    def load(self):
+        """Reads the index and checks it against the segment, rebuilding
+        what is missing and cutting off a torn record a crash may have
+        left.  The index is not fsynced with the log, so it is only a
+        hint: its entries are kept as long as each points at the record
+        expected, and the segment is scanned on from the last of those.
+        """
+        self.size = os.path.getsize(self.filename(_SEGMENT))
+        try:
+            f = open(self.filename(_INDEX), 'rb')
+            data = f.read()
+            f.close()
+        except IOError:
+            data = ''
+        hint = array('I')
+        hint.fromstring(data[:len(data) // 4 * 4])
+        if _SWAP:
+            hint.byteswap()
+        positions = self.positions
+        f = open(self.filename(_SEGMENT), 'r+b')
+        pos = 0
+        for p in hint:
+            if p != pos:
+                break
+            f.seek(pos)
+            head = f.read(_record.size)
+            if len(head) < _record.size:
+                break
+            (length, crc, seq) = _record.unpack(head)
+            if seq != self.base + len(positions):
+                break
+            positions.append(pos)
+            pos += _record.size + length
+        ## the last entry kept is checked in full with the rest
+        pos = 0
+        if positions:
+            pos = positions.pop()
+        f.seek(pos)
+        while True:
+            head = f.read(_record.size)
+            if len(head) < _record.size:
+                break
+            (length, crc, seq) = _record.unpack(head)
+            data = f.read(length)
+            if len(data) < length or _crc(data) != crc or \
+                    seq != self.base + len(positions):
+                break
+            positions.append(pos)
+            pos += _record.size + length
+        if pos < self.size:
+            f.truncate(pos)
+            self.size = pos
+        f.close()
+        f = open(self.filename(_INDEX), 'wb')
+        f.write(_index_bytes(positions))
+        f.close()
+
+class Journal(object):
+    """The journal in directory *path*, created if need be.  Segments
+    are rolled over once they exceed *segment_size* bytes.  With *sync*
+    set, :meth:`append` only returns once the message has been fsynced;
+    concurrent appends share one fsync (group commit).
+    """
+    def __init__(self, path, segment_size=64 << 20, sync=True):
+        self.path = path
+        self.segment_size = segment_size
+        self.sync_default = sync
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        bases = [int(name[:-4]) for name in os.listdir(path)
+                 if name.endswith('.log') and name[:-4].isdigit()]
+        bases.sort()
+        self._segments = [_Segment(path, base) for base in bases]
+        for seg in self._segments:
+            seg.load()
+        self._lock = threading.Lock()
+        self._synced = threading.Condition(self._lock)
+        self._syncing = False
+        if self._segments:
+            last = self._segments[-1]
+            self._next = last.base + len(last.positions)
+            self._open(last)
+        else:
+            self._next = 0
+            self._roll()
+        ## highest sequence number known to be on disk
+        self._durable = self._next - 1
+
+    def _open(self, seg):
+        self._current = seg
+        self._log = open(seg.filename(_SEGMENT), 'ab')
+        self._idx = open(seg.filename(_INDEX), 'ab')
+
+    def _roll(self):
+        seg = _Segment(self.path, self._next)
+        open(seg.filename(_SEGMENT), 'ab').close()
+        self._segments.append(seg)
+        self._open(seg)
+        _fsync_dir(self.path)
+
+    def __len__(self):
+        """The sequence number the next message will get."""
+        return self._next
+
+    def append(self, text, sync=None):
+        """Appends the message *text* (unicode is stored as UTF-8) and
+        returns its sequence number.
+        """
+        if isinstance(text, unicode):
+            text = text.encode('utf-8')
+        self._lock.acquire()
+        try:
+            seg = self._current
+            if seg.size >= self.segment_size and seg.positions:
+                self._flush()
+                self._durable = self._next - 1
+                self._log.close()
+                self._idx.close()
+                self._roll()
+                seg = self._current
+            seq = self._next
+            self._log.write(_record.pack(len(text), _crc(text), seq))
+            self._log.write(text)
+            self._idx.write(struct.pack('<I', seg.size))
+            seg.positions.append(seg.size)
+            seg.size += _record.size + len(text)
+            self._next = seq + 1
+        finally:
+            self._lock.release()
+        if sync is None:
+            sync = self.sync_default
+        if sync:
+            self.sync(seq)
+        return seq
+
+    def _flush(self):
+        self._log.flush()
+        self._idx.flush()
+        os.fsync(self._log.fileno())
+        os.fsync(self._idx.fileno())
+
+    def sync(self, seq=None):
+        """Makes sure everything up to *seq* (by default everything
+        appended) is on disk.  Whoever finds no fsync under way does one
+        for all that has been written by then; the others wait for it.
+        """
+        cond = self._synced
+        cond.acquire()
+        try:
+            if seq is None:
+                seq = self._next - 1
+            while self._durable < seq:
+                if self._syncing:
+                    cond.wait()
+                    continue
+                self._syncing = True
+                upto = self._next - 1
+                self._log.flush()
+                self._idx.flush()
+                ## a roll-over may close the file meanwhile
+                fd = os.dup(self._log.fileno())
+                cond.release()
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                    cond.acquire()
+                    self._syncing = False
+                self._durable = max(self._durable, upto)
+                cond.notify_all()
+        finally:
+            cond.release()
+
+    def read(self, seq):
+        """The message with sequence number *seq*."""
+        self._lock.acquire()
+        try:
+            self._log.flush()
+            bases = [seg.base for seg in self._segments]
+            seg = self._segments[max(bisect_right(bases, seq) - 1, 0)]
+            if not seg.base <= seq < seg.base + len(seg.positions):
+                raise KeyError, "no message %d in the journal" % seq
+            pos = seg.positions[seq - seg.base]
+        finally:
+            self._lock.release()
+        f = open(seg.filename(_SEGMENT), 'rb')
+        try:
+            f.seek(pos)
+            (length, crc, s) = _record.unpack(f.read(_record.size))
+            return f.read(length)
+        finally:
+            f.close()
+
+    def replay(self, start=0):
+        """Yields ``(sequence number, message)`` for the messages from
+        *start* (or the oldest still kept) up to the last one appended
+        by the time of the call.
+        """
+        self._lock.acquire()
+        try:
+            self._log.flush()
+            end = self._next
+            segments = list(self._segments)
+        finally:
+            self._lock.release()
+        for seg in segments:
+            stop = min(seg.base + len(seg.positions), end)
+            seq = max(start, seg.base)
+            if seq >= stop:
+                continue
+            f = open(seg.filename(_SEGMENT), 'rb')
+            try:
+                f.seek(seg.positions[seq - seg.base])
+                while seq < stop:
+                    (length, crc, s) = _record.unpack(f.read(_record.size))
+                    yield (s, f.read(length))
+                    seq += 1
+            finally:
+                f.close()
+
+    def checkpoint(self, consumer, seq):
+        """Records that *consumer* is done with everything up to and
+        including *seq*, durably."""
+        name = os.path.join(self.path, _CHECKPOINT % consumer)
+        f = open(name + '.tmp', 'wb')
+        f.write('%d\n' % seq)
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.rename(name + '.tmp', name)
+        _fsync_dir(self.path)
+
+    def checkpoint_of(self, consumer):
+        """The last sequence number *consumer* checkpointed, -1 if
+        none."""
+        try:
+            f = open(os.path.join(self.path, _CHECKPOINT % consumer), 'rb')
+        except IOError:
+            return -1
+        try:
+            return int(f.read().strip() or -1)
+        finally:
+            f.close()
+
+    def pending(self, consumer):
+        """:meth:`replay` from past the checkpoint of *consumer*."""
+        return self.replay(self.checkpoint_of(consumer) + 1)
+
+    def purge(self, upto):
+        """Deletes the segments holding nothing past *upto* (e.g. the
+        lowest checkpoint of all consumers).  The current segment is
+        always kept.
+        """
+        self._lock.acquire()
+        try:
+            while len(self._segments) > 1:
+                seg = self._segments[0]
+                if seg.base + len(seg.positions) - 1 > upto:
+                    break
+                os.remove(seg.filename(_SEGMENT))
+                os.remove(seg.filename(_INDEX))
+                del self._segments[0]
+        finally:
+            self._lock.release()
+
+    def close(self):
+        self.sync()
+        self._log.close()
+        self._idx.close()
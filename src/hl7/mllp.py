@@ -0,0 +1,390 @@
+"""MLLP transport: a threaded listener that feeds :func:`hl7.parse`,
+and a pooled client.
+
+Messages travel framed as ``<VT> message <FS><CR>``.  A
+:cls:`FrameScanner` cuts frames out of the bytes as they arrive, in a
+single reusable buffer, remembering how far it has already looked so
+that nothing is scanned twice.  :cls:`MLLPServer` runs one thread per
+connection, up to *max_connections*, and calls the handler on each
+parsed message in turn:
+
+    def handler(message, text):
+        ...
+        return ack_text        # sent back framed, unless None
+
+    server = MLLPServer(('', 2575), handler)
+    server.serve_forever()
+
+A connection is not read from while its handler runs, so a slow
+handler holds up its own sender (through the TCP window) and nobody
+else.  Parsing can be handed to an *executor* (anything with the
+``submit(fn, *args)`` of concurrent.futures, e.g. a process pool),
+which keeps the connection threads free of the parsing work.
+
+:cls:`MLLPClient` keeps persistent connections to one destination and
+matches the acknowledgements that come back to the messages sent by
+MSA-2 (against MSH-10), so that several messages can be in flight on a
+connection at once.
+
+>>> s = FrameScanner()
+>>> s.feed(frame('MSH|^~\\\\&|A\\rPID|1') + '\\x0bMSH|^~')
+['MSH|^~\\\\&|A\\rPID|1']
+>>> s.feed('\\\\&|B\\x1c\\r')
+['MSH|^~\\\\&|B']
+"""
+
+import Queue
+import socket
+import SocketServer
+import threading
+
+from hl7 import parse
+from peek import peek_header
+
+__all__ = ['FrameScanner', 'MLLPServer', 'MLLPClient', 'frame',
+           'parse_frame', 'ack_control_id',
+           'START_BLOCK', 'END_BLOCK', 'CARRIAGE_RETURN']
+
+START_BLOCK = '\x0b'
+END_BLOCK = '\x1c'
+CARRIAGE_RETURN = '\r'
+
+_TRAILER = END_BLOCK + CARRIAGE_RETURN
+
+def frame(text):
+    """Wraps *text* in the MLLP start and end blocks."""
+    if isinstance(text, unicode):
+        text = text.encode('utf-8')
+    return START_BLOCK + text + _TRAILER
+
+def parse_frame(text):
+    """:func:`hl7.parse` for the text of a frame, whose segments are
+    terminated by carriage returns."""
+    if CARRIAGE_RETURN in text:
+        text = text.replace(CARRIAGE_RETURN, '\n')
+    return parse(text)
+
+class FrameScanner(object):
+    """Incremental MLLP frame scanner.  Bytes go in through
+    :meth:`feed`, complete frames (without their blocks) come out.
+    Anything between frames is dropped.  A frame growing past
+    *max_frame* bytes raises ValueError.
+    """
+    def __init__(self, max_frame=16 << 20):
+        self.max_frame = max_frame
+        self._buf = bytearray()
+        ## where to look for the end block next
+        self._scanned = 0
+
+    def __len__(self):
+        """Bytes held for the frame still incomplete."""
+        return len(self._buf)
+
+    def feed(self, data):
+        buf = self._buf
+        buf.extend(data)
+        frames = []
+        pos = 0
+        while True:
+            start = buf.find(START_BLOCK, pos)
+            if start < 0:
+                ## nothing but noise
+                del buf[:]
+                self._scanned = 0
+                return frames
+            end = buf.find(_TRAILER, max(start + 1, self._scanned))
+            if end < 0:
+                break
+            frames.append(str(buf[start + 1:end]))
+            pos = end + 2
+            self._scanned = 0
+        ## keep the incomplete frame, from its start block, and
+        ## remember how far it has been scanned
+        if start > 0:
+            del buf[:start]
+        self._scanned = max(len(buf) - 1, 1)
+        if len(buf) > self.max_frame:
+            raise ValueError, "MLLP frame longer than %d bytes" % \
+                        self.max_frame
+        return frames
+
+class MLLPHandler(SocketServer.BaseRequestHandler):
+    """One connection: reads frames, parses them and replies with what
+    the server's handler returns."""
+
+    def handle(self):
+        server = self.server
+        sock = self.request
+        sock.settimeout(server.idle_timeout)
+        ## acknowledgements are small writes, not to be held back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        scanner = FrameScanner(server.max_frame)
+        recv = sock.recv
+        bufsize = server.bufsize
+        while True:
+            try:
+                data = recv(bufsize)
+            except socket.timeout:
+                return
+            if not data:
+                return
+            for text in scanner.feed(data):
+                reply = server.dispatch(text)
+                if reply is not None:
+                    sock.sendall(frame(reply))
+
+class MLLPServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """Threaded MLLP listener on *address* calling ``handler(message,
+    text)`` for every message received, where *message* is what
+    *parser* (:func:`parse_frame` by default) makes of the frame
+    *text*.  At most *max_connections* connections are served at once;
+    further ones wait in the listen backlog.  Connections idle for
+    *idle_timeout* seconds are closed.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, handler, max_connections=64, executor=None,
+                 parser=parse_frame, idle_timeout=300, bufsize=65536,
+                 max_frame=16 << 20):
+        self.handler = handler
+        self.executor = executor
+        self.parser = parser
+        self.idle_timeout = idle_timeout
+        self.bufsize = bufsize
+        self.max_frame = max_frame
+        ## connection slots free, guarded by _freed, which also tells
+        ## the accept loop of a shutdown
+        self._free = max_connections
+        self._freed = threading.Condition()
+        self._closing = False
+        SocketServer.TCPServer.__init__(self, address, MLLPHandler)
+
+    def dispatch(self, text):
+        """Parses the frame *text* (in the executor, when there is one)
+        and hands it to the handler, returning the reply."""
+        if self.executor is not None:
+            message = self.executor.submit(self.parser, text).result()
+        else:
+            message = self.parser(text)
+        return self.handler(message, text)
+
+    def serve_forever(self, poll_interval=0.5):
+        self._closing = False
+        SocketServer.TCPServer.serve_forever(self, poll_interval)
+
+    def shutdown(self):
+        ## the accept loop may be waiting for a slot
+        self._freed.acquire()
+        self._closing = True
+        self._freed.notify_all()
+        self._freed.release()
+        SocketServer.TCPServer.shutdown(self)
+
+    def process_request(self, request, client_address):
+        ## blocks the accept loop while all the slots are taken, until
+        ## one is freed or the server shuts down
+        freed = self._freed
+        freed.acquire()
+        try:
+            while not self._free and not self._closing:
+                freed.wait()
+            if self._closing:
+                self.shutdown_request(request)
+                return
+            self._free -= 1
+        finally:
+            freed.release()
+        try:
+            SocketServer.ThreadingMixIn.process_request(self, request,
+                                                         client_address)
+        except:
+            self._release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            SocketServer.ThreadingMixIn.process_request_thread(
+                                        self, request, client_address)
+        finally:
+            self._release()
+
+    def _release(self):
+        self._freed.acquire()
+        self._free += 1
+        self._freed.notify()
+        self._freed.release()
+
+def ack_control_id(text):
+    """MSA-2 of the acknowledgement *text*: the MSH-10 of the message it
+    acknowledges.  None when there is no MSA segment.
+
+    >>> ack_control_id('MSH|^~\\\\&|||||||ACK|A1|P|2.4\\rMSA|AA|CTRL1')
+    'CTRL1'
+    """
+    fs = text[3:4]
+    pos = text.find('MSA' + fs)
+    while pos > 0 and text[pos - 1] not in '\r\n':
+        pos = text.find('MSA' + fs, pos + 1)
+    if pos < 0:
+        return None
+    end = pos
+    while end < len(text) and text[end] not in '\r\n':
+        end += 1
+    fields = text[pos:end].split(fs)
+    if len(fields) < 3:
+        return None
+    return fields[2] or None
+
+class _Connection(object):
+    """A connection of an :cls:`MLLPClient`."""
+
+    def __init__(self, address, timeout, bufsize):
+        self.sock = socket.create_connection(address, timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.scanner = FrameScanner()
+        self.bufsize = bufsize
+
+    def close(self):
+        try:
+            self.sock.close()
+        except socket.error:
+            pass
+
+    def receive(self):
+        """The next frames to arrive, at least one."""
+        feed = self.scanner.feed
+        recv = self.sock.recv
+        while True:
+            data = recv(self.bufsize)
+            if not data:
+                raise socket.error, "connection closed by peer"
+            frames = feed(data)
+            if frames:
+                return frames
+
+    def exchange(self, texts, ids, todo, acks, window):
+        """Sends the messages ``texts[i]`` for i in *todo*, keeping up to
+        *window* unacknowledged, and files each acknowledgement in
+        *acks* under the index of the message whose MSH-10 (in *ids*)
+        its MSA-2 names.  An acknowledgement naming none of them goes to
+        the oldest message outstanding, MLLP being in order.
+        """
+        outstanding = []
+        pending = {}
+        todo = iter(todo)
+        more = True
+        while True:
+            batch = []
+            while more and len(outstanding) < window:
+                try:
+                    i = todo.next()
+                except StopIteration:
+                    more = False
+                    break
+                batch.append(frame(texts[i]))
+                outstanding.append(i)
+                pending.setdefault(ids[i], i)
+            if batch:
+                self.sock.sendall(''.join(batch))
+            if not outstanding:
+                return
+            for reply in self.receive():
+                i = pending.get(ack_control_id(reply))
+                if i is None or acks[i] is not None:
+                    if not outstanding:
+                        continue
+                    i = outstanding[0]
+                acks[i] = reply
+                outstanding.remove(i)
+                if pending.get(ids[i]) == i:
+                    del pending[ids[i]]
+
+class MLLPClient(object):
+    """Client for the MLLP listener at *address*, keeping up to
+    *pool_size* persistent connections for use by any number of
+    threads.  Up to *window* messages are sent on a connection before
+    their acknowledgements are read (1 for strict send-and-wait).
+
+    A connection that fails or goes *timeout* seconds without an
+    answer is dropped, and the messages not yet acknowledged are sent
+    again on another one, up to *retries* times, after which the
+    socket error is raised.  The receiver may then see a message twice.
+    """
+    def __init__(self, address, pool_size=4, window=8, timeout=30,
+                 retries=2, bufsize=65536):
+        self.address = address
+        self.pool_size = pool_size
+        self.window = max(window, 1)
+        self.timeout = timeout
+        self.retries = retries
+        self.bufsize = bufsize
+        ## idle connections, and a None for every one that may still
+        ## be opened: a thread waiting for a connection is woken by
+        ## one given back or by a slot freed.  Last in, first out, so
+        ## that open connections are reused before new ones are made.
+        self._idle = Queue.LifoQueue()
+        for i in xrange(pool_size):
+            self._idle.put(None)
+
+    def _acquire(self):
+        conn = self._idle.get()
+        if conn is not None:
+            return conn
+        try:
+            return _Connection(self.address, self.timeout, self.bufsize)
+        except:
+            self._idle.put(None)
+            raise
+
+    def _discard(self, conn):
+        conn.close()
+        self._idle.put(None)
+
+    def send(self, text):
+        """Sends the message *text* and returns the acknowledgement."""
+        return self.send_many([text])[0]
+
+    def send_many(self, texts):
+        """Sends the messages *texts*, pipelined on one connection, and
+        returns their acknowledgements in the same order.
+        """
+        acks = [None] * len(texts)
+        ids = [peek_header(text).message_control_id for text in texts]
+        todo = range(len(texts))
+        attempt = 0
+        while todo:
+            conn = None
+            try:
+                conn = self._acquire()
+                conn.exchange(texts, ids, todo, acks, self.window)
+            except socket.error:
+                if conn is not None:
+                    self._discard(conn)
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+                todo = [i for i in todo if acks[i] is None]
+                continue
+            except:
+                ## e.g. an oversized reply: the connection is in an
+                ## unknown state, and must not hold its pool slot
+                if conn is not None:
+                    self._discard(conn)
+                raise
+            self._idle.put(conn)
+            break
+        return acks
+
+    def close(self):
+        """Closes the idle connections."""
+        conns = []
+        while True:
+            try:
+                conns.append(self._idle.get_nowait())
+            except Queue.Empty:
+                break
+        for conn in conns:
+            if conn is not None:
+                conn.close()
+            self._idle.put(None)
@@ -0,0 +1,169 @@
+"""Batch extraction of numeric OBX results into NumPy arrays.
+
+:func:`obx_arrays` makes a single pass over many messages, raw or
+parsed, and collects the numeric results straight from the field text:
+no :cls:`hl7.cOBX` or :cls:`hl7.FieldTransform` objects are built.
+NumPy is an optional dependency, needed only here.
+"""
+
+import datetime
+
+from hl7 import Message
+from hl7trans import sncolumns
+from projection import Projection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['obx_arrays']
+
+## the OBX fields used, by (0-based) index
+_VALUETYPE = 2
+_IDENTIFIER = 3
+_VALUE = 5
+_UNITS = 6
+_FLAGS = 8
+_TIME = 14
+
+_projection = Projection(['OBX.2', 'OBX.3.1', 'OBX.5', 'OBX.6.1',
+                          'OBX.8', 'OBX.14'])
+_paths = _projection.paths
+
+## value types whose OBX-5 is read as a number
+_NUMERIC = frozenset(['NM', 'SN', '', None])
+
+## the precisions of a timestamp, up to the second
+_TS_LENGTHS = frozenset([4, 6, 8, 10, 12, 14])
+
+def _isotime(ts):
+    """'YYYY[MM[DD[HHMM[SS]]]]' to the ISO form numpy parses, 'NaT' when
+    there is no usable timestamp.  Fractions of a second and the time
+    zone are dropped: the time stays local, as sent.
+
+    >>> _isotime('200202150930-0500'), _isotime('20020215093012.5+01')
+    ('2002-02-15T09:30:00', '2002-02-15T09:30:12')
+    >>> _isotime('2002'), _isotime('200202152530'), _isotime('2002021')
+    ('2002-01-01T00:00:00', 'NaT', 'NaT')
+    """
+    if not ts:
+        return 'NaT'
+    for c in '+-.':
+        if c in ts:
+            ts = ts[:ts.index(c)]
+    if len(ts) not in _TS_LENGTHS or not ts.isdigit():
+        return 'NaT'
+    parts = (int(ts[:4]), int(ts[4:6] or 1), int(ts[6:8] or 1),
+             int(ts[8:10] or 0), int(ts[10:12] or 0), int(ts[12:14] or 0))
+    try:
+        ## numpy rejects what datetime does, for the whole array
+        datetime.datetime(*parts)
+    except ValueError:
+        return 'NaT'
+    return '%04d-%02d-%02dT%02d:%02d:%02d' % parts
+
+def _component(field, idx):
+    if field is None or idx >= len(field):
+        return None
+    return field[idx] or None
+
+def _parsed_obx(message):
+    """The OBX rows of a parsed *message*, in the same shape as the
+    lists :data:`_projection` produces, and the component separator.
+    """
+    cols = ([], [], [], [], [], [])
+    cs = '^'
+    for seg in list.__iter__(message):
+        if seg[0][0] != 'OBX':
+            continue
+        n = len(seg)
+        fields = [idx < n and seg[idx] or None for idx in
+                  (_VALUETYPE, _IDENTIFIER, _VALUE, _UNITS, _FLAGS, _TIME)]
+        cols[0].append(_component(fields[0], 0))
+        cols[1].append(_component(fields[1], 0))
+        value = fields[2]
+        if value is not None:
+            cs = value.separator
+            value = cs.join(value) or None
+        cols[2].append(value)
+        cols[3].append(_component(fields[3], 0))
+        cols[4].append(_component(fields[4], 0))
+        cols[5].append(_component(fields[5], 0))
+    return (cols, cs)
+
+def obx_arrays(messages, identifiers=None):
+    """Extracts the OBX results of *messages* (raw text or parsed
+    :cls:`hl7.Message` instances) whose observation identifier (OBX-3.1)
+    is in *identifiers* (all of them when None).  Returns a dict of
+    equal-length arrays:
+
+    ``message``     index of the message in *messages*
+    ``identifier``  OBX-3.1
+    ``comparator``  SN comparator ('>', '<=', ...), '' for none
+    ``value``       OBX-5 (SN num1) as float64, NaN when not numeric
+    ``separator``   SN separator ('-', ':', ...), '' for none
+    ``value2``      SN num2 as float64, NaN when absent
+    ``time``        OBX-14 as datetime64[s], NaT when absent
+    ``units``       OBX-6.1
+    ``flags``       OBX-8 abnormal flags
+
+    NM and SN results (and those without a value type) are converted
+    with :func:`hl7.sncolumns`, so comparators and ranges survive and
+    bad values become NaN rather than exceptions.
+    """
+    if numpy is None:
+        raise ImportError, "obx_arrays needs numpy"
+    if identifiers is not None:
+        identifiers = frozenset(identifiers)
+    index = []
+    codes = []
+    comparators = []
+    values = []
+    separators = []
+    values2 = []
+    times = []
+    units = []
+    flags = []
+    for (i, msg) in enumerate(messages):
+        if isinstance(msg, Message):
+            (cols, cs) = _parsed_obx(msg)
+        else:
+            msg = msg.strip()
+            res = _projection.extract(msg)
+            cols = [res[path] for path in _paths]
+            cs = msg[4:5] or '^'
+        (vts, ids, vals, unts, flgs, tss) = cols
+        numeric = []
+        for j in xrange(len(ids)):
+            code = ids[j]
+            if identifiers is not None and code not in identifiers:
+                continue
+            index.append(i)
+            codes.append(code or '')
+            numeric.append(vts[j] in _NUMERIC and vals[j] or None)
+            times.append(_isotime(tss[j]))
+            units.append(unts[j] or '')
+            flags.append(flgs[j] or '')
+        if numeric:
+            (c, v1, sep, v2) = sncolumns(numeric, cs)
+            comparators.extend(c)
+            values.extend(v1)
+            separators.extend(sep)
+            values2.extend(v2)
+    return {'message': numpy.array(index, dtype=numpy.intp),
+            'identifier': _strings(codes),
+            'comparator': _strings(comparators),
+            'value': numpy.array(values, dtype=numpy.float64),
+            'separator': _strings(separators),
+            'value2': numpy.array(values2, dtype=numpy.float64),
+            'time': numpy.array(times, dtype='datetime64[s]'),
+            'units': _strings(units),
+            'flags': _strings(flags),
+           }
+
+def _strings(l):
+    ## numpy would make an empty list float64
+    if not l:
+        return numpy.array([], dtype=str)
+    return numpy.array(l)
@@ -0,0 +1,119 @@
+"""Per-patient ordering with parallelism across patients.
+
+A :cls:`Dispatcher` hashes each message on its partition key onto one
+of a number of lanes, each a single-worker :cls:`hl7.Stage`, so that
+the messages of one patient are handled one after the other, in the
+order they were put, while different patients' messages are handled in
+parallel.  For the lanes to use more than one core, give the dispatcher
+an *executor* such as a process pool: every lane waits for its own
+batch to come back before starting the next, so order is kept all the
+same.
+
+The key is found without parsing: by default :func:`partition_key`
+takes the first repetition of PID-3 (patient identifier list) and, for
+messages without one, MSH-4 and MSH-10, which spreads them anywhere.
+
+>>> partition_key('MSH|^~\\\\&|LAB|ELAB-3|||||ADT^A08|C1|P|2.4\\r'
+...               'PID|||555^^^H~777^^^SS||DOE')
+'555^^^H'
+>>> partition_key('MSH|^~\\\\&|LAB|ELAB-3|||||ADT^A08|C3|P|2.4\\r\\n'
+...               'PID|||555^^^H\\r\\n')
+'555^^^H'
+>>> partition_key('MSH|^~\\\\&|LAB|ELAB-3|||||ADT^A08|C2|P|2.4')
+'ELAB-3|C2'
+>>> seen = []
+>>> d = Dispatcher(seen.append, lanes=4)
+>>> d.start()
+>>> for i in range(20):
+...     d.put('MSH|^~\\\\&|LAB|X|||||ADT^A08|C%d|P|2.4\\rPID|||P%d' % (i, i % 3))
+>>> d.close()
+>>> [int(text.split('|')[9][1:]) for text in seen if text.endswith('P1')]
+[1, 4, 7, 10, 13, 16, 19]
+"""
+
+import zlib
+
+from mllp import END_BLOCK
+from peek import line_end, peek_header
+from pipeline import Stage
+from projection import Projection
+
+__all__ = ['Dispatcher', 'partition_key']
+
+## by number, so the same in every revision (patient_id_internal_id up
+## to 2.2, patient_identifier_list from 2.3)
+_PATIENT_ID = 'PID.3'
+_patient_id = Projection([_PATIENT_ID])
+
+def _find_segment(text, prefix):
+    """Start of the first segment beginning with *prefix* past the
+    first one, whatever the line ends, or -1."""
+    pos = text.find(prefix, 1)
+    while pos > 0 and text[pos-1] not in '\r\n':
+        pos = text.find(prefix, pos + 1)
+    return pos
+
+def partition_key(text):
+    """The partition key of the raw message *text*: the first repetition
+    of PID-3 as is, or, with no PID-3, MSH-4 and MSH-10 joined by
+    ``|``."""
+    header = peek_header(text)
+    pos = _find_segment(text, 'PID' + header.field_separator)
+    if pos >= 0:
+        end = line_end(text, pos)
+        if text[end-1:end] == END_BLOCK:
+            ## framed, with PID last
+            end -= 1
+        ## only the PID line goes to the Projection; the component
+        ## separator it reads off that is never used for a whole field
+        [val] = _patient_id.extract(text[pos:end])[_PATIENT_ID]
+        rs = (header.encoding_characters or '')[1:2]
+        if val and rs and rs in val:
+            val = val[:val.index(rs)]
+        if val:
+            return val
+    facility = header.sending_facility
+    if isinstance(facility, tuple):
+        facility = (header.encoding_characters or '^')[0].join(
+                        [c or '' for c in facility])
+    return '%s|%s' % (facility or '', header.message_control_id or '')
+
+class Dispatcher(object):
+    """Calls *handler* on the messages put, on *lanes* lanes chosen by
+    ``key(text)`` (:func:`partition_key` by default), in order within a
+    lane.  *queue_size*, *batch* and *executor* are those of each
+    lane's :cls:`hl7.Stage`.
+    """
+    def __init__(self, handler, lanes=4, key=partition_key, queue_size=64,
+                 batch=32, executor=None):
+        self.handler = handler
+        self.key = key
+        self.lanes = [Stage('lane-%d' % i, handler, 1, queue_size, batch,
+                            executor)
+                      for i in xrange(lanes)]
+
+    def lane(self, key):
+        """The lane (index) for *key*, the same in every process."""
+        if isinstance(key, unicode):
+            key = key.encode('utf-8')
+        return (zlib.crc32(key) & 0xffffffff) % len(self.lanes)
+
+    def start(self):
+        for lane in self.lanes:
+            lane.start()
+
+    def put(self, text, timeout=None):
+        """Queues the message *text* on its lane, blocking while that
+        lane's queue is full."""
+        self.lanes[self.lane(self.key(text))].put([text], timeout)
+
+    def close(self):
+        """Handles everything put so far, then stops the lanes."""
+        for lane in self.lanes:
+            lane.stop()
+        for lane in self.lanes:
+            lane.join()
+
+    def metrics(self):
+        """:meth:`hl7.Pipeline.metrics` for the lanes, by lane name."""
+        return dict([(lane.name, lane.metrics()) for lane in self.lanes])
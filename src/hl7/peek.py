@@ -0,0 +1,131 @@
+"""Header-only peek at raw HL7 messages.
+
+:func:`peek_header` reads the MSH segment (and nothing past the first
+segment terminator) and returns a small :cls:`Header` record, which is
+all a router needs to decide where a message goes.
+
+>>> h = peek_header('MSH|^~\\\\&|GHH LAB|ELAB-3|GHH OE|BLDG4|200202150930||'
+...                 'ORU^R01|CNTRL-3456|P|2.4\\rPID|||555-44-4444')
+>>> h.sending_application, h.message_type, h.message_control_id
+('GHH LAB', ('ORU', 'R01'), 'CNTRL-3456')
+>>> h.datetime_of_message
+datetime.datetime(2002, 2, 15, 9, 30)
+>>> h.message_code, h.trigger_event, h.version_id
+('ORU', 'R01', '2.4')
+"""
+
+from segments import segment_revs, resolve_version
+
+__all__ = ['Header', 'peek_header']
+
+## MSH fields kept by a Header, named as in the segmentsNN schemas
+_FIELDS = ('sending_application', 'sending_facility',
+           'receiving_application', 'receiving_facility',
+           'datetime_of_message', 'message_type', 'message_control_id',
+           'processing_id', 'version_id')
+
+## position of MSH-12 (version id) is the same in every revision
+_VERSION_IDX = 11
+
+def _layout(version):
+    """(slot, index, composite, converter) for each of the Header
+    fields, taken from the MSH schema of *version*.  The version id is
+    left as text, for :func:`hl7.resolve_version`.
+    """
+    msh = segment_revs[version].transforms['MSH']
+    res = []
+    for name in _FIELDS:
+        (idx, typ) = msh[name]
+        composite = getattr(typ, '__name__', '').startswith('fieldtransform')
+        convert = None
+        if typ is not None and not composite and name != 'version_id':
+            convert = typ
+        res.append((name, idx, composite, convert))
+    return tuple(res)
+
+_layouts = {}
+for _v in segment_revs.keys():
+    _layouts[_v] = _layout(_v)
+
+def line_end(text, start=0):
+    """Index of the first segment terminator (carriage return or
+    newline) at or after *start*, or len(text) if there is none.
+    """
+    cr = text.find('\r', start)
+    if cr < 0:
+        lf = text.find('\n', start)
+        if lf < 0:
+            return len(text)
+        return lf
+    lf = text.find('\n', start, cr)
+    if lf < 0:
+        return cr
+    return lf
+
+class Header(object):
+    """The routing-relevant MSH fields of a message.  Simple fields are
+    converted as the MSH schema says (the date/time of the message to a
+    datetime, left as text if it does not parse), except for the version
+    id, which stays text; composite fields are tuples of their
+    components when more than one is present, otherwise a string, as
+    with :func:`hl7.fieldtransform`.  Absent fields are None.
+    """
+    __slots__ = ('field_separator', 'encoding_characters') + _FIELDS
+
+    @property
+    def message_code(self):
+        mt = self.message_type
+        if isinstance(mt, tuple):
+            return mt[0]
+        return mt
+
+    @property
+    def trigger_event(self):
+        mt = self.message_type
+        if isinstance(mt, tuple):
+            return mt[1]
+        return None
+
+    def __repr__(self):
+        return "<Header %s>" % ", ".join(["%s=%r" % (k, getattr(self, k))
+                                          for k in _FIELDS])
+
+def peek_header(text):
+    """Returns a :cls:`Header` built from the MSH segment of *text* (a
+    str, unicode or MLLP-framed byte string) without parsing the rest
+    of the message.
+    """
+    start = 0
+    if not text.startswith('MSH'):
+        start = text.find('MSH')
+        if start < 0:
+            raise ValueError, "no MSH segment found"
+    end = line_end(text, start)
+    fs = text[start+3:start+4]
+    if not fs:
+        raise ValueError, "truncated MSH segment"
+    fields = text[start:end].split(fs)
+    enc = fields[1] if len(fields) > 1 else ''
+    cs = enc[:1]
+    nfields = len(fields)
+    version = fields[_VERSION_IDX] if nfields > _VERSION_IDX else ''
+    if cs and cs in version:
+        version = version.split(cs)[0]
+    layout = _layouts[resolve_version(version)]
+    h = Header()
+    h.field_separator = fs
+    h.encoding_characters = enc
+    for (name, idx, composite, convert) in layout:
+        val = fields[idx] if idx < nfields else ''
+        if not val:
+            val = None
+        elif composite and cs and cs in val:
+            val = tuple(val.split(cs))
+        elif convert is not None:
+            ## the converters only look at the value
+            try:
+                val = convert(None, None, [val])
+            except ValueError:
+                pass
+        setattr(h, name, val)
+    return h
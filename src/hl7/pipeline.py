@@ -0,0 +1,297 @@
+"""Bounded worker pipeline with per-stage metrics.
+
+A :cls:`Pipeline` is a chain of :cls:`Stage` objects, each a function
+applied to every item by a pool of worker threads, with a bounded queue
+in front of each stage.  A full queue blocks whoever feeds it, so a
+slow stage holds up the stages before it, and eventually the receiver,
+instead of letting work pile up in memory.  What a stage's function
+returns goes on to the next stage; None drops the item.
+
+Small items travel between stages in batches: a worker takes up to
+*batch* items from its queue at once, which saves on queue locking and,
+for a stage run in an *executor* (anything with the ``submit(fn,
+*args)`` of concurrent.futures, e.g. a process pool, the function then
+having to be picklable), makes one round trip per batch.  For instance,
+behind an :cls:`hl7.MLLPServer`::
+
+    pipeline = Pipeline([Stage('parse', parse_frame, workers=4),
+                         Stage('transform', transform),
+                         Stage('emit', emit, batch=256)])
+    pipeline.start()
+    server = MLLPServer(('', 2575), lambda message, text: pipeline.put(text),
+                        parser=peek_header)
+
+:meth:`Pipeline.metrics` tells, for every stage, how many items it has
+processed and at what rate, how many are waiting, and how long they
+spent in the stage (queue wait and processing) as a histogram.
+
+>>> p = Pipeline([Stage('split', lambda text: text.split('\\r')),
+...               Stage('count', len)])
+>>> p.start()
+>>> for i in range(10):
+...     p.put('MSH|^~\\\\&|A\\rPID|%d' % i)
+>>> p.close()
+>>> m = p.metrics()
+>>> m['split']['processed'], m['count']['processed'], m['count']['queued']
+(10, 10, 0)
+"""
+
+import Queue
+import threading
+import time
+
+__all__ = ['Pipeline', 'Stage', 'Histogram']
+
+## tells a worker to finish
+_STOP = None
+
+class Histogram(object):
+    """Durations counted in power-of-two buckets of microseconds."""
+
+    def __init__(self, counts=None):
+        self.counts = list(counts or [0] * 40)
+
+    def add(self, seconds, count=1):
+        us = int(seconds * 1e6)
+        self.counts[min(us.bit_length(), len(self.counts) - 1)] += count
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def buckets(self):
+        """``(upper bound in seconds, count)`` of the buckets not
+        empty."""
+        return [((1 << i) / 1e6, n) for (i, n) in enumerate(self.counts) if n]
+
+    def percentile(self, p):
+        """The upper bound of the bucket holding the *p* (0 to 1)
+        quantile, None when empty."""
+        total = sum(self.counts)
+        if not total:
+            return None
+        rank = p * total
+        seen = 0
+        for (i, n) in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return (1 << i) / 1e6
+        return (1 << (len(self.counts) - 1)) / 1e6
+
+def _apply(fn, items):
+    """*fn* on each of *items*: ``(results, errors, last error)``.  At
+    module level so that it can go to a process pool."""
+    out = []
+    errors = 0
+    last = None
+    for item in items:
+        try:
+            res = fn(item)
+        except Exception, e:
+            errors += 1
+            last = e
+            continue
+        if res is not None:
+            out.append(res)
+    return (out, errors, last)
+
+class Stage(object):
+    """The stage *name*, calling *fn* on each item, in *workers*
+    threads, on batches of up to *batch* items; with an *executor*, the
+    threads hand the batches to it.  Up to *queue_size* batches wait in
+    front of the stage.  Exceptions raised by *fn* drop the item, and
+    those of the executor the batch; both are counted as errors.
+    """
+    def __init__(self, name, fn, workers=1, queue_size=64, batch=32,
+                 executor=None):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.batch = max(batch, 1)
+        self.executor = executor
+        self.next = None
+        self._queue = Queue.Queue(queue_size)
+        self._lock = threading.Lock()
+        self._threads = []
+        self._running = 0
+        self._queued = 0
+        self._busy = 0
+        self._processed = 0
+        self._errors = 0
+        self._last_error = None
+        self._latency = Histogram()
+        self._started = None
+        ## (time, processed) at the previous metrics()
+        self._mark = None
+
+    def put(self, items, timeout=None):
+        """Queues the list *items*, blocking while the queue is full (for
+        up to *timeout* seconds, then raising Queue.Full)."""
+        self._lock.acquire()
+        self._queued += len(items)
+        self._lock.release()
+        try:
+            self._queue.put((time.time(), items), True, timeout)
+        except Queue.Full:
+            self._lock.acquire()
+            self._queued -= len(items)
+            self._lock.release()
+            raise
+
+    def start(self):
+        self._started = time.time()
+        self._mark = (self._started, 0)
+        self._running = self.workers
+        for i in xrange(self.workers):
+            th = threading.Thread(target=self._work,
+                                  name='%s-%d' % (self.name, i))
+            th.daemon = True
+            th.start()
+            self._threads.append(th)
+
+    def stop(self):
+        """Lets the workers finish what is queued, then stop."""
+        for i in xrange(self.workers):
+            self._queue.put(_STOP)
+
+    def join(self):
+        for th in self._threads:
+            th.join()
+        self._threads = []
+
+    def _work(self):
+        try:
+            self._loop()
+        finally:
+            self._lock.acquire()
+            self._running -= 1
+            last = not self._running
+            self._lock.release()
+            if last and self.next is not None:
+                self.next.stop()
+
+    def _loop(self):
+        queue = self._queue
+        fn = self.fn
+        while True:
+            entry = queue.get()
+            if entry is _STOP:
+                break
+            entries = [entry]
+            count = len(entry[1])
+            stop = False
+            while count < self.batch:
+                try:
+                    entry = queue.get_nowait()
+                except Queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                entries.append(entry)
+                count += len(entry[1])
+            if len(entries) == 1:
+                items = entries[0][1]
+            else:
+                items = []
+                for (t, batch) in entries:
+                    items.extend(batch)
+            self._lock.acquire()
+            self._queued -= count
+            self._busy += 1
+            self._lock.release()
+            try:
+                if self.executor is not None:
+                    (out, errors, last) = self.executor.submit(_apply, fn,
+                                                               items).result()
+                else:
+                    (out, errors, last) = _apply(fn, items)
+            except Exception, e:
+                ## the executor failed (broken pool, pickling): the
+                ## whole batch is lost
+                (out, errors, last) = ([], count, e)
+            now = time.time()
+            self._lock.acquire()
+            self._busy -= 1
+            self._processed += count
+            if errors:
+                self._errors += errors
+                self._last_error = last
+            for (t, batch) in entries:
+                self._latency.add(now - t, len(batch))
+            self._lock.release()
+            ## after the latency is taken: waiting on the next stage is
+            ## its doing
+            if out and self.next is not None:
+                self.next.put(out)
+            if stop:
+                break
+
+    def metrics(self):
+        """A snapshot of the stage's counters: see
+        :meth:`Pipeline.metrics`."""
+        now = time.time()
+        self._lock.acquire()
+        try:
+            processed = self._processed
+            res = {
+                'workers': self._running,
+                'busy': self._busy,
+                'queued': self._queued,
+                'processed': processed,
+                'errors': self._errors,
+                'last_error': self._last_error,
+                'latency': Histogram(self._latency.counts),
+                }
+            (since, before) = self._mark or (now, 0)
+            self._mark = (now, processed)
+        finally:
+            self._lock.release()
+        res['rate'] = 0.0
+        if now > since:
+            res['rate'] = (processed - before) / (now - since)
+        res['throughput'] = 0.0
+        if self._started is not None and now > self._started:
+            res['throughput'] = processed / (now - self._started)
+        return res
+
+class Pipeline(object):
+    """The chain of *stages*, each feeding the next.  What the last one
+    returns is dropped."""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        if not self.stages:
+            raise ValueError, "a pipeline needs stages"
+        for (stage, after) in zip(self.stages, self.stages[1:]):
+            stage.next = after
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def put(self, item, timeout=None):
+        """Feeds *item* to the first stage, blocking while its queue is
+        full."""
+        self.stages[0].put([item], timeout)
+
+    def put_many(self, items, timeout=None):
+        """Feeds *items* to the first stage, in batches."""
+        first = self.stages[0]
+        items = list(items)
+        for i in xrange(0, len(items), first.batch):
+            first.put(items[i:i+first.batch], timeout)
+
+    def close(self):
+        """Processes everything fed so far, then stops the workers."""
+        self.stages[0].stop()
+        for stage in self.stages:
+            stage.join()
+
+    def metrics(self):
+        """Per stage name, a dict of: ``processed`` items and ``errors``
+        (with the ``last_error``), ``throughput`` (items per second
+        since the start) and ``rate`` (since the previous call),
+        ``queued`` items, ``workers`` running and ``busy``, and the
+        ``latency`` :cls:`Histogram` of the time spent in the stage.
+        """
+        return dict([(stage.name, stage.metrics()) for stage in self.stages])
@@ -0,0 +1,186 @@
+"""Field projection pushed down into the tokenizer.
+
+A :cls:`Projection` is compiled once from a list of field paths and
+then handed to :func:`hl7.parse`.  Instead of splitting every segment,
+field and component, the tokenizer walks the raw text, skips segments
+that are not wanted and counts separators to locate just the requested
+fields.
+
+>>> p = Projection(['PID.patient_id_internal_id', 'OBX.result',
+...                 'MSH.message_control_id', 'PID.patient_name.given_name'])
+>>> r = p.extract('MSH|^~\\\\&|LAB||||||ORU^R01|CTRL1|P|2.4\\n'
+...               'PID|||555-44-4444||DOE^JANE\\n'
+...               'OBX|1|NM|GLU||182\\nOBX|2|NM|NA||140')
+>>> r['MSH.message_control_id'], r['PID.patient_id_internal_id']
+(['CTRL1'], ['555-44-4444'])
+>>> r['OBX.result'], r['PID.patient_name.given_name']
+(['182', '140'], ['JANE'])
+
+Segments may end in carriage returns, newlines or both, and component
+paths look at the first repetition of a field:
+
+>>> p = Projection(['PID.3', 'PID.3.1', 'PID.5.2', 'OBX.5', 'MSH.10'])
+>>> r = p.extract('MSH|^~\\\\&|LAB||||||ORU^R01|C1|P|2.4\\r\\n'
+...               'PID|||555~777^^^SS||DOE^JANE~ROE^RICH\\r\\n'
+...               'OBX|1|NM|GLU||182\\r\\n')
+>>> r['PID.3'], r['PID.3.1'], r['PID.5.2'], r['OBX.5'], r['MSH.10']
+(['555~777^^^SS'], ['555'], ['JANE'], ['182'], ['C1'])
+"""
+
+from segments import segment_revs, resolve_version
+from composites import composite_revs
+from hl7util import datatype_of
+import hl7 as _hl7
+
+__all__ = ['Projection', 'compile_path', 'segment_terminator', 'next_segment']
+
+def segment_terminator(text):
+    """Returns the segment terminator used by *text*: whichever of
+    carriage return or newline turns up first (newline if neither,
+    which is what :func:`hl7.parse` splits on).
+    """
+    cr = text.find('\r')
+    lf = text.find('\n')
+    if cr >= 0 and (lf < 0 or cr < lf):
+        return '\r'
+    return '\n'
+
+def _field_transform(segid, name, version):
+    kls = getattr(_hl7, 'c' + segid, None)
+    if kls is not None and name in kls.transform:
+        return kls.transform[name]
+    return segment_revs[version].transforms[segid][name]
+
+def compile_path(path, version):
+    """Resolves a dotted *path* such as ``'PID.patient_name.family_name'``
+    or ``'PID.5.1'`` to a ``(segment_id, field_index, component_index)``
+    tuple, where *component_index* is None when the whole field is
+    wanted.  Numeric parts use HL7 (1-based) numbering.
+
+    >>> compile_path('PID.patient_name.family_name', '2.4')
+    ('PID', 5, 0)
+    >>> compile_path('MSH.9.2', '2.4')
+    ('MSH', 8, 1)
+    """
+    version = resolve_version(version)
+    parts = path.split('.')
+    if len(parts) not in (2, 3):
+        raise ValueError, "bad field path %s" % repr(path)
+    segid = parts[0]
+    if parts[1].isdigit():
+        idx = int(parts[1])
+        ## the encoding characters are skipped, see segment_revs
+        if segid == 'MSH':
+            idx -= 1
+        typ = None
+    else:
+        (idx, typ) = _field_transform(segid, parts[1], version)
+    comp = None
+    if len(parts) == 3:
+        if parts[2].isdigit():
+            comp = int(parts[2]) - 1
+        else:
+            dt = datatype_of(typ)
+            if dt is None:
+                raise KeyError, "%s has no components" % path
+            comp = composite_revs[version].transforms[dt][parts[2]][0]
+    return (segid, idx, comp)
+
+class Projection(object):
+    """Precompiled set of field paths to pull out of raw messages.
+
+    Paths are resolved against the :mod:`segmentsNN` schemas nearest
+    to *version* (plus the hand-written overrides on :cls:`hl7.cPID` and
+    friends) once, here, rather than on every message.
+    """
+    def __init__(self, paths, version='2.5'):
+        self.paths = list(paths)
+        self.version = version
+        plans = {}
+        for path in self.paths:
+            (segid, idx, comp) = compile_path(path, version)
+            plans.setdefault(segid, {}).setdefault(idx, []).append(
+                                                    (path, comp))
+        ## per segment: field indices in ascending order, so that the
+        ## separators only ever have to be counted forwards
+        self._plans = {}
+        for (segid, fields) in plans.items():
+            idxs = fields.keys()
+            idxs.sort()
+            self._plans[segid] = [(idx, fields[idx]) for idx in idxs]
+
+    def extract(self, text):
+        """Returns a dict mapping each path to the list of its values,
+        one per matching segment in *text*.  Values are the raw field
+        (or component) text, None when empty or absent.
+        """
+        res = {}
+        for path in self.paths:
+            res[path] = []
+        if len(text) < 5:
+            return res
+        fs = text[3]
+        cs = text[4]
+        rs = text[5:6] or None
+        term = segment_terminator(text)
+        plans = self._plans
+        pos = 0
+        n = len(text)
+        while pos < n:
+            end = text.find(term, pos)
+            if end < 0:
+                end = n
+            plan = plans.get(text[pos:pos+3])
+            if plan is not None:
+                _extract_segment(text, pos, end, fs, cs, rs, plan, res)
+            pos = next_segment(text, end)
+        return res
+
+def next_segment(text, end):
+    """Where the segment after the one ending at *end* starts: past the
+    terminator and whatever line end characters follow it (the other
+    half of CRLF, blank lines)."""
+    pos = end + 1
+    while text[pos:pos+1] in ('\r', '\n'):
+        pos += 1
+    return pos
+
+def _extract_segment(text, start, end, fs, cs, rs, plan, res):
+    i = 0
+    for (idx, wanted) in plan:
+        while i < idx and start >= 0:
+            start = text.find(fs, start, end)
+            if start >= 0:
+                start += 1
+                i += 1
+        if start < 0:
+            ## short segment: everything from here on is absent
+            for (path, comp) in wanted:
+                res[path].append(None)
+            continue
+        stop = text.find(fs, start, end)
+        if stop < 0:
+            stop = end
+        for (path, comp) in wanted:
+            if comp is None:
+                val = text[start:stop]
+            else:
+                val = _component(text, start, stop, cs, rs, comp)
+            res[path].append(val or None)
+
+def _component(text, start, stop, cs, rs, comp):
+    ## components of the first repetition
+    if rs is not None:
+        rstop = text.find(rs, start, stop)
+        if rstop >= 0:
+            stop = rstop
+    while comp > 0:
+        start = text.find(cs, start, stop)
+        if start < 0:
+            return None
+        start += 1
+        comp -= 1
+    cstop = text.find(cs, start, stop)
+    if cstop < 0:
+        cstop = stop
+    return text[start:cstop]
@@ -0,0 +1,176 @@
+"""Field rewriting on the raw text, without building the tree.
+
+A :cls:`Rewriter` is compiled once from edits, each a field path (as
+for :func:`hl7.compile_path`) and either a replacement or a function
+from the old value to the new one.  On a message it locates the target
+fields by counting separators, as :cls:`hl7.Projection` does, and puts
+the output together from slices of the original text and the
+replacements: everything that is not edited goes through untouched,
+separators, escapes and all.
+
+Values are raw HL7 text (see :func:`hl7.escape`): a replacement may
+hold components of its own, and an old value is None when the field or
+component is empty or absent.  A function returning None leaves the
+value alone.  Fields and components past the end of a segment are
+padded out with separators; segments that are not there stay so.
+Component paths address the first repetition of the field.
+
+>>> r = Rewriter({'PID.patient_name': 'DOE^JOHN',
+...               'PID.datetime_of_birth': lambda old: old and old[:4],
+...               'PID.patient_address.zip_or_postal_code': '000'}, '2.5')
+>>> print r.rewrite('MSH|^~\\\\&|A\\nPID|||1||ROE^RICHARD^Q|X|19620320\\nNTE|1')
+MSH|^~\\&|A
+PID|||1||DOE^JOHN|X|1962||||^^^^000
+NTE|1
+
+CRLF line ends go through as they are:
+
+>>> r.rewrite('MSH|^~\\\\&|A\\r\\nPID|||1||ROE^RICHARD|X|19620320\\r\\n')
+'MSH|^~\\\\&|A\\r\\nPID|||1||DOE^JOHN|X|1962||||^^^^000\\r\\n'
+"""
+
+from projection import compile_path, next_segment, segment_terminator
+
+__all__ = ['Rewriter']
+
+def _apply(edit, old):
+    if callable(edit):
+        return edit(old)
+    return edit
+
+class Rewriter(object):
+    """Precompiled set of field edits, *edits* being a dict or list of
+    ``(path, replacement or function)``, the paths resolved against the
+    schema nearest to *version*.  Every occurrence of a segment is
+    edited.
+    """
+    def __init__(self, edits, version='2.5'):
+        if isinstance(edits, dict):
+            edits = edits.items()
+        self.edits = list(edits)
+        self.version = version
+        plans = {}
+        for (path, edit) in self.edits:
+            (segid, idx, comp) = compile_path(path, version)
+            comps = plans.setdefault(segid, {}).setdefault(idx, {})
+            if comp in comps or (comps and (comp is None or None in comps)):
+                raise ValueError, "overlapping edits at %s" % repr(path)
+            comps[comp] = edit
+        ## per segment: (field index, [(component index, edit)]) in
+        ## ascending order, to be found by counting forwards
+        self._plans = {}
+        for (segid, fields) in plans.items():
+            plan = []
+            for idx in sorted(fields):
+                comps = fields[idx].items()
+                comps.sort()
+                plan.append((idx, comps))
+            self._plans[segid] = plan
+
+    def rewrite(self, text):
+        """*text* with the edits made."""
+        return ''.join(self.pieces(text))
+
+    def pieces(self, text):
+        """The edited *text*, as a list of slices of it and
+        replacements, for ``''.join`` or ``writelines``."""
+        out = []
+        if len(text) < 6:
+            return [text]
+        fs = text[3]
+        cs = text[4]
+        rs = text[5]
+        term = segment_terminator(text)
+        plans = self._plans
+        ## how far *text* has gone into out
+        last = 0
+        pos = 0
+        n = len(text)
+        while pos < n:
+            end = text.find(term, pos)
+            if end < 0:
+                end = n
+            plan = plans.get(text[pos:pos+3])
+            if plan is not None:
+                last = _rewrite_segment(text, pos, end, fs, cs, rs, plan,
+                                        out, last)
+            pos = next_segment(text, end)
+        if last < n:
+            out.append(text[last:])
+        return out
+
+def _rewrite_segment(text, start, end, fs, cs, rs, plan, out, last):
+    """Adds the edited segment in characters *start* to *end* of *text*
+    to *out*, which has got as far as *last* in *text*, and returns how
+    far it has got then."""
+    i = 0
+    for (idx, comps) in plan:
+        while i < idx and start >= 0:
+            start = text.find(fs, start, end)
+            if start >= 0:
+                start += 1
+                i += 1
+        if start < 0:
+            ## short segment: pad out to the field
+            value = _new_field(comps, cs)
+            if value is not None:
+                out.append(text[last:end])
+                out.append(fs * (idx - i) + value)
+                last = end
+                i = idx
+            continue
+        stop = text.find(fs, start, end)
+        if stop < 0:
+            stop = end
+        if comps[0][0] is None:
+            value = _apply(comps[0][1], text[start:stop] or None)
+            if value is not None:
+                out.append(text[last:start])
+                out.append(value)
+                last = stop
+            continue
+        ## components of the first repetition
+        rstop = text.find(rs, start, stop)
+        if rstop < 0:
+            rstop = stop
+        c = 0
+        cstart = start
+        for (comp, edit) in comps:
+            while c < comp and cstart >= 0:
+                cstart = text.find(cs, cstart, rstop)
+                if cstart >= 0:
+                    cstart += 1
+                    c += 1
+            if cstart < 0:
+                value = _apply(edit, None)
+                if value is not None:
+                    out.append(text[last:rstop])
+                    out.append(cs * (comp - c) + value)
+                    last = rstop
+                    c = comp
+                continue
+            cstop = text.find(cs, cstart, rstop)
+            if cstop < 0:
+                cstop = rstop
+            value = _apply(edit, text[cstart:cstop] or None)
+            if value is not None:
+                out.append(text[last:cstart])
+                out.append(value)
+                last = cstop
+    return last
+
+def _new_field(comps, cs):
+    """The value of a field that is not there, or None to leave it so."""
+    parts = []
+    c = 0
+    for (comp, edit) in comps:
+        value = _apply(edit, None)
+        if value is None:
+            continue
+        if comp is None:
+            return value
+        parts.append(cs * (comp - c) + value)
+        c = comp
+    if not parts:
+        return None
+    return ''.join(parts)
@@ -0,0 +1,121 @@
+"""Routing table compiled into a decision tree.
+
+A :cls:`Router` is built from rules, each a dict of conditions and a
+destination.  Conditions name a :cls:`hl7.Header` field (or
+``message_code`` / ``trigger_event``) or any other field by path, such
+as ``'PID.3'`` or ``'PID.patient_name.family_name'``, and give the value
+wanted, or a list of values any of which will do.  Composite fields are
+compared by their first component.  The rules are
+compiled into one dict per condition field, from each value to the set
+of rules (a bit mask) it satisfies, the rules that do not constrain the
+field included; routing a message costs one dict lookup per field used
+and an AND of the masks, and building the tables is linear in the
+rules.
+
+>>> r = Router([({'message_code': 'ORU', 'sending_facility': 'ELAB-3'}, 'lab'),
+...             ({'message_code': ['ADT', 'ORM']}, 'orders'),
+...             ({'message_code': 'ORU'}, 'archive')])
+>>> r.route('MSH|^~\\\\&|GHH LAB|ELAB-3|||||ORU^R01|C1|P|2.4')
+('lab', 'archive')
+>>> r.route('MSH|^~\\\\&|GHH LAB|ELAB-9|||||ADT^A01|C2|P|2.4')
+('orders',)
+"""
+
+from peek import Header, peek_header
+from projection import Projection
+
+__all__ = ['Router']
+
+## the Header fields, in the order they are tested
+_HEADER = ('message_code', 'trigger_event', 'sending_facility',
+           'sending_application', 'receiving_facility',
+           'receiving_application', 'processing_id', 'version_id')
+
+def _header_value(header, key):
+    val = getattr(header, key)
+    if isinstance(val, tuple):
+        ## composite: HD and friends are told apart by the first
+        ## component
+        return val[0]
+    return val
+
+class Router(object):
+    """Compiled routing table for *rules*, a list of ``(conditions,
+    destination)`` pairs.  :meth:`route` returns the destinations of
+    all the rules a message matches, in the order of *rules*.
+    """
+    def __init__(self, rules, version='2.5'):
+        self.rules = [(dict(conds), dest) for (conds, dest) in rules]
+        used = set()
+        for (conds, dest) in self.rules:
+            for key in conds:
+                if '.' not in key and key not in _HEADER:
+                    raise KeyError, "cannot route on %s" % repr(key)
+                used.add(key)
+        paths = [key for key in used if '.' in key]
+        paths.sort()
+        self.keys = [key for key in _HEADER if key in used] + paths
+        self._projection = None
+        if paths:
+            self._projection = Projection(paths, version)
+        ## per key: (value -> mask of the rules it satisfies, mask of
+        ## the rules that do not care)
+        self._tables = []
+        for key in self.keys:
+            wildcard = 0
+            wanted = {}
+            for (i, (conds, dest)) in enumerate(self.rules):
+                bit = 1 << i
+                if key not in conds:
+                    wildcard |= bit
+                    continue
+                values = conds[key]
+                if not isinstance(values, (list, tuple, set, frozenset)):
+                    values = (values,)
+                for v in values:
+                    wanted[v] = wanted.get(v, 0) | bit
+            for v in wanted:
+                wanted[v] |= wildcard
+            self._tables.append((key, wanted, wildcard))
+        self._all = (1 << len(self.rules)) - 1
+
+    def route(self, message):
+        """The destinations for *message*: raw text, or the
+        :cls:`hl7.Header` from :func:`hl7.peek_header` when no rule
+        needs more than the MSH.
+        """
+        header = message
+        if not isinstance(message, Header):
+            header = peek_header(message)
+        fields = None
+        if self._projection is not None:
+            if isinstance(message, Header):
+                raise TypeError, "routing on %s needs the message text" % \
+                            ", ".join(self._projection.paths)
+            fields = self._projection.extract(message)
+            enc = header.encoding_characters or '^~'
+            (cs, rs) = (enc[:1], enc[1:2] or '~')
+        mask = self._all
+        for (key, wanted, wildcard) in self._tables:
+            if fields is not None and key in fields:
+                ## the first occurrence, repetition and component
+                vals = fields[key]
+                val = vals and vals[0] or None
+                if val is not None:
+                    if rs in val:
+                        val = val[:val.index(rs)]
+                    if cs in val:
+                        val = val[:val.index(cs)]
+            else:
+                val = _header_value(header, key)
+            mask &= wanted.get(val, wildcard)
+            if not mask:
+                return ()
+        ## the rules left, lowest bit (first rule) first
+        dests = []
+        rules = self.rules
+        while mask:
+            low = mask & -mask
+            dests.append(rules[low.bit_length() - 1][1])
+            mask ^= low
+        return tuple(dests)
@@ -1,3 +1,5 @@
+import re
+
 import segments21
 import segments22
 import segments23
@@ -12,5 +14,49 @@ segment_revs = {'2.1': segments21,
                     '2.4': segments24,
                     '2.5': segments25,
                    }
-__all__ = ['segment_revs']
+__all__ = ['segment_revs', 'resolve_version']
+
+def _revision(key):
+    """'2.31' -> (2, 3, 1): the minor digits of the module names run
+    together."""
+    (major, minor) = key.split('.')
+    return tuple([int(major)] + [int(c) for c in minor])
+
+## (revision, key), oldest first
+_revisions = [(_revision(k), k) for k in segment_revs.keys()]
+_revisions.sort()
+
+_keys = dict([(k, k) for k in segment_revs.keys()])
+
+_version = re.compile(r'\s*[vV]?(\d+(?:\.\d+)*)')
+
+## resolved versions, by what was asked for
+_resolved = {}
+
+def resolve_version(version):
+    """Maps a version id, as found in MSH-12 ('2.3.1', '2.5.1', '2.6'
+    ...) or as used for the keys of :data:`segment_revs` ('2.31'), to
+    the key of the nearest schema: the newest one not newer than
+    *version*, else the oldest.  Anything unreadable (including None)
+    gets the newest schema.
 
+    >>> resolve_version('2.3.1'), resolve_version('2.6'), resolve_version('2.0')
+    ('2.31', '2.5', '2.1')
+    """
+    key = _resolved.get(version)
+    if key is not None:
+        return key
+    key = _keys.get(version)
+    if key is None:
+        m = version and _version.match(version)
+        if not m:
+            key = _revisions[-1][1]
+        else:
+            rev = tuple([int(n) for n in m.group(1).split('.')])
+            key = _revisions[0][1]
+            for (r, k) in _revisions:
+                if r <= rev:
+                    key = k
+        if len(_resolved) < 256:
+            _resolved[version] = key
+    return key
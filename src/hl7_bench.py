@@ -0,0 +1,639 @@
+#!/usr/bin/env python
+""" micro-benchmarks for the hl7 package.
+
+    usage: python hl7_bench.py [name ...]
+
+    with no names every benchmark is run.
+"""
+
+import random
+import sys
+import time
+
+import hl7
+
+ORU = '\n'.join([
+    'MSH|^~\\&|GHH LAB|ELAB-3|GHH OE|BLDG4|200202150930||ORU^R01|CNTRL-3456|P|2.4',
+    'PID|||555-44-4444||EVERYWOMAN^EVE^E^^^^L|JONES|19620320|F|||153 FERNWOOD DR.^^STATESVILLE^OH^35292||(206)3345232|(206)752-121||||AC555444444||67-A4335^OH^20030520',
+    'ORC|RE|845439^GHH OE|1045813^GHH LAB',
+    'OBR|1|845439^GHH OE|1045813^GHH LAB|1554-5^GLUCOSE|||200202150730||||||||555-55-5555^PRIMARY^PATRICIA P^^^^MD^^LEVEL SEVEN HEALTHCARE, INC.|||||||||F||||||444-44-4444^HIPPOCRATES^HOWARD H^^^^MD',
+    'OBX|1|SN|1554-5^GLUCOSE^POST 12H CFST:MCNC:PT:SER/PLAS:QN||^182|mg/dl|70_105|H|||F',
+    'OBX|2|NM|2345-7^GLUCOSE^LN||5.4|mmol/l|3.5-5.5|N|||F|||200202150730',
+    'OBX|3|NM|2951-2^SODIUM^LN||140|mmol/l|135-145|N|||F|||200202150730',
+    'OBX|4|NM|2823-3^POTASSIUM^LN||4.1|mmol/l|3.5-5.1|N|||F|||200202150730',
+    'NTE|1||specimen slightly haemolysed',
+    ])
+
+## (code, name, units, low, high) for a basic metabolic panel and friends
+PANEL = [
+    ('2345-7', 'GLUCOSE', 'mg/dl', 70, 105),
+    ('2951-2', 'SODIUM', 'mmol/l', 135, 145),
+    ('2823-3', 'POTASSIUM', 'mmol/l', 3.5, 5.1),
+    ('2075-0', 'CHLORIDE', 'mmol/l', 98, 107),
+    ('2028-9', 'CO2', 'mmol/l', 22, 29),
+    ('3094-0', 'BUN', 'mg/dl', 7, 20),
+    ('2160-0', 'CREATININE', 'mg/dl', 0.6, 1.3),
+    ('17861-6', 'CALCIUM', 'mg/dl', 8.5, 10.2),
+    ('718-7', 'HEMOGLOBIN', 'g/dl', 12, 17.5),
+    ('6690-2', 'WBC', '10*3/ul', 4.5, 11),
+    ('777-3', 'PLATELETS', '10*3/ul', 150, 450),
+    ('4548-4', 'HBA1C', '%', 4, 5.6),
+]
+FACILITIES = ['ELAB-1', 'ELAB-2', 'ELAB-3', 'BLDG4', 'NORTHCLINIC']
+
+def oru_corpus(n, seed=1):
+    """*n* synthetic but realistically shaped ORU^R01 messages."""
+    rnd = random.Random(seed)
+    res = []
+    for i in xrange(n):
+        ts = '2010%02d%02d%02d%02d' % (rnd.randint(1, 12), rnd.randint(1, 28),
+                                       rnd.randint(0, 23), rnd.randint(0, 59))
+        segs = [
+            'MSH|^~\\&|GHH LAB|%s|GHH OE|%s|%s||ORU^R01|CNTRL-%d|P|2.4' %
+                (rnd.choice(FACILITIES), rnd.choice(FACILITIES), ts, i),
+            'PID|||%d^^^MRN^MR||PATIENT%d^GIVEN%d^^^^^L||19%02d%02d%02d|%s' %
+                (100000 + rnd.randint(0, 50000), i, i % 97,
+                 rnd.randint(30, 99), rnd.randint(1, 12), rnd.randint(1, 28),
+                 rnd.choice('MF')),
+            'OBR|1|%d^GHH OE|%d^GHH LAB|80048^BMP^L|||%s' % (i, i, ts),
+            ]
+        for (j, (code, name, units, low, high)) in enumerate(
+                                            rnd.sample(PANEL, rnd.randint(6, 12))):
+            val = round(rnd.uniform(low * 0.8, high * 1.2), 1)
+            flag = val < low and 'L' or val > high and 'H' or 'N'
+            segs.append('OBX|%d|NM|%s^%s^LN||%s|%s|%s-%s|%s|||F|||%s' %
+                        (j + 1, code, name, val, units, low, high, flag, ts))
+        res.append('\n'.join(segs))
+    return res
+
+def timeit(label, fn, n):
+    start = time.time()
+    fn(n)
+    secs = time.time() - start
+    print "%-40s %8d loops %8.2f us/loop" % (label, n, secs * 1e6 / n)
+    return secs
+
+def bench_projection(n=20000):
+    paths = ['PID.patient_id_internal_id', 'OBX.result',
+             'MSH.message_control_id']
+    def full(n):
+        for i in xrange(n):
+            h = hl7.parse(ORU)
+            hl7.segment('PID', h)[3]
+            [obx[5] for obx in hl7.segments('OBX', h)]
+            hl7.segment('MSH', h)[9]
+    proj = hl7.Projection(paths, '2.4')
+    def projected(n):
+        for i in xrange(n):
+            hl7.parse(ORU, proj)
+    timeit("parse + segment lookups", full, n)
+    timeit("parse with Projection", projected, n)
+
+def bench_peek(n=200000):
+    def full(n):
+        for i in xrange(n):
+            m = hl7.cMessage(hl7.parse(ORU), '2.4')
+            m.MSH.message_type
+            m.MSH.message_control_id
+    def peek(n):
+        for i in xrange(n):
+            h = hl7.peek_header(ORU)
+            h.message_type
+            h.message_control_id
+    timeit("parse + cMessage.MSH", full, n // 20)
+    timeit("peek_header", peek, n)
+
+def bench_roundtrip(n=50000):
+    h = hl7.parse(ORU)
+    encode = hl7.Container.__str__
+    def reencode(n):
+        for i in xrange(n):
+            h.separator.join([encode(seg) for seg in h])
+    def cached(n):
+        for i in xrange(n):
+            str(h)
+    timeit("str(message), re-encoding segments", reencode, n)
+    timeit("str(message), clean segments cached", cached, n)
+
+def bench_mutate(n=20000):
+    def mutate(n):
+        for i in xrange(n):
+            m = hl7.cMessage(hl7.parse(ORU), '2.4')
+            pid = m.PID
+            pid.patient_name.family_name = 'DOE'
+            pid.datetime_of_birth = '19700101'
+            pid.set_id = 1
+            str(m._hl7)
+    timeit("parse, set 3 PID fields, str()", mutate, n)
+
+def bench_intern(n=2000):
+    corpus = oru_corpus(n)
+    plain = [hl7.parse(text) for text in corpus]
+    table = hl7.InternTable()
+    interned = [hl7.parse(text, interner=table) for text in corpus]
+    for (label, msgs) in [('plain', plain), ('InternTable', interned)]:
+        (total, distinct, nbytes) = hl7.string_footprint(msgs)
+        print "%-12s %8d strings %8d distinct %10d bytes" % \
+                    (label, total, distinct, nbytes)
+    print "%d entries in the intern table" % len(table)
+    def plain_parse(n):
+        for text in corpus[:n]:
+            hl7.parse(text)
+    def interned_parse(n):
+        for text in corpus[:n]:
+            hl7.parse(text, interner=table)
+    timeit("parse", plain_parse, n)
+    timeit("parse with InternTable", interned_parse, n)
+
+def bench_pack(n=5000):
+    import cPickle
+    h = hl7.parse(ORU)
+    pickled = cPickle.dumps(h, 2)
+    packed = hl7.dumps(h)
+    print "%-40s %8d bytes" % ("cPickle (protocol 2)", len(pickled))
+    print "%-40s %8d bytes" % ("hl7.dumps", len(packed))
+    def pickle_dumps(n):
+        for i in xrange(n):
+            cPickle.dumps(h, 2)
+    def pack_dumps(n):
+        for i in xrange(n):
+            hl7.dumps(h)
+    def pickle_loads(n):
+        for i in xrange(n):
+            cPickle.loads(pickled)
+    def pack_loads(n):
+        for i in xrange(n):
+            hl7.loads(packed)
+    def pack_loads_split(n):
+        for i in xrange(n):
+            for seg in list.__iter__(hl7.loads(packed)):
+                len(seg)
+    timeit("cPickle.dumps", pickle_dumps, n)
+    timeit("hl7.dumps", pack_dumps, n)
+    timeit("cPickle.loads", pickle_loads, n)
+    timeit("hl7.loads", pack_loads, n)
+    timeit("hl7.loads, every segment split", pack_loads_split, n)
+
+def bench_obx(n=20000):
+    m = hl7.cMessage(hl7.parse(ORU), '2.4')
+    obxs = list(m.OBX)
+    def results(n):
+        for i in xrange(n // len(obxs)):
+            for o in obxs:
+                o.__dict__.pop('_valuetype', None)
+                o.result
+    timeit("OBX.result via value type table", results, n)
+
+def bench_obx_arrays(n=2000):
+    corpus = oru_corpus(n)
+    wanted = ['2345-7', '2951-2']
+    def per_message(n):
+        values = []
+        for text in corpus[:n]:
+            m = hl7.cMessage(hl7.parse(text), '2.4')
+            for o in m.OBX:
+                if o.observation_identifier.identifier_st in wanted:
+                    try:
+                        values.append(o.result)
+                    except ValueError:
+                        pass
+    def batch(n):
+        hl7.obx_arrays(corpus[:n], wanted)
+    timeit("cMessage.OBX result loop", per_message, n)
+    timeit("obx_arrays", batch, n)
+
+def bench_sn(n=100000):
+    from hl7.hl7trans import sncolumns
+    ## a bad feed: half the values are not plain numbers
+    feed = ['5.4', '^182', '>^10', '1^:^128', '<^0.5', 'NEG', '140', '',
+            '^10^-^20', '4.1'] * (n // 10)
+    def try_except(n):
+        ## the same conversions, driven by exceptions
+        res = []
+        for text in feed:
+            try:
+                res.append(('', float(text), '', None))
+                continue
+            except ValueError:
+                pass
+            comps = text.split('^')
+            try:
+                num2 = None
+                if len(comps) > 3:
+                    num2 = float(comps[3])
+                res.append((comps[0], float(comps[1]),
+                            comps[2] if len(comps) > 2 else '', num2))
+            except (ValueError, IndexError):
+                try:
+                    res.append((comps[0][:1], float(comps[0][1:]), '', None))
+                except ValueError:
+                    res.append(None)
+    def bulk(n):
+        sncolumns(feed)
+    timeit("float() with try/except", try_except, len(feed))
+    timeit("sncolumns", bulk, len(feed))
+
+def bench_fieldtransform(n=1000000):
+    ## patients_name is the cPID shortcut onto the 2.3 PN composite
+    pid = hl7.cMessage(hl7.parse(ORU), '2.3').PID
+    ## the same without record classes, i.e. plain FieldTransforms
+    m = hl7.cMessage(hl7.parse(ORU), '2.3')
+    m._records = {}
+    plainpid = m.PID
+    def access(pid, n):
+        for i in xrange(n):
+            pid.patients_name.family_name
+    def access3(pid, n):
+        for i in xrange(n):
+            name = pid.patients_name
+            name.family_name
+            name.given_name
+            name.prefix
+    timeit("1 component, FieldTransform", lambda n: access(plainpid, n), n)
+    timeit("1 component, PN record", lambda n: access(pid, n), n)
+    timeit("3 components, FieldTransform", lambda n: access3(plainpid, n), n)
+    timeit("3 components, PN record", lambda n: access3(pid, n), n)
+
+def bench_to_dict(n=200):
+    import StringIO
+    msgs = [hl7.parse(text) for text in oru_corpus(n)]
+    def by_getattr(n):
+        for h in msgs[:n]:
+            m = hl7.cMessage(h, '2.4')
+            res = []
+            for seg in list.__iter__(h):
+                t = hl7.Transform(m, seg, seg[0][0])
+                d = {}
+                for k in t._transform.keys():
+                    try:
+                        v = getattr(t, k)
+                    except Exception:
+                        continue
+                    if v is not None:
+                        d[k] = str(v)
+                res.append(d)
+    def by_tables(n):
+        for h in msgs[:n]:
+            hl7.to_dict(h, '2.4')
+    def jsonl(n):
+        hl7.write_jsonl(msgs[:n], StringIO.StringIO(), '2.4')
+    timeit("Transform.keys() + getattr", by_getattr, n)
+    timeit("to_dict", by_tables, n)
+    timeit("write_jsonl", jsonl, n)
+
+def bench_wrappers(n=20000):
+    h = hl7.parse(ORU)
+    def fresh(n):
+        for i in xrange(n):
+            m = hl7.cMessage(h, '2.4')
+            for j in xrange(5):
+                hl7.cMSH(m, h['MSH'][0], 'MSH').message_control_id
+            for obx in hl7.cOBX(m, h['OBX'], 'OBX'):
+                obx.result
+    def cached(n):
+        for i in xrange(n):
+            m = hl7.cMessage(h, '2.4')
+            for j in xrange(5):
+                m.MSH.message_control_id
+            for obx in m.OBX:
+                obx.result
+    timeit("new wrapper per access", fresh, n)
+    timeit("cached wrappers", cached, n)
+
+def bench_ed(n=20):
+    import base64
+    import os
+    ## a 4 MB document in OBX-5
+    payload = os.urandom(3 << 20)
+    text = ORU.replace('OBX|1|', 'OBX|1|ED|DOC^Report||LAB^AP^PDF^Base64^%s\n'
+                       'OBX|9|' % base64.b64encode(payload), 1)
+    class Sink(object):
+        def write(self, data):
+            pass
+    def whole(n):
+        for i in xrange(n):
+            obx = hl7.parse(text)['OBX'][0]
+            base64.b64decode(obx[5][4])
+    def streamed(n):
+        for i in xrange(n):
+            for (ctrl, code, ed) in hl7.iter_encapsulated(text):
+                ed.decode_to(Sink())
+    timeit("parse + b64decode", whole, n)
+    timeit("iter_encapsulated + decode_to", streamed, n)
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(int(len(values) * p), len(values) - 1)]
+
+def bench_mllp(n=20000, clients=8):
+    import socket
+    import threading
+    import time
+    text = ORU.replace('\n', '\r')
+    ack = 'MSH|^~\\&|||||||ACK|1|P|2.4\rMSA|AA|1'
+    def handler(message, text):
+        return ack
+    server = hl7.MLLPServer(('127.0.0.1', 0), handler,
+                            max_connections=clients)
+    t = threading.Thread(target=server.serve_forever)
+    t.daemon = True
+    t.start()
+    latencies = []
+    def client(count):
+        sock = socket.create_connection(server.server_address)
+        scanner = hl7.FrameScanner()
+        data = hl7.frame(text)
+        res = []
+        for i in xrange(count):
+            start = time.time()
+            sock.sendall(data)
+            while not scanner.feed(sock.recv(4096)):
+                pass
+            res.append(time.time() - start)
+        sock.close()
+        latencies.extend(res)
+    threads = [threading.Thread(target=client, args=(n // clients,))
+               for i in xrange(clients)]
+    start = time.time()
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    elapsed = time.time() - start
+    server.shutdown()
+    server.server_close()
+    print "%-40s %6d msgs %9.0f msgs/s  p50 %7.1f us  p99 %7.1f us" % (
+            "MLLP loopback, %d connections" % clients, len(latencies),
+            len(latencies) / elapsed, _percentile(latencies, 0.5) * 1e6,
+            _percentile(latencies, 0.99) * 1e6)
+
+def bench_mllp_client(n=20000, threads=4):
+    import socket
+    import threading
+    import time
+    text = ORU.replace('\n', '\r')
+    msgs = [text.replace('|CNTRL-3456|', '|C%d|' % i) for i in xrange(n)]
+    def handler(header, text):
+        return 'MSH|^~\\&|||||||ACK|A|P|2.4\rMSA|AA|%s' % \
+                    header.message_control_id
+    ## a stand-in destination that only peeks at what it receives
+    server = hl7.MLLPServer(('127.0.0.1', 0), handler, parser=hl7.peek_header)
+    t = threading.Thread(target=server.serve_forever)
+    t.daemon = True
+    t.start()
+    def run(label, send):
+        def worker(part):
+            for i in xrange(0, len(part), 50):
+                send(part[i:i + 50])
+        parts = [msgs[i::threads] for i in xrange(threads)]
+        ths = [threading.Thread(target=worker, args=(part,)) for part in parts]
+        start = time.time()
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+        elapsed = time.time() - start
+        print "%-40s %6d msgs %9.0f msgs/s" % (label, len(msgs),
+                                               len(msgs) / elapsed)
+    def connection_per_message(batch):
+        for m in batch:
+            sock = socket.create_connection(server.server_address)
+            sock.sendall(hl7.frame(m))
+            scanner = hl7.FrameScanner()
+            while not scanner.feed(sock.recv(4096)):
+                pass
+            sock.close()
+    run("connection per message", connection_per_message)
+    for window in (1, 8):
+        client = hl7.MLLPClient(server.server_address, pool_size=threads,
+                                window=window)
+        run("pooled, window %d" % window, client.send_many)
+        client.close()
+    server.shutdown()
+    server.server_close()
+
+def bench_ack(n=20000):
+    text = ORU.replace('\n', '\r')
+    def by_parse(n):
+        for i in xrange(n):
+            msh = hl7.cMessage(hl7.parse(text.replace('\r', '\n')), '2.4').MSH
+            '\r'.join(['|'.join(['MSH', '^~\\&',
+                                 str(msh.receiving_application),
+                                 str(msh.receiving_facility),
+                                 str(msh.sending_application),
+                                 str(msh.sending_facility), '20020215093100',
+                                 '', 'ACK^R01^ACK', 'A1',
+                                 str(msh.processing_id),
+                                 str(msh.version_id)]),
+                       'MSA|AA|' + msh.message_control_id])
+    def by_peek(n):
+        for i in xrange(n):
+            hl7.make_ack(text, control_id='A1', timestamp='20020215093100')
+    timeit("parse + cMessage.MSH + join", by_parse, n)
+    timeit("make_ack", by_peek, n)
+
+def bench_journal(n=4000):
+    import shutil
+    import tempfile
+    import threading
+    import time
+    text = ORU.replace('\n', '\r')
+    def run(label, threads, sync):
+        path = tempfile.mkdtemp()
+        journal = hl7.Journal(path, sync=sync)
+        def worker(count):
+            for i in xrange(count):
+                journal.append(text)
+        ths = [threading.Thread(target=worker, args=(n // threads,))
+               for i in xrange(threads)]
+        start = time.time()
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+        journal.sync()
+        elapsed = time.time() - start
+        journal.close()
+        start = time.time()
+        count = 0
+        for (seq, msg) in hl7.Journal(path).replay():
+            count += 1
+        replay = time.time() - start
+        shutil.rmtree(path)
+        print "%-40s %6d msgs %9.0f msgs/s  replay %9.0f msgs/s" % (
+                label, n, n / elapsed, count / replay)
+    run("append, no fsync", 1, False)
+    run("append + fsync, 1 thread", 1, True)
+    run("append + fsync, 16 threads", 16, True)
+
+def bench_routing(n=2000):
+    texts = oru_corpus(200)
+    codes = ['ADT', 'ORM', 'ORU', 'SIU', 'MDM', 'DFT']
+    for count in (10, 100, 1000):
+        rnd = random.Random(count)
+        rules = [({'message_code': rnd.choice(codes),
+                   'sending_facility': rnd.choice(FACILITIES + ['X%d' % i])},
+                  'dest%d' % i) for i in xrange(count)]
+        router = hl7.Router(rules)
+        def predicates(n):
+            for i in xrange(n):
+                msh = hl7.cMessage(hl7.parse(texts[i % 200]), '2.4').MSH
+                [dest for (conds, dest) in rules
+                 if msh.message_type.message_type == conds['message_code']
+                 and str(msh.sending_facility) ==
+                        conds['sending_facility']]
+        def compiled(n):
+            route = router.route
+            for i in xrange(n):
+                route(texts[i % 200])
+        timeit("cMessage + %d predicates" % count, predicates, n // 10)
+        timeit("Router, %d rules" % count, compiled, n)
+    ## rules on different fields: every one is a wildcard for the
+    ## fields of the others
+    choices = [('message_code', codes), ('sending_facility', FACILITIES),
+               ('trigger_event', ['R01', 'A01', 'A08', 'O01']),
+               ('processing_id', ['P', 'T', 'D'])]
+    for count in (160, 1000):
+        rnd = random.Random(count)
+        rules = []
+        for i in xrange(count):
+            (key, values) = rnd.choice(choices)
+            rules.append(({key: rnd.choice(values)}, 'dest%d' % i))
+        t = time.time()
+        router = hl7.Router(rules)
+        print "%-40s %8.2f ms" % ("build Router, %d mixed rules" % count,
+                                  (time.time() - t) * 1e3)
+        def mixed(n):
+            route = router.route
+            for i in xrange(n):
+                route(texts[i % 200])
+        timeit("Router, %d mixed rules" % count, mixed, n)
+
+def bench_filter(n=5000):
+    texts = [t.replace('\n', '\r') for t in oru_corpus(200)]
+    wanted = set(['2345-7', '2951-2'])
+    def materialized(n):
+        for i in xrange(n):
+            m = hl7.cMessage(hl7.parse(texts[i % 200].replace('\r', '\n')),
+                             '2.4')
+            str(m.MSH.message_type) == 'ORU^R01' and \
+                any(obx.observation_identifier.identifier_st in wanted
+                    for obx in m.OBX)
+    f = hl7.Filter('MSH.message_type = "ORU^R01" and '
+                   'any(OBX.observation_identifier.identifier_st in '
+                   '{"2345-7", "2951-2"})', '2.4')
+    g = hl7.Filter('MSH.message_type = "ADT^A01" and '
+                   'any(OBX.observation_identifier.identifier_st in '
+                   '{"2345-7", "2951-2"})', '2.4')
+    def filtered(f):
+        def run(n):
+            for i in xrange(n):
+                f(texts[i % 200])
+        return run
+    timeit("parse + cMessage + any()", materialized, n // 20)
+    timeit("Filter, matching MSH", filtered(f), n)
+    timeit("Filter, rejected on MSH", filtered(g), n)
+
+def bench_rewrite(n=20000):
+    texts = oru_corpus(200)
+    def tree(n):
+        for i in xrange(n):
+            m = hl7.cMessage(hl7.parse(texts[i % 200]), '2.4')
+            pid = m.PID
+            pid.patient_name = 'DOE'
+            pid.datetime_of_birth = '19700101'
+            pid.patient_address = ''
+            str(m._hl7)
+    r = hl7.Rewriter({'PID.patient_name': 'DOE',
+                      'PID.datetime_of_birth': '19700101',
+                      'PID.patient_address': ''}, '2.4')
+    def spliced(n):
+        for i in xrange(n):
+            r.rewrite(texts[i % 200])
+    timeit("parse, set PID-5/7/11, str()", tree, n // 10)
+    timeit("Rewriter", spliced, n)
+
+def bench_pipeline(n=50000):
+    import time
+    text = ORU.replace('\n', '\r')
+    def control_id(header):
+        return header.message_control_id
+    for batch in (1, 32):
+        pipeline = hl7.Pipeline([
+            hl7.Stage('peek', hl7.peek_header, workers=2, batch=batch),
+            hl7.Stage('transform', control_id, batch=batch),
+            hl7.Stage('emit', len, batch=batch)])
+        pipeline.start()
+        start = time.time()
+        for i in xrange(n):
+            pipeline.put(text)
+        pipeline.close()
+        elapsed = time.time() - start
+        print "batch %-34d %6d msgs %9.0f msgs/s" % (batch, n, n / elapsed)
+        for stage in pipeline.stages:
+            m = stage.metrics()
+            lat = m['latency']
+            print "  %-12s %6d done  p50 %8.0f us  p99 %8.0f us" % (
+                    stage.name, m['processed'], lat.percentile(0.5) * 1e6,
+                    lat.percentile(0.99) * 1e6)
+
+def bench_partition(n=2000):
+    import time
+    texts = [t.replace('\n', '\r') for t in oru_corpus(200)]
+    def by_parse(n):
+        for i in xrange(n):
+            m = hl7.cMessage(hl7.parse(texts[i % 200].replace('\r', '\n')),
+                             '2.4')
+            str(m.PID.patient_identifier_list)
+    def by_peek(n):
+        key = hl7.partition_key
+        for i in xrange(n):
+            key(texts[i % 200])
+    timeit("parse + cMessage.PID", by_parse, n // 10)
+    timeit("partition_key", by_peek, n * 10)
+    def apply(text):
+        ## stands for a database round trip
+        time.sleep(0.0005)
+    for lanes in (1, 4, 16):
+        d = hl7.Dispatcher(apply, lanes=lanes)
+        d.start()
+        start = time.time()
+        for i in xrange(n):
+            d.put(texts[i % 200])
+        d.close()
+        elapsed = time.time() - start
+        print "%-40s %6d msgs %9.0f msgs/s" % ("Dispatcher, %d lanes" % lanes,
+                                               n, n / elapsed)
+
+benchmarks = [
+    ('projection', bench_projection),
+    ('peek', bench_peek),
+    ('roundtrip', bench_roundtrip),
+    ('mutate', bench_mutate),
+    ('intern', bench_intern),
+    ('pack', bench_pack),
+    ('obx', bench_obx),
+    ('obx_arrays', bench_obx_arrays),
+    ('sn', bench_sn),
+    ('fieldtransform', bench_fieldtransform),
+    ('to_dict', bench_to_dict),
+    ('wrappers', bench_wrappers),
+    ('ed', bench_ed),
+    ('mllp', bench_mllp),
+    ('mllp_client', bench_mllp_client),
+    ('ack', bench_ack),
+    ('journal', bench_journal),
+    ('routing', bench_routing),
+    ('filter', bench_filter),
+    ('rewrite', bench_rewrite),
+    ('pipeline', bench_pipeline),
+    ('partition', bench_partition),
+]
+
+if __name__ == '__main__':
+    names = sys.argv[1:]
+    for (name, fn) in benchmarks:
+        if names and name not in names:
+            continue
+        print "---", name
+        fn()
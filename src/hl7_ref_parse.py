@@ -57,6 +57,45 @@ def parse_segment(fname):
     sax.parse(fname, cg)
     return cg
 
+def field_name(field):
+    """ python identifier for a field, from its description
+    """
+    fieldname = ''
+    prev_space = False
+    for c in field['description'].lower().strip():
+        if c.isalnum():
+            fieldname += c
+            prev_space = False
+        elif c == '#':
+            fieldname += 'num'
+            prev_space = False
+        elif c == '-' and not prev_space:
+            fieldname += '_'
+            prev_space = True
+        elif c == ' ' and not prev_space:
+            fieldname += "_"
+            prev_space = True
+    return fieldname
+
+## datatypes left as text and read as numbers, in segments and in
+## composites (whose references also use the java type names)
+SEGMENT_TEXT = ['ID', 'TN', 'TX', 'ST', 'FT', 'IS', 'SI']
+SEGMENT_NUMERIC = ['NM']
+COMPOSITE_TEXT = SEGMENT_TEXT + ['String', 'Date', 'Time']
+COMPOSITE_NUMERIC = SEGMENT_NUMERIC + ['Double']
+
+def converter(datatype, fieldtransforms, text, numeric):
+    """ python expression for the transform of a field of *datatype*
+    """
+    if datatype in ['DT', 'TM', 'TS']:
+        return 'datetransform'
+    elif datatype in text:
+        return 'None'
+    elif datatype in numeric:
+        return 'numtransform'
+    fieldtransforms.add(datatype)
+    return 'compositetrans.fieldtransform%s' % datatype
+
 def write_composites(ref, segments, fieldtransforms):
     f = open("hl7/composites%s.py" % ref, "w")
     f.write("from hl7trans import *\n")
@@ -66,33 +105,9 @@ def write_composites(ref, segments, fieldtransforms):
         txt = "    '%s': {\\\n" % seg.name.upper()
         for field in seg.fields:
             idx = int(field['name'].split(".")[1]) - 1
-            fieldname = ''
-            prev_space = False
-            for c in field['description'].lower().strip():
-                if c.isalnum():
-                    fieldname += c
-                    prev_space = False
-                elif c == '#':
-                    fieldname += 'num'
-                    prev_space = False
-                elif c == '-' and not prev_space:
-                    fieldname += '_'
-                    prev_space = True
-                elif c == ' ' and not prev_space:
-                    fieldname += "_"
-                    prev_space = True
-
-            datatype = str(field['datatype'])
-            if datatype in ['DT', 'TM', 'TS']:
-                datatype = 'datetransform'
-            elif datatype in ['ID', 'TN', 'TX', 'ST', 'FT', 'IS', 'SI',
-                                'String', 'Date', 'Time']:
-                datatype = 'None'
-            elif datatype in ['NM', 'Double']:
-                datatype = 'numtransform'
-            else:
-                fieldtransforms.add(datatype)
-                datatype = 'compositetrans.fieldtransform%s' % datatype
+            fieldname = field_name(field)
+            datatype = converter(str(field['datatype']), fieldtransforms,
+                                 COMPOSITE_TEXT, COMPOSITE_NUMERIC)
 
             txt += "        '%s': (%d, %s),\n" % (fieldname, idx, datatype)
         txt += "},\n"
@@ -112,38 +127,71 @@ def write_segments(ref, segments, fieldtransforms):
             idx = int(field['name'].split(".")[1])
             if seg.name == 'MSH': # due to implementation enc chars are skipped
                 idx -= 1
-            fieldname = ''
-            prev_space = False
-            for c in field['description'].lower().strip():
-                if c.isalnum():
-                    fieldname += c
-                    prev_space = False
-                elif c == '#':
-                    fieldname += 'num'
-                    prev_space = False
-                elif c == '-' and not prev_space:
-                    fieldname += '_'
-                    prev_space = True
-                elif c == ' ' and not prev_space:
-                    fieldname += "_"
-                    prev_space = True
-
-            datatype = field['datatype']
-            if datatype in ['DT', 'TM', 'TS']:
-                datatype = 'datetransform'
-            elif datatype in ['ID', 'TN', 'TX', 'ST', 'FT', 'IS', 'SI']:
-                datatype = 'None'
-            elif datatype == 'NM':
-                datatype = 'numtransform'
-            else:
-                fieldtransforms.add(datatype)
-                datatype = 'compositetrans.fieldtransform%s' % datatype
+            fieldname = field_name(field)
+
+            datatype = converter(field['datatype'], fieldtransforms,
+                                 SEGMENT_TEXT, SEGMENT_NUMERIC)
             txt += "        '%s': (%d, %s),\n" % (fieldname, idx, datatype)
         txt += "},\n"
         f.write(txt)
     f.write("}\n")
     f.close()
 
+def positional(seg, offset, fieldtransforms, text, numeric):
+    """ python expressions for the fields of *seg*, indexed by position
+        (the field number less *offset*), 'None' for the gaps
+    """
+    entries = {}
+    for field in seg.fields:
+        idx = int(field['name'].split(".")[1]) - offset
+        attrs = field['attrs']
+        if attrs.get('minOccurs', '0') == '0':
+            optionality = 'O'
+        else:
+            optionality = 'R'
+        repeats = attrs.get('maxOccurs', '0')
+        if repeats == 'unbounded':
+            repeats = -1
+        datatype = str(field['datatype'])
+        entries[idx] = "('%s', %s, '%s', '%s', %d)" % (
+            field_name(field),
+            converter(datatype, fieldtransforms, text, numeric),
+            datatype, optionality, int(repeats))
+    size = 0
+    if entries:
+        size = max(entries) + 1
+    return [entries.get(idx, 'None') for idx in range(size)]
+
+def write_fields(ref, segments, composites, fieldtransforms):
+    """ dense per-segment (and per-composite) tuples indexed by field
+        (component) position, with the same indices as the transforms:
+        (name, transform, datatype, 'R'equired or 'O'ptional, maxOccurs)
+        where maxOccurs is -1 for unbounded and 0 when the reference
+        does not say
+    """
+    f = open("hl7/fields%s.py" % ref, "w")
+    f.write("from hl7trans import *\n")
+    f.write("import compositetrans\n")
+    for (table, segs, text, numeric) in [
+            ('segments', segments, SEGMENT_TEXT, SEGMENT_NUMERIC),
+            ('composites', composites, COMPOSITE_TEXT, COMPOSITE_NUMERIC)]:
+        f.write("%s = {\\\n" % table)
+        for seg in sorted(segs, key=lambda seg: seg.name.upper()):
+            if table == 'composites':
+                offset = 1
+            elif seg.name == 'MSH': # as in write_segments
+                offset = 1
+            else:
+                offset = 0
+            txt = "    '%s': (\\\n" % seg.name.upper()
+            for entry in positional(seg, offset, fieldtransforms, text,
+                                    numeric):
+                txt += "        %s,\n" % entry
+            txt += "),\n"
+            f.write(txt)
+        f.write("}\n")
+    f.close()
+
 def parse_reference(ref, fieldtransforms):
     segments = []
     composites = []
@@ -158,6 +206,7 @@ def parse_reference(ref, fieldtransforms):
 
     write_segments(ref, segments, fieldtransforms)
     write_composites(ref, composites, fieldtransforms)
+    write_fields(ref, segments, composites, fieldtransforms)
 
 if __name__ == '__main__':
     fieldtransforms = set()